@@ -0,0 +1,158 @@
+"""Write throughput of the SQLite client with several concurrent writers.
+
+Each writer thread queues ``--writes`` inbox messages through
+:class:`InboxService` (one transaction each), while ``--readers`` threads list
+the receiver's inbox in a loop, like the API and dashboard polling. Two
+engines are compared, each on a fresh database file:
+
+* ``default``: a plain ``sqlite:///`` engine, as the client used to build
+  (rollback journal, no busy timeout, default pool).
+* ``tuned``: :func:`agent_conductor.clients.database._build_engine` (WAL,
+  ``synchronous=NORMAL``, busy timeout, mmap and cache size, a shared
+  ``QueuePool``).
+
+Writes that fail (``database is locked``) are counted, not retried.
+
+Usage::
+
+    python benchmarks/database.py [--writers 1,4,8] [--writes 200] [--readers 1] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from agent_conductor import constants
+from agent_conductor.clients import database
+from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.services.inbox_service import InboxService
+
+RECEIVER_ID = "bench001"
+
+
+def default_engine():
+    return create_engine(f"sqlite:///{constants.DB_FILE}", future=True)
+
+
+ENGINES = {"default": default_engine, "tuned": database._build_engine}
+
+
+@contextmanager
+def fresh_database(variant: str) -> Iterator[None]:
+    saved = (constants.DB_DIR, constants.DB_FILE, database.ENGINE, database.SESSION_FACTORY)
+    with tempfile.TemporaryDirectory(prefix="acd-db-bench-") as directory:
+        constants.DB_DIR = Path(directory)
+        constants.DB_FILE = Path(directory) / "conductor.db"
+        engine = ENGINES[variant]()
+        database.ENGINE = engine
+        database.SESSION_FACTORY = sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False, future=True
+        )
+        database.BaseModel.metadata.create_all(bind=engine)
+        with database.session_scope() as db:
+            db.add(
+                database.Terminal(
+                    id=RECEIVER_ID,
+                    session_name="bench",
+                    window_name="worker",
+                    provider="claude_code",
+                    status=TerminalStatus.READY,
+                )
+            )
+        try:
+            yield
+        finally:
+            engine.dispose()
+            constants.DB_DIR, constants.DB_FILE, database.ENGINE, database.SESSION_FACTORY = saved
+
+
+def run_case(variant: str, writers: int, writes: int, readers: int) -> Dict[str, object]:
+    inbox = InboxService(terminal_service=None)
+    failures = [0]
+    reads = [0]
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def write(writer: int) -> None:
+        for index in range(writes):
+            try:
+                inbox.queue_message(f"writer-{writer}", RECEIVER_ID, f"message {index}")
+            except Exception:
+                with lock:
+                    failures[0] += 1
+
+    def read() -> None:
+        while not done.is_set():
+            try:
+                inbox.list_messages(RECEIVER_ID)
+            except Exception:
+                continue
+            with lock:
+                reads[0] += 1
+
+    with fresh_database(variant):
+        reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+        writer_threads = [threading.Thread(target=write, args=(n,)) for n in range(writers)]
+        for thread in reader_threads:
+            thread.start()
+        started = time.perf_counter()
+        for thread in writer_threads:
+            thread.start()
+        for thread in writer_threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        done.set()
+        for thread in reader_threads:
+            thread.join()
+
+    committed = writers * writes - failures[0]
+    return {
+        "engine": variant,
+        "writers": writers,
+        "readers": readers,
+        "writes": writers * writes,
+        "failed": failures[0],
+        "reads": reads[0],
+        "seconds": round(elapsed, 3),
+        "writes_per_second": round(committed / elapsed, 1),
+    }
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", default="1,4,8", help="Comma-separated writer counts.")
+    parser.add_argument("--writes", type=int, default=200, help="Messages per writer.")
+    parser.add_argument("--readers", type=int, default=1, help="Concurrent reader threads.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_case(variant, int(writers), args.writes, args.readers)
+        for writers in args.writers.split(",")
+        for variant in ENGINES
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'engine':<8} {'writers':>7} {'writes/s':>9} {'failed':>7} {'reads':>7}")
+    for row in results:
+        print(
+            f"{row['engine']:<8} {row['writers']:>7} {row['writes_per_second']:>9.1f} "
+            f"{row['failed']:>7} {row['reads']:>7}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,193 @@
+"""Speed and expected results of the provider screen detectors on recorded captures.
+
+Each case in ``captures/expected.json`` names a capture, the provider that
+drew it and, optionally, ``history``: the capture is then padded with
+``scrollback.txt`` to that many lines, like a pane with very long scrollback.
+For every case this replays the capture through a fake tmux and checks:
+
+* ``status``: ``get_status()``, as the first poll of a pane sees it;
+* ``last_message``: ``extract_last_message_from_history`` over the whole
+  capture (``null`` when it finds no answer);
+* ``choice_prompt``: ``_extract_choice_prompt`` over the visible screen
+  (Claude Code only).
+
+The check also runs in the test suite, so detector optimizations must keep
+these results. After an intended behaviour change, ``--update`` rewrites the
+expected values from the current code; review the diff.
+
+Usage::
+
+    python benchmarks/detectors.py [--number 2000] [--json] [--update]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Type
+
+from agent_conductor.clients.tmux import PaneCursor, PaneDelta
+from agent_conductor.providers.base import BaseProvider
+from agent_conductor.providers.claude_code import ClaudeCodeProvider
+from agent_conductor.providers.codex import CodexProvider
+
+CAPTURES = Path(__file__).parent / "captures"
+EXPECTED = CAPTURES / "expected.json"
+# Rows of the replayed pane; earlier lines are scrollback.
+SCREEN_ROWS = 50
+
+PROVIDERS: Dict[str, Type[BaseProvider]] = {
+    "claude_code": ClaudeCodeProvider,
+    "codex": CodexProvider,
+}
+
+
+@dataclass
+class Case:
+    name: str
+    provider: str
+    text: str
+    expected: Dict[str, Optional[str]]
+
+    @property
+    def screen(self) -> str:
+        return "\n".join(self.text.splitlines()[-SCREEN_ROWS:])
+
+
+class ReplayTmux:
+    """Serves one recorded capture the way ``TmuxClient`` serves a live pane."""
+
+    def __init__(self, text: str) -> None:
+        lines = text.splitlines()
+        self.history = lines[:-SCREEN_ROWS]
+        self.screen = "\n".join(lines[-SCREEN_ROWS:])
+        self.text = text
+
+    def capture_pane(self, session_name, window_name, start=None, end=None, pane_id=None) -> str:
+        return self.screen if start == 0 else self.text
+
+    def capture_pane_delta(
+        self, session_name, window_name, cursor: PaneCursor, *, pane_id=None, max_lines=1000
+    ) -> PaneDelta:
+        # Always a first read: recent history plus screen, latches rebuilt from scratch.
+        return PaneDelta(self.history[-max_lines:], self.screen, reset=True)
+
+
+def pad(text: str, history: int) -> str:
+    scrollback = (CAPTURES / "scrollback.txt").read_text().splitlines()
+    lines = text.splitlines()
+    missing = max(history - len(lines), 0)
+    return "\n".join((scrollback * (missing // len(scrollback) + 1))[:missing] + lines)
+
+
+def load_cases(path: Path = EXPECTED) -> List[Case]:
+    cases = []
+    for name, spec in json.loads(path.read_text()).items():
+        text = (CAPTURES / spec["capture"]).read_text()
+        if spec.get("history"):
+            text = pad(text, spec["history"])
+        expected = {key: spec.get(key) for key in ("status", "last_message", "choice_prompt")}
+        cases.append(Case(name, spec["provider"], text, expected))
+    return cases
+
+
+def make_provider(case: Case) -> BaseProvider:
+    provider_cls = PROVIDERS[case.provider]
+    return provider_cls("bench001", "replay", "worker", None, ReplayTmux(case.text), "%1")
+
+
+def detectors(case: Case) -> Dict[str, Callable[[], object]]:
+    """The timed calls for ``case``, keyed like its expected results."""
+    provider = make_provider(case)
+
+    def last_message() -> Optional[str]:
+        try:
+            return provider.extract_last_message_from_history(case.text)
+        except ValueError:
+            return None
+
+    calls: Dict[str, Callable[[], object]] = {
+        "status": lambda: provider.get_status().value,
+        "last_message": last_message,
+    }
+    if isinstance(provider, ClaudeCodeProvider):
+        screen = case.screen
+        calls["choice_prompt"] = lambda: provider._extract_choice_prompt(screen)
+    return calls
+
+
+def observe(case: Case) -> Dict[str, Optional[str]]:
+    observed = {key: call() for key, call in detectors(case).items()}
+    observed.setdefault("choice_prompt", None)
+    return observed
+
+
+def check(cases: List[Case]) -> List[str]:
+    """Return one line per detector result that differs from the expected one."""
+    mismatches = []
+    for case in cases:
+        for key, value in observe(case).items():
+            if value != case.expected[key]:
+                mismatches.append(
+                    f"{case.name}: {key} is {value!r}, expected {case.expected[key]!r}"
+                )
+    return mismatches
+
+
+def update(cases: List[Case], path: Path = EXPECTED) -> None:
+    spec = json.loads(path.read_text())
+    for case in cases:
+        spec[case.name].update(observe(case))
+    path.write_text(json.dumps(spec, indent=2, ensure_ascii=False) + "\n")
+
+
+def per_call_us(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def run(cases: List[Case], number: int) -> List[Dict[str, object]]:
+    return [
+        {
+            "case": case.name,
+            "lines": case.text.count("\n") + 1,
+            "detector": key,
+            "us_per_call": round(per_call_us(call, number), 2),
+        }
+        for case in cases
+        for key, call in detectors(case).items()
+    ]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="Calls per timing run.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    parser.add_argument("--update", action="store_true", help="Rewrite the expected results.")
+    args = parser.parse_args(argv)
+
+    cases = load_cases()
+    if args.update:
+        update(cases)
+        cases = load_cases()
+    mismatches = check(cases)
+    results = run(cases, args.number)
+    if args.json:
+        print(json.dumps({"mismatches": mismatches, "results": results}, indent=2))
+    else:
+        print(f"{'case':<34} {'lines':>6} {'detector':<14} {'us/call':>9}")
+        for row in results:
+            print(
+                f"{row['case']:<34} {row['lines']:>6} {row['detector']:<14} "
+                f"{row['us_per_call']:>9.2f}"
+            )
+        for mismatch in mismatches:
+            print(f"MISMATCH {mismatch}", file=sys.stderr)
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
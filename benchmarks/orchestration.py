@@ -0,0 +1,269 @@
+"""Cost of the orchestration hot paths as the number of terminals grows.
+
+For every ``--sizes`` entry a fresh runtime (temporary home and database) is
+filled with that many terminals, grouped into sessions of one supervisor and
+``--session-size - 1`` workers, and these operations are timed:
+
+* ``create_terminal``: creating all of them (per call).
+* ``send_input``: ``--calls`` messages to terminals spread over the fleet.
+* ``list_sessions``, ``prompt_watcher.scan``: one call over the whole fleet.
+* ``deliver_all_pending``: one call with a pending message for every terminal.
+* ``GET /sessions``, ``GET /sessions/{name}``, ``GET /approvals``: through the
+  FastAPI app in-process.
+
+The terminals run the real :class:`ProviderManager` with a minimal provider
+whose pane only runs ``cat``, so no agent CLI is needed. ``--tmux fake`` uses
+the ``FakeTmuxClient`` of the test suite; ``--tmux real`` starts a private
+tmux server. Results are the best of ``--rounds`` runs, in milliseconds.
+
+Usage::
+
+    python benchmarks/orchestration.py [--sizes 10,100,1000] [--tmux fake,real]
+        [--json] [--output results.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from agent_conductor import constants  # noqa: E402
+from agent_conductor.api import main as api_main  # noqa: E402
+from agent_conductor.clients import database  # noqa: E402
+from agent_conductor.clients.tmux import TmuxClient  # noqa: E402
+from agent_conductor.providers.base import BaseProvider  # noqa: E402
+from agent_conductor.providers.manager import ProviderManager  # noqa: E402
+from agent_conductor.services.approval_service import ApprovalService  # noqa: E402
+from agent_conductor.services.inbox_service import InboxService  # noqa: E402
+from agent_conductor.services.prompt_service import PromptWatcher  # noqa: E402
+from agent_conductor.services.session_service import SessionService  # noqa: E402
+from agent_conductor.services.terminal_service import TerminalService  # noqa: E402
+from tests.conftest import FakeTmuxClient  # noqa: E402
+
+PROVIDER_KEY = "bench"
+RUNTIME_DIRS = {
+    "HOME_DIR": "",
+    "LOG_DIR": "logs",
+    "TERMINAL_LOG_DIR": "logs/terminal",
+    "DB_DIR": "db",
+    "DB_FILE": "db/conductor.db",
+    "AGENT_STORE_DIR": "agent-store",
+    "AGENT_CONTEXT_DIR": "agent-context",
+    "FLOWS_DIR": "flows",
+    "APPROVALS_DIR": "approvals",
+}
+
+
+class BenchProvider(BaseProvider):
+    """Swallows input with ``cat`` and is always READY: only orchestration is timed."""
+
+    def build_startup_command(self) -> Optional[str]:
+        return "cat > /dev/null"
+
+
+@contextmanager
+def isolated_runtime() -> Iterator[Path]:
+    """Point the runtime directories and database at a temporary home."""
+    saved = {name: getattr(constants, name) for name in RUNTIME_DIRS}
+    with tempfile.TemporaryDirectory(prefix="acd-bench-") as home:
+        for name, relative in RUNTIME_DIRS.items():
+            setattr(constants, name, Path(home) / relative)
+        database.init_db()
+        try:
+            yield Path(home)
+        finally:
+            database.ENGINE.dispose()
+            database.dispose_async_engine(database.ASYNC_ENGINE)
+            for name, value in saved.items():
+                setattr(constants, name, value)
+
+
+@contextmanager
+def tmux_backend(kind: str) -> Iterator[object]:
+    if kind == "fake":
+        yield FakeTmuxClient()
+        return
+    socket_name = f"acd-bench-{uuid.uuid4().hex[:8]}"
+    # A plain /bin/sh keeps pane start-up out of the measurement.
+    subprocess.run(
+        ["tmux", "-L", socket_name, "-f", "/dev/null", "new-session", "-d", "-s", "_boot",
+         ";", "set-option", "-g", "default-shell", "/bin/sh"],
+        check=True,
+    )
+    client = TmuxClient(socket_name=socket_name)
+    try:
+        yield client
+    finally:
+        client.close()
+        subprocess.run(["tmux", "-L", socket_name, "kill-server"], capture_output=True)
+
+
+@contextmanager
+def api_client(terminals, sessions, inbox, approvals) -> Iterator[TestClient]:
+    app = api_main.app
+    services = {
+        "terminal_service": terminals,
+        "session_service": sessions,
+        "inbox_service": inbox,
+        "approval_service": approvals,
+    }
+    for name, service in services.items():
+        setattr(app.state, name, service)
+    original_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def no_startup(_app):
+        yield
+
+    app.router.lifespan_context = no_startup
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.router.lifespan_context = original_lifespan
+        for name in services:
+            delattr(app.state, name)
+
+
+def package_version() -> Optional[str]:
+    try:
+        return metadata.version("agent-conductor")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def best_ms(
+    func: Callable[[], object], rounds: int, setup: Optional[Callable[[], object]] = None
+) -> float:
+    timings = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1e3
+
+
+def run_size(kind: str, size: int, session_size: int, calls: int, rounds: int) -> List[Dict]:
+    results = []
+
+    def record(operation: str, ms: float, per: int = 1) -> None:
+        results.append(
+            {
+                "tmux": kind,
+                "terminals": size,
+                "operation": operation,
+                "calls": per,
+                "ms_per_call": round(ms / per, 3),
+            }
+        )
+
+    with isolated_runtime(), tmux_backend(kind) as tmux:
+        providers = ProviderManager(tmux)
+        terminals = TerminalService(tmux=tmux, providers=providers)
+        sessions = SessionService(terminals)
+        inbox = InboxService(terminals)
+        approvals = ApprovalService(terminals, inbox)
+        watcher = PromptWatcher(sessions, terminals, inbox)
+
+        created = []
+        started = time.perf_counter()
+        for index in range(size):
+            if index % session_size == 0:
+                supervisor = terminals.create_terminal(PROVIDER_KEY, "supervisor", None)
+                created.append(supervisor)
+                continue
+            created.append(
+                terminals.create_terminal(
+                    PROVIDER_KEY, "worker", None, session_name=supervisor.session_name
+                )
+            )
+        record("create_terminal", (time.perf_counter() - started) * 1e3, size)
+
+        targets = [created[index * size // calls].id for index in range(min(calls, size))]
+        started = time.perf_counter()
+        for terminal_id in targets:
+            terminals.send_input(terminal_id, "benchmark message")
+        record("send_input", (time.perf_counter() - started) * 1e3, len(targets))
+
+        def queue_one_each() -> None:
+            for terminal in created:
+                inbox.queue_message(created[0].id, terminal.id, "benchmark inbox message")
+
+        record("list_sessions", best_ms(sessions.list_sessions, rounds))
+        record("deliver_all_pending", best_ms(inbox.deliver_all_pending, rounds, queue_one_each))
+        record("prompt_watcher.scan", best_ms(watcher.scan, rounds))
+
+        with api_client(terminals, sessions, inbox, approvals) as client:
+            session_name = created[-1].session_name
+
+            def fetch(path: str) -> None:
+                client.get(path).raise_for_status()
+
+            for path in ("/sessions", f"/sessions/{session_name}", "/approvals"):
+                template = path.replace(session_name, "{name}")
+                record(f"GET {template}", best_ms(lambda: fetch(path), rounds))
+    return results
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000", help="Comma-separated terminal counts.")
+    parser.add_argument("--tmux", default="fake", help="Comma-separated backends: fake, real.")
+    parser.add_argument("--session-size", type=int, default=10, help="Terminals per session.")
+    parser.add_argument("--calls", type=int, default=100, help="send_input calls per size.")
+    parser.add_argument("--rounds", type=int, default=3, help="Runs per timed operation.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file.")
+    args = parser.parse_args(argv)
+
+    kinds = [kind.strip() for kind in args.tmux.split(",") if kind.strip()]
+    if "real" in kinds and shutil.which("tmux") is None:
+        parser.error("--tmux real needs the tmux binary on PATH")
+    ProviderManager._registry[PROVIDER_KEY] = BenchProvider
+
+    results = []
+    for kind in kinds:
+        for size in (int(value) for value in args.sizes.split(",")):
+            results.extend(run_size(kind, size, args.session_size, args.calls, args.rounds))
+    report = {
+        "benchmark": "orchestration",
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(f"{'tmux':<5} {'terminals':>9} {'operation':<22} {'calls':>6} {'ms/call':>10}")
+    for row in results:
+        print(
+            f"{row['tmux']:<5} {row['terminals']:>9} {row['operation']:<22} "
+            f"{row['calls']:>6} {row['ms_per_call']:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
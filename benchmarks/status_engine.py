@@ -0,0 +1,157 @@
+"""Per-call cost of provider status detection, before and after the shared engine.
+
+Each capture in ``benchmarks/captures`` is the visible screen of a provider
+CLI; it is padded with scrollback to ``--history`` lines to match the
+1000-line ``capture-pane`` the providers used to scan on every poll.
+
+* ``legacy``: the previous ``get_status`` bodies, which ran uncompiled
+  ``re.search`` calls (Claude Code) or split every line (Codex) over the
+  whole capture.
+* ``engine/full``: :class:`StatusEngine` fed the same padded capture.
+* ``engine/screen``: :class:`StatusEngine` fed what providers now read, the
+  visible screen of a :class:`PaneDelta`.
+
+Usage::
+
+    python benchmarks/status_engine.py [--history 1000] [--number 2000] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from agent_conductor.clients.tmux import PaneDelta
+from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.providers import claude_code, codex
+
+CAPTURES = Path(__file__).parent / "captures"
+
+
+def legacy_claude_status(output: str) -> TerminalStatus:
+    if not output:
+        return TerminalStatus.RUNNING
+    if re.search(claude_code.PROCESSING_PATTERN, output):
+        return TerminalStatus.RUNNING
+    if re.search(claude_code.WAITING_USER_ANSWER_PATTERN, output):
+        return TerminalStatus.RUNNING
+    if re.search(claude_code.RESPONSE_PATTERN, output) and re.search(
+        claude_code.IDLE_PROMPT_PATTERN, output
+    ):
+        return TerminalStatus.COMPLETED
+    if re.search(claude_code.IDLE_PROMPT_PATTERN, output):
+        return TerminalStatus.READY
+    return TerminalStatus.RUNNING
+
+
+_LEGACY_CODEX = {
+    name: [re.compile(p, re.IGNORECASE) for p in patterns]
+    for name, patterns in (
+        ("ready", codex.READY_PATTERNS),
+        ("busy", codex.BUSY_PATTERNS),
+        # The patterns before the error latch was narrowed to Codex's own banners.
+        (
+            "errors",
+            [
+                r"failed to initialize rollout recorder",
+                r"rollout recorder: (?:operation not permitted|permission denied)",
+                r"agent loop died",
+                r"fatal error",
+                r"panic",
+                r"Failed to create session",
+            ],
+        ),
+    )
+}
+
+
+def legacy_codex_status(history: str) -> TerminalStatus:
+    if not history.strip():
+        return TerminalStatus.RUNNING
+    for cre in _LEGACY_CODEX["errors"]:
+        if cre.search(history):
+            return TerminalStatus.ERROR
+    lines = [ln.rstrip() for ln in history.replace("\r", "").splitlines() if ln.strip()]
+    if lines and codex.PROMPT_RE.match(lines[-1]):
+        return TerminalStatus.READY
+    for cre in _LEGACY_CODEX["busy"]:
+        if cre.search(history):
+            return TerminalStatus.RUNNING
+    for cre in _LEGACY_CODEX["ready"]:
+        if cre.search(history):
+            return TerminalStatus.READY
+    return TerminalStatus.RUNNING
+
+
+PROVIDERS = {
+    "claude": (legacy_claude_status, claude_code.STATUS_ENGINE),
+    "codex": (legacy_codex_status, codex.STATUS_ENGINE),
+}
+
+
+def pad(screen: str, history: int) -> str:
+    scrollback = (CAPTURES / "scrollback.txt").read_text().splitlines()
+    screen_lines = screen.splitlines()
+    missing = max(history - len(screen_lines), 0)
+    lines = (scrollback * (missing // len(scrollback) + 1))[:missing]
+    return "\n".join(lines + screen_lines)
+
+
+def per_call_us(func: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def run(history: int, number: int) -> List[Dict[str, object]]:
+    results = []
+    for path in sorted(CAPTURES.glob("*.txt")):
+        provider = path.stem.split("_")[0]
+        if provider not in PROVIDERS:
+            continue
+        legacy, engine = PROVIDERS[provider]
+        screen = path.read_text()
+        full = pad(screen, history)
+        cases = {
+            "legacy": lambda: legacy(full),
+            "engine/full": lambda: engine.evaluate(PaneDelta([], full, reset=True), set()),
+            "engine/screen": lambda: engine.evaluate(PaneDelta([], screen, reset=True), set()),
+        }
+        statuses = {name: case().value for name, case in cases.items()}
+        for name, case in cases.items():
+            results.append(
+                {
+                    "capture": path.stem,
+                    "variant": name,
+                    "status": statuses[name],
+                    "us_per_call": round(per_call_us(case, number), 2),
+                }
+            )
+    return results
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--history", type=int, default=1000, help="Lines per padded capture.")
+    parser.add_argument("--number", type=int, default=2000, help="Calls per timing run.")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results.")
+    args = parser.parse_args(argv)
+
+    results = run(args.history, args.number)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"{'capture':<20} {'variant':<14} {'status':<10} {'us/call':>9}")
+    for row in results:
+        print(
+            f"{row['capture']:<20} {row['variant']:<14} {row['status']:<10} "
+            f"{row['us_per_call']:>9.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import os
 from typing import Any, List
 
-from fastapi import Depends, FastAPI, HTTPException, status
+from fastapi import Depends, FastAPI, HTTPException, Query, status
 
+from agent_conductor import constants
 from agent_conductor.clients.database import init_db
+from agent_conductor.clients.tmux import TmuxError
+from agent_conductor.clients.tmux_hooks import install_hooks, remove_hooks
+from agent_conductor.clients.tmux_pool import DEFAULT_POOL_SIZE, WindowPool
+from agent_conductor.clients.tmux_shards import TmuxShards
 from agent_conductor.models.approval import (
     ApprovalCreateRequest,
     ApprovalDecisionRequest,
@@ -15,13 +22,13 @@ from agent_conductor.models.enums import ApprovalStatus
 from agent_conductor.models.flow import Flow, FlowCreateRequest
 from agent_conductor.models.inbox import InboxCreateRequest, InboxMessage
 from agent_conductor.models.session import Session, SessionCreateRequest
+from agent_conductor.models.tmux_event import TmuxEvent
 from agent_conductor.models.terminal import (
     Terminal as TerminalModel,
     TerminalCreateRequest,
     TerminalInputRequest,
 )
-from agent_conductor.providers.base import ProviderInitializationError
-from agent_conductor.providers.manager import ProviderManager
+from agent_conductor.providers.manager import ProviderManager, UnknownProviderError
 from agent_conductor.services.approval_service import ApprovalService
 from agent_conductor.services.cleanup_service import CleanupService
 from agent_conductor.services.flow_service import FlowService
@@ -29,13 +36,22 @@ from agent_conductor.services.inbox_service import InboxService
 from agent_conductor.services.prompt_service import PromptWatcher
 from agent_conductor.ui import create_router as create_ui_router
 from agent_conductor.services.session_service import SessionService
-from agent_conductor.services.terminal_service import TerminalService
+from agent_conductor.services.status_tracker import StatusTracker
+from agent_conductor.services.terminal_service import (
+    DEFAULT_STARTUP_CONCURRENCY,
+    TerminalService,
+)
 from agent_conductor.utils.logging import setup_logging
 from agent_conductor.utils.pathing import ensure_runtime_directories
 
 
+LOG = logging.getLogger(__name__)
+
 app = FastAPI(title="Agent Conductor API", version="0.1.0")
 
+# Upper bound for one GET /terminals/{id}/wait long-poll.
+MAX_WAIT_SECONDS = 120.0
+
 
 def _require_service(name: str):
     service = getattr(app.state, name, None)
@@ -69,8 +85,35 @@ async def startup_event() -> None:
     setup_logging()
     ensure_runtime_directories()
     init_db()
-    provider_manager = ProviderManager()
-    terminal_service = TerminalService(providers=provider_manager)
+    shards = TmuxShards(count=int(os.environ.get(constants.TMUX_SHARDS_ENV_VAR, 1)))
+    shards.enable_async()
+    tmux = shards.client(shards.default_socket)
+    async_tmux = shards.async_client(shards.default_socket)
+    status_tracker = StatusTracker()
+    provider_manager = ProviderManager(
+        tmux,
+        async_tmux,
+        status_tracker=status_tracker,
+        pool_size=int(os.environ.get(constants.PROVIDER_POOL_SIZE_ENV_VAR, 0)),
+        structured_output=os.environ.get(constants.STRUCTURED_OUTPUT_ENV_VAR) == "1",
+    )
+    pool_size = int(os.environ.get(constants.WINDOW_POOL_SIZE_ENV_VAR, DEFAULT_POOL_SIZE))
+    window_pools = {
+        socket: WindowPool(client, size=pool_size) for socket, client in shards.clients().items()
+    }
+    terminal_service = TerminalService(
+        providers=provider_manager,
+        shards=shards,
+        window_pools=window_pools,
+        startup_concurrency=int(
+            os.environ.get(constants.STARTUP_CONCURRENCY_ENV_VAR, DEFAULT_STARTUP_CONCURRENCY)
+        ),
+    )
+    status_tracker.subscribe(terminal_service.record_status)
+    interrupted = terminal_service.fail_interrupted_starts()
+    if interrupted:
+        LOG.warning("Marked %d terminals left STARTING by a previous server as ERROR.", interrupted)
+    terminal_service.load_registry()
     inbox_service = InboxService(terminal_service)
     flow_service = FlowService()
     approval_service = ApprovalService(terminal_service, inbox_service)
@@ -78,7 +121,15 @@ async def startup_event() -> None:
     cleanup_service = CleanupService(terminal_service)
     prompt_watcher = PromptWatcher(session_service, terminal_service, inbox_service)
 
+    for socket, client in shards.clients().items():
+        try:
+            install_hooks(client)
+        except TmuxError:
+            LOG.warning("Unable to install tmux lifecycle hooks on %s.", socket, exc_info=True)
+
+    app.state.tmux_shards = shards
     app.state.provider_manager = provider_manager
+    app.state.status_tracker = status_tracker
     app.state.terminal_service = terminal_service
     app.state.inbox_service = inbox_service
     app.state.flow_service = flow_service
@@ -93,6 +144,7 @@ async def startup_event() -> None:
         asyncio.create_task(_cleanup_loop(cleanup_service)),
         asyncio.create_task(_inbox_loop(inbox_service)),
         asyncio.create_task(_prompt_loop(prompt_watcher)),
+        asyncio.create_task(_status_loop(status_tracker)),
     ]
 
 
@@ -105,22 +157,45 @@ async def _cleanup_loop(cleanup_service: CleanupService) -> None:
 
 async def _inbox_loop(inbox_service: InboxService) -> None:
     while True:
-        inbox_service.deliver_all_pending()
+        await inbox_service.deliver_all_pending_async()
         await asyncio.sleep(5)
 
 
 async def _prompt_loop(prompt_watcher: PromptWatcher) -> None:
     while True:
-        prompt_watcher.scan()
+        await prompt_watcher.scan_async()
         await asyncio.sleep(3)
 
 
+async def _status_loop(status_tracker: StatusTracker) -> None:
+    while True:
+        await asyncio.to_thread(status_tracker.poll)
+        await asyncio.sleep(1)
+
+
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
     tasks = getattr(app.state, "background_tasks", [])
     for task in tasks:
         task.cancel()
     await asyncio.gather(*tasks, return_exceptions=True)
+    shards = getattr(app.state, "tmux_shards", None)
+    if shards is not None:
+        await shards.aclose()
+    provider_manager = getattr(app.state, "provider_manager", None)
+    if provider_manager is not None:
+        await asyncio.to_thread(provider_manager.close)
+    terminal_service = getattr(app.state, "terminal_service", None)
+    if terminal_service is not None:
+        for window_pool in terminal_service.window_pools.values():
+            await asyncio.to_thread(window_pool.close)
+    if shards is not None:
+        for client in shards.clients().values():
+            try:
+                remove_hooks(client)
+            except TmuxError:
+                LOG.debug("tmux lifecycle hooks already gone at shutdown.")
+        shards.close()
 
 
 @app.get("/health")
@@ -129,11 +204,38 @@ async def health() -> dict[str, str]:
     return {"status": "ok", "server": "running"}
 
 
+@app.get("/providers/pool")
+async def provider_pool_stats() -> dict[str, dict[str, float]]:
+    """Hit/miss counts, hit rate and idle CLIs of the provider pool, per provider."""
+    return _require_service("provider_manager").pool.stats()
+
+
+@app.get("/terminals/registry")
+async def terminal_registry_stats() -> dict[str, float]:
+    """Cached terminals, hits, misses and hit rate of the in-memory terminal registry."""
+    return _require_service("terminal_service").registry.stats()
+
+
 @app.post("/sessions", response_model=TerminalModel, status_code=status.HTTP_201_CREATED)
 async def create_session(
     payload: SessionCreateRequest,
     terminals: TerminalService = Depends(get_terminal_service),
 ) -> TerminalModel:
+    """Create a session; its terminals start in the background (status STARTING)."""
+    # Window creation and rollback run tmux commands: keep them off the event loop.
+    supervisor, created_workers = await asyncio.to_thread(
+        _create_session_terminals, terminals, payload
+    )
+    # Supervisor and workers boot concurrently; a failure rolls the whole session back.
+    terminals.start_session_in_background(
+        [supervisor.id, *(worker_terminal.id for worker_terminal in created_workers)]
+    )
+    return supervisor
+
+
+def _create_session_terminals(
+    terminals: TerminalService, payload: SessionCreateRequest
+) -> tuple[TerminalModel, list[TerminalModel]]:
     created_workers: list[TerminalModel] = []
     supervisor: TerminalModel | None = None
     try:
@@ -142,6 +244,7 @@ async def create_session(
             role=payload.role,
             agent_profile=payload.agent_profile,
             working_directory=payload.working_directory,
+            initialize=False,
         )
 
         for worker_request in payload.workers:
@@ -152,24 +255,42 @@ async def create_session(
                     agent_profile=worker_request.agent_profile,
                     session_name=supervisor.session_name,
                     working_directory=worker_request.working_directory or payload.working_directory,
+                    initialize=False,
                 )
             )
-
-        return supervisor
-    except ProviderInitializationError as exc:
+    except UnknownProviderError as exc:
         # Cleanup any partially created terminals to keep state consistent.
         for worker_terminal in created_workers:
             terminals.delete_terminal(worker_terminal.id)
         if supervisor is not None:
             terminals.delete_terminal(supervisor.id)
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return supervisor, created_workers
 
 
 @app.get("/sessions", response_model=List[Session])
 async def list_sessions(
     sessions: SessionService = Depends(get_session_service),
 ) -> List[Session]:
-    return sessions.list_sessions()
+    return await sessions.list_sessions_async()
+
+
+@app.get("/sessions/{session_name}/wait", response_model=Session)
+async def wait_for_session(
+    session_name: str,
+    timeout: float = Query(30.0, ge=0, le=MAX_WAIT_SECONDS),
+    terminals: TerminalService = Depends(get_terminal_service),
+) -> Session:
+    """Long-poll until no terminal of the session is STARTING, or ``timeout`` passes.
+
+    Terminals removed by a rolled-back session start are no longer listed.
+    """
+    members = await terminals.list_terminals_async(session_name)
+    if not members:
+        raise HTTPException(status_code=404, detail="Session not found.")
+    await asyncio.gather(*(terminals.wait_until_started(t.id, timeout) for t in members))
+    members = await terminals.list_terminals_async(session_name)
+    return Session(name=session_name, terminals=members)
 
 
 @app.get("/sessions/{session_name}", response_model=Session)
@@ -177,11 +298,10 @@ async def get_session(
     session_name: str,
     sessions: SessionService = Depends(get_session_service),
 ) -> Session:
-    session_models = sessions.list_sessions()
-    for session in session_models:
-        if session.name == session_name:
-            return session
-    raise HTTPException(status_code=404, detail="Session not found.")
+    session = await sessions.get_session_async(session_name)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found.")
+    return session
 
 
 @app.delete("/sessions/{session_name}", status_code=status.HTTP_204_NO_CONTENT)
@@ -189,7 +309,7 @@ async def delete_session(
     session_name: str,
     sessions: SessionService = Depends(get_session_service),
 ) -> None:
-    sessions.delete_session(session_name)
+    await asyncio.to_thread(sessions.delete_session, session_name)
 
 
 @app.post(
@@ -202,16 +322,21 @@ async def create_worker_terminal(
     payload: TerminalCreateRequest,
     terminals: TerminalService = Depends(get_terminal_service),
 ) -> TerminalModel:
+    """Add a terminal to a session; it starts in the background (status STARTING)."""
     try:
-        return terminals.create_terminal(
+        terminal = await asyncio.to_thread(
+            terminals.create_terminal,
             provider_key=payload.provider,
             role=payload.role,
             agent_profile=payload.agent_profile,
             session_name=session_name,
             working_directory=payload.working_directory,
+            initialize=False,
         )
-    except ProviderInitializationError as exc:
+    except UnknownProviderError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    terminals.start_in_background(terminal.id)
+    return terminal
 
 
 @app.get("/terminals/{terminal_id}", response_model=TerminalModel)
@@ -219,7 +344,20 @@ async def get_terminal(
     terminal_id: str,
     terminals: TerminalService = Depends(get_terminal_service),
 ) -> TerminalModel:
-    terminal = terminals.get_terminal(terminal_id)
+    terminal = await terminals.get_terminal_async(terminal_id)
+    if not terminal:
+        raise HTTPException(status_code=404, detail="Terminal not found.")
+    return terminal
+
+
+@app.get("/terminals/{terminal_id}/wait", response_model=TerminalModel)
+async def wait_for_terminal(
+    terminal_id: str,
+    timeout: float = Query(30.0, ge=0, le=MAX_WAIT_SECONDS),
+    terminals: TerminalService = Depends(get_terminal_service),
+) -> TerminalModel:
+    """Long-poll until a STARTING terminal is READY or ERROR, or ``timeout`` passes."""
+    terminal = await terminals.wait_until_started(terminal_id, timeout)
     if not terminal:
         raise HTTPException(status_code=404, detail="Terminal not found.")
     return terminal
@@ -242,7 +380,7 @@ async def send_terminal_input(
             metadata_payload=payload.metadata_payload,
         )
         return {"status": "queued_for_approval", "approval": approval.model_dump()}
-    terminals.send_input(terminal_id, payload.message)
+    await terminals.send_input_async(terminal_id, payload.message)
     return {"status": "sent"}
 
 
@@ -253,7 +391,7 @@ async def get_terminal_output(
     terminals: TerminalService = Depends(get_terminal_service),
 ) -> dict[str, str]:
     last_only = mode == "last"
-    output = terminals.capture_output(terminal_id, last_only=last_only)
+    output = await terminals.capture_output_async(terminal_id, last_only=last_only)
     return {"output": output}
 
 
@@ -262,7 +400,20 @@ async def delete_terminal(
     terminal_id: str,
     terminals: TerminalService = Depends(get_terminal_service),
 ) -> None:
-    terminals.delete_terminal(terminal_id)
+    await asyncio.to_thread(terminals.delete_terminal, terminal_id)
+
+
+@app.post("/tmux/events", status_code=status.HTTP_202_ACCEPTED)
+async def receive_tmux_event(
+    payload: TmuxEvent,
+    terminals: TerminalService = Depends(get_terminal_service),
+    inbox: InboxService = Depends(get_inbox_service),
+) -> dict[str, List[str]]:
+    """Receive lifecycle events from the tmux hooks installed at startup."""
+    exited = await asyncio.to_thread(terminals.handle_tmux_event, payload)
+    for terminal_id in exited:
+        await asyncio.to_thread(inbox.fail_pending, terminal_id)
+    return {"exited": exited}
 
 
 @app.post("/inbox", response_model=InboxMessage, status_code=status.HTTP_201_CREATED)
@@ -270,7 +421,7 @@ async def enqueue_message(
     payload: InboxCreateRequest,
     inbox: InboxService = Depends(get_inbox_service),
 ) -> InboxMessage:
-    return inbox.queue_message(
+    return await inbox.queue_message_async(
         sender_id=payload.sender_id,
         receiver_id=payload.receiver_id,
         message=payload.message,
@@ -282,7 +433,7 @@ async def list_inbox(
     terminal_id: str,
     inbox: InboxService = Depends(get_inbox_service),
 ) -> List[InboxMessage]:
-    return inbox.list_messages(terminal_id)
+    return await inbox.list_messages_async(terminal_id)
 
 
 @app.post("/inbox/{terminal_id}/deliver", status_code=status.HTTP_202_ACCEPTED)
@@ -290,7 +441,7 @@ async def deliver_inbox(
     terminal_id: str,
     inbox: InboxService = Depends(get_inbox_service),
 ) -> None:
-    inbox.deliver_pending(terminal_id)
+    await inbox.deliver_pending_async(terminal_id)
 
 
 @app.post("/flows", response_model=Flow, status_code=status.HTTP_201_CREATED)
@@ -367,7 +518,7 @@ async def list_approvals(
     status_filter: ApprovalStatus | None = None,
     approvals: ApprovalService = Depends(get_approval_service),
 ) -> List[ApprovalRequest]:
-    return approvals.list_requests(status_filter)
+    return await approvals.list_requests_async(status_filter)
 
 
 @app.post("/approvals/{request_id}/approve", response_model=ApprovalRequest)
@@ -375,7 +526,7 @@ async def approve_request(
     request_id: int,
     approvals: ApprovalService = Depends(get_approval_service),
 ) -> ApprovalRequest:
-    return approvals.approve(request_id)
+    return await asyncio.to_thread(approvals.approve, request_id)
 
 
 @app.post("/approvals/{request_id}/deny", response_model=ApprovalRequest)
@@ -384,4 +535,4 @@ async def deny_request(
     payload: ApprovalDecisionRequest,
     approvals: ApprovalService = Depends(get_approval_service),
 ) -> ApprovalRequest:
-    return approvals.deny(request_id, reason=payload.reason)
+    return await asyncio.to_thread(approvals.deny, request_id, reason=payload.reason)
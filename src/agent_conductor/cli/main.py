@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import shlex
+import time
 from typing import Any, Dict, List, Optional
 
 import click
@@ -14,12 +15,19 @@ from agent_conductor.utils.logging import setup_logging
 from agent_conductor.utils.pathing import ensure_runtime_directories
 
 API_BASE = "http://127.0.0.1:9889"
+# How long launch/worker wait for terminals to leave STARTING.
+STARTUP_TIMEOUT_SECONDS = 180
 
 
-def _request(method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> Any:
+def _request(
+    method: str, path: str, payload: Optional[Dict[str, Any]] = None, *, missing_ok: bool = False
+) -> Any:
+    """Call the API; with ``missing_ok`` a 404 returns None instead of failing."""
     url = f"{API_BASE}{path}"
     with httpx.Client(timeout=60) as client:
         response = client.request(method, url, json=payload)
+    if missing_ok and response.status_code == 404:
+        return None
     if response.status_code >= 400:
         raise click.ClickException(f"API error {response.status_code}: {response.text}")
     if response.content:
@@ -27,6 +35,27 @@ def _request(method: str, path: str, payload: Optional[Dict[str, Any]] = None) -
     return None
 
 
+def _wait_until_started(terminal: Dict[str, Any]) -> Dict[str, Any]:
+    """Long-poll the server until ``terminal`` is no longer STARTING."""
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while terminal.get("status") == "STARTING" and time.monotonic() < deadline:
+        terminal = _request("GET", f"/terminals/{terminal['id']}/wait?timeout=30")
+    return terminal
+
+
+def _starting(terminals: List[Dict[str, Any]]) -> bool:
+    return any(t.get("status") == "STARTING" for t in terminals)
+
+
+def _check_started(terminals: List[Dict[str, Any]]) -> None:
+    failed = [t["id"] for t in terminals if t.get("status") in ("STARTING", "ERROR", "EXITED")]
+    if failed:
+        raise click.ClickException(
+            f"Terminal(s) failed to start: {', '.join(failed)}. "
+            "Inspect them with 'acd logs <terminal_id>'."
+        )
+
+
 @click.group(help="Agent Conductor CLI for orchestrating tmux-based agents (providers: claude_code, codex, q_cli).")
 def cli() -> None:
     """Root command for Agent Conductor."""
@@ -95,12 +124,19 @@ def install(source: str, name: Optional[str], scope: str, force: bool) -> None:
     default=None,
     help="Working directory for the agent (defaults to current directory).",
 )
+@click.option(
+    "--wait/--no-wait",
+    default=True,
+    show_default=True,
+    help="Wait until the terminals have started before returning.",
+)
 def launch(
     provider: str,
     agent_profile: Optional[str],
     role: str,
     with_workers: List[str],
     working_directory: Optional[str],
+    wait: bool,
 ) -> None:
     """Launch a new session with a supervisor terminal."""
     cwd = working_directory or os.getcwd()
@@ -117,7 +153,17 @@ def launch(
         ]
     result = _request("POST", "/sessions", payload)
     session_summary = _request("GET", f"/sessions/{result['session_name']}")
+    if wait:
+        deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+        while _starting(session_summary["terminals"]) and time.monotonic() < deadline:
+            session_summary = _request(
+                "GET", f"/sessions/{result['session_name']}/wait?timeout=30"
+            )
     click.echo(json.dumps(session_summary, indent=2))
+    if wait:
+        _check_started(session_summary["terminals"])
+        if len(session_summary["terminals"]) < 1 + len(with_workers):
+            raise click.ClickException("Session start failed and was rolled back.")
 
 
 @cli.command("sessions")
@@ -131,20 +177,19 @@ def list_sessions() -> None:
 @click.argument("session_name")
 def get_session(session_name: str) -> None:
     """Get details for a specific session."""
-    result = _request("GET", "/sessions")
-    for s in result:
-        if s["name"] == session_name:
-            click.echo(f"Session: {s['name']}")
-            terminals = s.get("terminals", [])
-            if terminals:
-                sup = terminals[0]
-                click.echo(f"Supervisor: {sup['id'][:8]} ({sup.get('status', 'unknown')})")
-                if len(terminals) > 1:
-                    click.echo("Workers:")
-                    for t in terminals[1:]:
-                        click.echo(f"  - {t['id'][:8]} ({t.get('agent_profile', 'unknown')}, {t.get('status', 'unknown')})")
-            return
-    raise click.ClickException(f"Session '{session_name}' not found")
+    s = _request("GET", f"/sessions/{session_name}", missing_ok=True)
+    if s is None:
+        raise click.ClickException(f"Session '{session_name}' not found")
+    click.echo(f"Session: {s['name']}")
+    terminals = s.get("terminals", [])
+    if terminals:
+        sup = terminals[0]
+        click.echo(f"Supervisor: {sup['id'][:8]} ({sup.get('status', 'unknown')})")
+        if len(terminals) > 1:
+            click.echo("Workers:")
+            for t in terminals[1:]:
+                profile = t.get("agent_profile", "unknown")
+                click.echo(f"  - {t['id'][:8]} ({profile}, {t.get('status', 'unknown')})")
 
 
 @cli.command()
@@ -181,7 +226,10 @@ def logs(terminal_id: str, lines: int, follow: bool) -> None:
     "--provider",
     default="claude_code",
     show_default=True,
-    help="Provider key for the worker (e.g., claude_code, codex, q_cli).",
+    help=(
+        "Provider key for the worker "
+        "(e.g., claude_code, codex, codex_headless, q_cli, synthetic)."
+    ),
 )
 @click.option("--agent-profile", help="Agent profile for the worker.")
 @click.option("--role", default="worker", show_default=True, help="Role label.")
@@ -191,12 +239,19 @@ def logs(terminal_id: str, lines: int, follow: bool) -> None:
     default=None,
     help="Working directory for the worker (defaults to current directory).",
 )
+@click.option(
+    "--wait/--no-wait",
+    default=True,
+    show_default=True,
+    help="Wait until the worker has started before returning.",
+)
 def worker(
     session_name: str,
     provider: str,
     agent_profile: Optional[str],
     role: str,
     working_directory: Optional[str],
+    wait: bool,
 ) -> None:
     """Spawn a worker terminal inside an existing session."""
     cwd = working_directory or os.getcwd()
@@ -207,7 +262,11 @@ def worker(
         "working_directory": cwd,
     }
     result = _request("POST", f"/sessions/{session_name}/terminals", payload)
+    if wait:
+        result = _wait_until_started(result)
     click.echo(json.dumps(result, indent=2))
+    if wait:
+        _check_started([result])
 
 
 @cli.command()
@@ -259,21 +318,29 @@ def attach(target: str) -> None:
     import subprocess
 
     session_name = target
+    socket_name = None
 
-    # If target looks like a short ID (8 chars, hex), try to resolve to session name
-    if len(target) <= 8:
-        try:
+    try:
+        # If target looks like a short ID (8 chars, hex), try to resolve to session name
+        if len(target) <= 8:
             result = _request("GET", f"/terminals/{target}")
             session_name = result.get("session_name", target)
-        except (click.ClickException, httpx.ConnectError, httpx.TimeoutException):
-            # API unavailable or terminal not found - use target as-is
-            session_name = target
+            socket_name = result.get("tmux_socket")
+        else:
+            # Sessions may live on a sharded tmux server (-L conductor-<n>).
+            terminals = _request("GET", f"/sessions/{target}").get("terminals", [])
+            socket_name = terminals[0].get("tmux_socket") if terminals else None
+    except (click.ClickException, httpx.ConnectError, httpx.TimeoutException):
+        # API unavailable or terminal not found - use target as-is
+        session_name = target
+
+    command = ["tmux"]
+    if socket_name:
+        command.extend(["-L", socket_name])
+    command.extend(["attach-session", "-t", session_name])
 
     # Attempt direct tmux attach (works even when API is down)
-    result = subprocess.run(
-        ["tmux", "attach-session", "-t", session_name],
-        capture_output=False,
-    )
+    result = subprocess.run(command, capture_output=False)
     if result.returncode != 0:
         raise click.ClickException(
             f"Failed to attach to tmux session '{session_name}'. "
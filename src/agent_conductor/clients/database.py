@@ -2,13 +2,47 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import Iterator, Optional
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional, Set
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, Text, create_engine, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, sessionmaker
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    create_engine,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+    sessionmaker,
+)
+from sqlalchemy.pool import QueuePool
 
 from agent_conductor import constants
+from agent_conductor.clients.migrations import (
+    Migration,
+    add_missing_columns,
+    create_missing_indexes,
+    run_migrations,
+)
 from agent_conductor.models.enums import ApprovalStatus, InboxStatus, TerminalStatus
 from agent_conductor.utils.pathing import ensure_runtime_directories
 
@@ -17,13 +51,76 @@ class BaseModel(DeclarativeBase):
     """Declarative base class for SQLAlchemy models."""
 
 
+# Applied to every new connection. WAL lets readers (API requests, the UI) run
+# while one writer commits, and NORMAL sync is safe under WAL; writers that
+# still collide wait up to busy_timeout instead of failing with "database is
+# locked".
+BUSY_TIMEOUT_MS = 5000
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": str(BUSY_TIMEOUT_MS),
+    "mmap_size": str(256 * 1024 * 1024),
+    "cache_size": str(-16 * 1024),  # negative: KiB, i.e. 16 MiB per connection
+    "temp_store": "MEMORY",
+}
+# Connections are shared by the event loop, its worker threads (asyncio.to_thread)
+# and the background terminal start pool, so they must not be pinned to a thread.
+POOL_SIZE = 8
+POOL_MAX_OVERFLOW = 16
+POOL_TIMEOUT_SECONDS = 30
+
+
+def _apply_pragmas(dbapi_connection, _connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 def _build_engine(echo: bool = False):
     ensure_runtime_directories()
-    return create_engine(f"sqlite:///{constants.DB_FILE}", echo=echo, future=True)
+    engine = create_engine(
+        f"sqlite:///{constants.DB_FILE}",
+        echo=echo,
+        future=True,
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT_SECONDS,
+        connect_args={"check_same_thread": False, "timeout": BUSY_TIMEOUT_MS / 1000},
+    )
+    event.listen(engine, "connect", _apply_pragmas)
+    return engine
+
+
+def _build_async_engine(echo: bool = False) -> AsyncEngine:
+    """Engine for the API server's event loop, on the same file and pragmas.
+
+    aiosqlite runs each connection on its own thread, so queries awaited by
+    routes and background loops do not block the loop while SQLite works.
+    """
+    ensure_runtime_directories()
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{constants.DB_FILE}",
+        echo=echo,
+        pool_size=POOL_SIZE,
+        max_overflow=POOL_MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT_SECONDS,
+        connect_args={"timeout": BUSY_TIMEOUT_MS / 1000},
+    )
+    event.listen(engine.sync_engine, "connect", _apply_pragmas)
+    return engine
 
 
 ENGINE = _build_engine()
 SESSION_FACTORY = sessionmaker(bind=ENGINE, autoflush=False, expire_on_commit=False, future=True)
+ASYNC_ENGINE = _build_async_engine()
+ASYNC_SESSION_FACTORY = async_sessionmaker(
+    bind=ASYNC_ENGINE, autoflush=False, expire_on_commit=False
+)
 
 
 class Terminal(BaseModel):
@@ -34,14 +131,24 @@ class Terminal(BaseModel):
     id: Mapped[str] = mapped_column(String, primary_key=True)
     session_name: Mapped[str] = mapped_column(String, nullable=False)
     window_name: Mapped[str] = mapped_column(String, nullable=False)
+    tmux_window_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    tmux_pane_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    tmux_socket: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    role: Mapped[str] = mapped_column(String, nullable=False, server_default="worker")
     provider: Mapped[str] = mapped_column(String, nullable=False)
     agent_profile: Mapped[str | None] = mapped_column(String, nullable=True)
+    working_directory: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     status: Mapped[TerminalStatus] = mapped_column(Enum(TerminalStatus), nullable=False)
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
     inbox_messages: Mapped[list["InboxMessage"]] = relationship(
         back_populates="receiver", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index("ix_terminals_session_created", "session_name", "created_at"),
+        Index("ix_terminals_session_role", "session_name", "role", "created_at"),
+    )
+
 
 class InboxMessage(BaseModel):
     """Message queued for delivery to a terminal."""
@@ -56,6 +163,10 @@ class InboxMessage(BaseModel):
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
     receiver: Mapped["Terminal"] = relationship(back_populates="inbox_messages")
 
+    __table_args__ = (
+        Index("ix_inbox_receiver_status_created", "receiver_id", "status", "created_at"),
+    )
+
 
 class Flow(BaseModel):
     """Scheduled flow definition."""
@@ -88,18 +199,80 @@ class ApprovalRequest(BaseModel):
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=func.now())
     decided_at: Mapped[Optional[str]] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (Index("ix_approvals_status_created", "status", "created_at"),)
+
+
+# Disposals scheduled on a running loop, referenced until they finish.
+_PENDING_DISPOSALS: Set[asyncio.Task] = set()
+
+
+def dispose_async_engine(engine: AsyncEngine) -> None:
+    """Close ``engine``'s pooled aiosqlite connections and their threads.
+
+    Closing them has to be awaited: on a running loop (server startup) this
+    schedules the disposal, otherwise it runs it on a temporary loop.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(engine.dispose())
+        return
+    task = loop.create_task(engine.dispose())
+    _PENDING_DISPOSALS.add(task)
+    task.add_done_callback(_PENDING_DISPOSALS.discard)
+
 
 def init_db(echo: bool = False) -> None:
-    """Create tables if they do not exist."""
-    global ENGINE, SESSION_FACTORY
+    """Create missing tables, then apply pending schema migrations."""
+    global ENGINE, SESSION_FACTORY, ASYNC_ENGINE, ASYNC_SESSION_FACTORY
+    previous, previous_async = ENGINE, ASYNC_ENGINE
     ENGINE = _build_engine(echo=echo)
+    ASYNC_ENGINE = _build_async_engine(echo=echo)
+    # Close pooled connections to the previous database file.
+    previous.dispose()
+    dispose_async_engine(previous_async)
     SESSION_FACTORY = sessionmaker(
         bind=ENGINE,
         autoflush=False,
         expire_on_commit=False,
         future=True,
     )
+    ASYNC_SESSION_FACTORY = async_sessionmaker(
+        bind=ASYNC_ENGINE, autoflush=False, expire_on_commit=False
+    )
     BaseModel.metadata.create_all(bind=ENGINE)
+    run_migrations(ENGINE, MIGRATIONS)
+
+
+def _add_tmux_ids(connection: Connection) -> None:
+    add_missing_columns(
+        connection, Terminal.__table__, ["tmux_window_id", "tmux_pane_id", "tmux_socket"]
+    )
+
+
+def _add_roles_and_indexes(connection: Connection) -> None:
+    add_missing_columns(connection, Terminal.__table__, ["role"])
+    # Window names start with the role ("supervisor-<profile>-<provider>").
+    connection.execute(
+        text(
+            "UPDATE terminals SET role = 'supervisor' "
+            "WHERE role = 'worker' AND window_name LIKE 'supervisor-%'"
+        )
+    )
+    for table in (Terminal.__table__, InboxMessage.__table__, ApprovalRequest.__table__):
+        create_missing_indexes(connection, table)
+
+
+def _add_working_directories(connection: Connection) -> None:
+    add_missing_columns(connection, Terminal.__table__, ["working_directory"])
+
+
+# Append new steps with the next version; never edit a released step.
+MIGRATIONS = [
+    Migration(1, "tmux window, pane and socket IDs on terminals", _add_tmux_ids),
+    Migration(2, "terminal roles and indexes on hot query columns", _add_roles_and_indexes),
+    Migration(3, "working directories on terminals", _add_working_directories),
+]
 
 
 @contextmanager
@@ -114,3 +287,17 @@ def session_scope() -> Iterator[Session]:
         raise
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncIterator[AsyncSession]:
+    """Awaitable counterpart of :func:`session_scope` for the event loop."""
+    session = ASYNC_SESSION_FACTORY()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
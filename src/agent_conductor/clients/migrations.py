@@ -0,0 +1,85 @@
+"""Versioned schema upgrades for the SQLite database.
+
+The schema version is SQLite's ``user_version`` header field, so it travels
+with the database file. :func:`run_migrations` applies every step newer than
+that version in order, each in its own explicit transaction together with the
+version bump (pysqlite would otherwise autocommit the DDL): a step that fails
+is rolled back whole, leaving the database at the previous version, and the
+server refuses to start instead of running against a half-upgraded schema.
+
+``create_all`` builds a fresh database with the current schema, and the steps
+run afterwards anyway, so each step must be a no-op on an up-to-date schema
+(``checkfirst``, "add column if missing").
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Sequence
+
+from sqlalchemy import Column, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One upgrade step; ``version`` is the schema version it produces."""
+
+    version: int
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+def schema_version(connection: Connection) -> int:
+    return connection.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def run_migrations(engine: Engine, migrations: Sequence[Migration]) -> List[int]:
+    """Apply pending ``migrations``; returns the versions that were applied."""
+    applied = []
+    for migration in sorted(migrations, key=lambda step: step.version):
+        with engine.begin() as connection:
+            # pysqlite only opens transactions before DML, so DDL would commit
+            # on its own; IMMEDIATE also keeps a second server from migrating too.
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            if schema_version(connection) >= migration.version:
+                continue
+            LOG.info(
+                "Migrating database to version %d: %s", migration.version, migration.description
+            )
+            migration.upgrade(connection)
+            # PRAGMA takes no bound parameters; the version is an int from code.
+            connection.execute(text(f"PRAGMA user_version = {int(migration.version)}"))
+        applied.append(migration.version)
+    return applied
+
+
+def add_missing_columns(connection: Connection, table: Table, columns: Iterable[str]) -> None:
+    """Add ``columns`` of ``table`` that the database does not have yet.
+
+    New columns must be nullable or have a server default, as SQLite cannot
+    add a NOT NULL column without one.
+    """
+    existing = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    for name in columns:
+        if name not in existing:
+            connection.execute(text(_add_column_sql(connection, table, table.columns[name])))
+
+
+def _add_column_sql(connection: Connection, table: Table, column: Column) -> str:
+    column_type = column.type.compile(dialect=connection.dialect)
+    sql = f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column_type}'
+    default = getattr(column.server_default, "arg", None)
+    if isinstance(default, str):
+        sql += " DEFAULT '{}'".format(default.replace("'", "''"))
+    if not column.nullable:
+        sql += " NOT NULL"
+    return sql
+
+
+def create_missing_indexes(connection: Connection, table: Table) -> None:
+    for index in table.indexes:
+        index.create(connection, checkfirst=True)
@@ -0,0 +1,251 @@
+"""Incremental readers for the pane logs written by ``pipe-pane``.
+
+Every terminal's pane output is appended to
+``~/.conductor/logs/terminal/<id>.log`` as the raw bytes the CLI wrote,
+escape sequences included. :class:`LogTail` follows such a file from a byte
+offset, and :class:`LogScreen` replays the text onto a small line buffer
+closely enough to tell what the bottom of the screen shows (cursor movement,
+erase, scroll-region and reverse-index sequences are honoured; colours and
+modes are dropped).
+"""
+
+from __future__ import annotations
+
+import codecs
+import os
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+DEFAULT_BACKLOG_BYTES = 64 * 1024
+DEFAULT_READ_BYTES = 256 * 1024
+# tmux's size for a detached session's panes; trackers use the real pane height.
+DEFAULT_SCREEN_HEIGHT = 24
+
+_CSI_RE = re.compile(r"\x1b\[([0-9;?<=>]*)[ -/]*([@-~])")
+_ESCAPE_PATTERN = (
+    r"\x1b\[[0-9;?<=>]*[ -/]*[@-~]"  # CSI
+    r"|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC
+    r"|\x1b[P^_][^\x1b]*\x1b\\"  # DCS / PM / APC
+    r"|\x1b[()*+][0-9A-Za-z]"  # charset selection
+    r"|\x1b[^\[\]P^_()*+]"  # other two-byte escapes
+)
+_ESCAPE_RE = re.compile(_ESCAPE_PATTERN)
+_TOKEN_RE = re.compile(_ESCAPE_PATTERN + r"|[\x00-\x1f\x7f]|[^\x00-\x1f\x7f]+")
+# Longest escape sequence carried over when a read ends inside one.
+_MAX_PARTIAL_ESCAPE = 256
+
+
+class LogTail:
+    """Follows a growing log file, returning text appended since the last read."""
+
+    def __init__(self, path: Path, backlog: int = DEFAULT_BACKLOG_BYTES) -> None:
+        self.path = Path(path)
+        self.backlog = backlog
+        self.offset: Optional[int] = None
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    def read(self, limit: int = DEFAULT_READ_BYTES) -> Tuple[str, bool]:
+        """Return ``(text, reset)``; ``reset`` means earlier text no longer applies.
+
+        The first read starts ``backlog`` bytes before the end of an existing
+        file, and a file that shrank (truncated or replaced) is re-read from
+        the start. At most ``limit`` bytes are consumed per call; the newest
+        bytes win when more than that arrived.
+        """
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            return "", False
+        reset = False
+        if self.offset is None or size < self.offset:
+            self.offset = max(size - self.backlog, 0) if self.offset is None else 0
+            self._decoder.reset()
+            reset = True
+        if size - self.offset > limit:
+            self.offset = size - limit
+            self._decoder.reset()
+            reset = True
+        if size == self.offset:
+            return "", reset
+        with open(self.path, "rb") as handle:
+            handle.seek(self.offset)
+            data = handle.read(size - self.offset)
+        self.offset += len(data)
+        return self._decoder.decode(data), reset
+
+
+class LogScreen:
+    """A rough, line-oriented terminal replay of a pane log.
+
+    The last ``height`` buffered lines are the screen: absolute cursor moves
+    and scroll regions address them, and older lines are scrollback. It must
+    match the pane's height for full-screen redraws to land on the right rows.
+    """
+
+    def __init__(self, height: int = DEFAULT_SCREEN_HEIGHT, max_lines: int = 200) -> None:
+        self._max_lines = max_lines
+        self.resize(height)
+        self.reset()
+
+    def reset(self) -> None:
+        self.lines: List[str] = [""]
+        self.row = 0
+        self.col = 0
+        # Scroll region as screen rows (top, bottom), or None for the whole screen.
+        self.region: Optional[Tuple[int, int]] = None
+        self._partial = ""
+
+    def resize(self, height: int) -> None:
+        """Follow a pane resize; the region set for the old size no longer applies."""
+        self.height = max(height, 1)
+        self.max_lines = max(self._max_lines, self.height)
+        self.region = None
+
+    def render(self) -> str:
+        """Return the buffered lines, oldest first."""
+        return "\n".join(self.lines)
+
+    def feed(self, text: str) -> str:
+        """Apply ``text`` and return the printable characters it contained."""
+        text = self._partial + text
+        self._partial = ""
+        escape = text.rfind("\x1b", max(len(text) - _MAX_PARTIAL_ESCAPE, 0))
+        if escape >= 0 and not _ESCAPE_RE.match(text, escape):
+            text, self._partial = text[:escape], text[escape:]
+
+        printed: List[str] = []
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group(0)
+            first = token[0]
+            if first == "\x1b":
+                csi = _CSI_RE.fullmatch(token)
+                if csi:
+                    self._apply_csi(csi.group(1), csi.group(2))
+                elif token == "\x1bM":
+                    self._reverse_index()
+                elif token == "\x1bD":
+                    self._index()
+            elif first == "\n":
+                self._newline()
+                printed.append("\n")
+            elif first == "\r":
+                self.col = 0
+            elif first == "\b":
+                self.col = max(self.col - 1, 0)
+            elif first >= " " and first != "\x7f":
+                self._write(token)
+                printed.append(token)
+        self._trim()
+        return "".join(printed)
+
+    def _write(self, text: str) -> None:
+        line = self.lines[self.row]
+        if self.col > len(line):
+            line += " " * (self.col - len(line))
+        self.lines[self.row] = line[: self.col] + text + line[self.col + len(text) :]
+        self.col += len(text)
+
+    def _newline(self) -> None:
+        self._index()
+        self.col = 0
+
+    def _screen_top(self) -> int:
+        return max(len(self.lines) - self.height, 0)
+
+    def _region_rows(self) -> Optional[Tuple[int, int]]:
+        """Buffer indexes of a scroll region smaller than the screen, else None."""
+        if self.region is None:
+            return None
+        top = self._screen_top()
+        return top + self.region[0], top + self.region[1]
+
+    def _index(self) -> None:
+        """Move down a row, scrolling the region when at its bottom."""
+        region = self._region_rows()
+        if region is not None and self.row == region[1]:
+            # Only the region scrolls; nothing enters the scrollback.
+            self._move_to_row(region[1])
+            del self.lines[region[0]]
+            self.lines.insert(region[1], "")
+            return
+        self.row += 1
+        if self.row == len(self.lines):
+            self.lines.append("")
+
+    def _reverse_index(self) -> None:
+        """Move up a row, scrolling the region (or screen) down when at its top."""
+        top = self._screen_top()
+        top, bottom = self._region_rows() or (top, top + self.height - 1)
+        if self.row != top:
+            self.row = max(self.row - 1, 0)
+            return
+        if bottom < len(self.lines):
+            del self.lines[bottom]
+        self.lines.insert(top, "")
+
+    def _move_to_row(self, row: int) -> None:
+        self.row = max(row, 0)
+        while len(self.lines) <= self.row:
+            self.lines.append("")
+
+    def _apply_csi(self, params: str, final: str) -> None:
+        if params.startswith("?"):
+            return
+        values = [int(value) if value.isdigit() else 0 for value in params.split(";")]
+        count = max(values[0], 1)
+        if final == "A":
+            self.row = max(self.row - count, 0)
+        elif final in "BE":
+            self._move_to_row(self.row + count)
+            if final == "E":
+                self.col = 0
+        elif final == "F":
+            self.row = max(self.row - count, 0)
+            self.col = 0
+        elif final == "C":
+            self.col += count
+        elif final == "D":
+            self.col = max(self.col - count, 0)
+        elif final == "G":
+            self.col = count - 1
+        elif final in "Hf":
+            # Absolute rows are relative to the bottom ``height`` lines.
+            top = self._screen_top()
+            self._move_to_row(top + min(count, self.height) - 1)
+            self.col = max(values[1] if len(values) > 1 else 1, 1) - 1
+        elif final == "r":
+            bottom = values[1] if len(values) > 1 and values[1] else self.height
+            bottom = min(bottom, self.height)
+            full = count == 1 and bottom == self.height
+            self.region = None if full or count >= bottom else (count - 1, bottom - 1)
+            # Setting the region homes the cursor.
+            self._move_to_row(self._screen_top())
+            self.col = 0
+        elif final == "K":
+            line = self.lines[self.row]
+            if values[0] == 0:
+                self.lines[self.row] = line[: self.col]
+            elif values[0] == 1:
+                self.lines[self.row] = " " * min(self.col + 1, len(line)) + line[self.col + 1 :]
+            else:
+                self.lines[self.row] = ""
+        elif final == "J":
+            if values[0] == 0:
+                self.lines[self.row] = self.lines[self.row][: self.col]
+                del self.lines[self.row + 1 :]
+            elif values[0] == 1:
+                for index in range(self.row):
+                    self.lines[index] = ""
+            else:
+                top = self._screen_top()
+                del self.lines[top:]
+                self.lines.append("")
+                self.row = len(self.lines) - 1
+                self.col = 0
+
+    def _trim(self) -> None:
+        excess = len(self.lines) - self.max_lines
+        if excess > 0:
+            del self.lines[:excess]
+            self.row = max(self.row - excess, 0)
@@ -1,34 +1,401 @@
-"""Thin wrapper around libtmux used by Agent Conductor."""
+"""Thin wrapper around tmux used by Agent Conductor.
+
+Commands are issued over a persistent control-mode connection when one is
+available (see :mod:`agent_conductor.clients.tmux_control`); otherwise each
+command is forked through libtmux. The ``build_*`` helpers below are shared
+with :class:`agent_conductor.clients.tmux_async.AsyncTmuxClient` so both
+clients issue identical tmux commands.
+"""
 
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+import os
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Sequence
 
 import libtmux
-from libtmux.session import Session
-from libtmux.window import Window
+
+from agent_conductor import constants
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from agent_conductor.clients.tmux_control import ControlModeConnection
 
 
 LOG = logging.getLogger(__name__)
 
+BACKEND_CONTROL = "control"
+BACKEND_LIBTMUX = "libtmux"
+
 
 class TmuxError(RuntimeError):
     """Raised when tmux interactions fail."""
 
 
+@dataclass(frozen=True)
+class TmuxPane:
+    """Stable tmux identifiers for a freshly created window and its pane."""
+
+    session_name: str
+    window_name: str
+    window_id: str
+    pane_id: str
+
+
+@dataclass
+class PaneCursor:
+    """Read position of one incremental-capture consumer of a pane.
+
+    ``tail`` holds the last history lines seen; it locates the read position
+    again once tmux starts trimming history at ``history-limit``.
+    """
+
+    history_size: Optional[int] = None
+    cursor_y: Optional[int] = None
+    tail: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class PaneDelta:
+    """Output produced since a consumer's previous read.
+
+    ``lines`` are history lines that scrolled off screen since the last read
+    (or the recent history when ``reset`` is set); ``screen`` is the visible
+    screen, which TUIs redraw in place.
+    """
+
+    lines: List[str]
+    screen: str
+    reset: bool = False
+
+    @property
+    def text(self) -> str:
+        return "\n".join([*self.lines, self.screen])
+
+
+_PANE_FORMAT = "#{window_id}\t#{pane_id}"
+_CURSOR_FORMAT = "#{history_size}\t#{cursor_y}\t#{history_limit}"
+# History lines kept in PaneCursor.tail to anchor reads on a trimmed pane.
+ANCHOR_LINES = 5
+
+DEFAULT_CAPTURE_START = -1000
+
+# Payloads longer than this many characters are pasted through a tmux buffer
+# (bracketed paste) instead of being typed key by key.
+PASTE_THRESHOLD = 1024
+# Very large payloads are pasted in chunks, each confirmed by a round trip to
+# tmux and followed by a short pause so the receiving TUI can keep up.
+PASTE_CHUNK_SIZE = 16 * 1024
+PASTE_CHUNK_DELAY = 0.02
+
+Command = List[str]
+
+
+def window_target(session_name: str, window_name: str) -> str:
+    """Name-based target, used only for terminals recorded without pane IDs."""
+    return f"={session_name}:={window_name}"
+
+
+def build_create_session(
+    session_name: str,
+    window_name: str,
+    environment: Optional[Dict[str, str]] = None,
+    start_directory: Optional[str] = None,
+    pipe_command: Optional[str] = None,
+) -> List[Command]:
+    create = ["new-session", "-d", "-P", "-F", _PANE_FORMAT, "-s", session_name]
+    create.extend(["-n", window_name])
+    create.extend(_creation_options(environment, start_directory))
+    commands = [create]
+    if pipe_command:
+        commands.append(["pipe-pane", "-o", "-t", f"={session_name}:", pipe_command])
+    return commands
+
+
+def build_create_window(
+    session_name: str,
+    window_name: str,
+    environment: Optional[Dict[str, str]] = None,
+    start_directory: Optional[str] = None,
+    pipe_command: Optional[str] = None,
+) -> List[Command]:
+    # Window names are not unique, so the window is created under a provisional
+    # name that follow-up commands in the same batch can target unambiguously.
+    provisional = f"{window_name}~{uuid.uuid4().hex[:8]}"
+    target = window_target(session_name, provisional)
+    create = ["new-window", "-d", "-P", "-F", _PANE_FORMAT, "-t", f"={session_name}:"]
+    create.extend(["-n", provisional])
+    create.extend(_creation_options(environment, start_directory))
+    commands = [create]
+    if pipe_command:
+        commands.append(["pipe-pane", "-o", "-t", target, pipe_command])
+    commands.append(["rename-window", "-t", target, window_name])
+    return commands
+
+
+def build_send_keys(
+    target: str,
+    keys: str,
+    *,
+    enter: bool = True,
+    suppress_history: bool = False,
+    literal: bool = False,
+) -> List[Command]:
+    args = ["send-keys", "-t", target]
+    if literal:
+        args.append("-l")
+    args.append(f" {keys}" if suppress_history else keys)
+    commands = [args]
+    if enter:
+        # A combined `send-keys ... Enter` is occasionally flaky for certain
+        # TUIs; send Enter explicitly as a follow-up keystroke for reliability.
+        commands.append(build_enter(target))
+    return commands
+
+
+def build_enter(target: str) -> Command:
+    return ["send-keys", "-t", target, "Enter"]
+
+
+def build_paste(target: str, path: str, buffer_name: str) -> List[Command]:
+    """Load ``path`` into a named buffer and paste it with bracketed paste, then delete it."""
+    return [
+        ["load-buffer", "-b", buffer_name, path],
+        ["paste-buffer", "-p", "-d", "-b", buffer_name, "-t", target],
+    ]
+
+
+def paste_chunks(text: str, chunk_size: int = PASTE_CHUNK_SIZE) -> List[str]:
+    return [text[index : index + chunk_size] for index in range(0, len(text), chunk_size)]
+
+
+@contextmanager
+def paste_file() -> Iterator[str]:
+    """Yield a private temp file path for staging paste chunks; removed afterwards."""
+    handle = tempfile.NamedTemporaryFile(prefix="acd-paste-", delete=False)
+    handle.close()
+    try:
+        yield handle.name
+    finally:
+        os.unlink(handle.name)
+
+
+def write_paste_chunk(path: str, chunk: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as handle:
+        handle.write(chunk)
+
+
+def new_buffer_name() -> str:
+    return f"acd-{uuid.uuid4().hex[:8]}"
+
+
+def build_capture(target: str, start: Optional[int] = None, end: Optional[int] = None) -> Command:
+    args = ["capture-pane", "-p", "-t", target]
+    args.extend(["-S", str(start if start is not None else DEFAULT_CAPTURE_START)])
+    if end is not None:
+        args.extend(["-E", str(end)])
+    return args
+
+
+def build_capture_chain(
+    targets: Mapping[str, str], start: Optional[int], end: Optional[int], delimiter: str
+) -> List[Command]:
+    """Captures for several panes, each followed by a delimiter line.
+
+    Used when the batch is chained into one tmux process, where all output
+    arrives as a single stream.
+    """
+    commands: List[Command] = []
+    for target in targets.values():
+        commands.append(build_capture(target, start, end))
+        commands.append(["display-message", "-p", delimiter])
+    return commands
+
+
+def join_capture(lines: List[str]) -> str:
+    """Join captured lines, dropping the blank rows below the last output."""
+    return "\n".join(lines).rstrip("\n")
+
+
+def split_captures(keys: Sequence[str], output: List[str], delimiter: str) -> Dict[str, str]:
+    captures: Dict[str, str] = {}
+    current: List[str] = []
+    remaining = iter(keys)
+    for line in output:
+        if line == delimiter:
+            captures[next(remaining)] = join_capture(current)
+            current = []
+        else:
+            current.append(line)
+    return captures
+
+
+def capture_delimiter() -> str:
+    return f"acd-capture-{uuid.uuid4().hex}"
+
+
+def build_pipe(target: str, command: str, append: bool = True) -> Command:
+    args = ["pipe-pane", "-t", target]
+    if append:
+        args.append("-o")
+    args.append(command)
+    return args
+
+
+def build_cursor_query(target: str) -> Command:
+    return ["display-message", "-p", "-t", target, _CURSOR_FORMAT]
+
+
+def build_delta_batch(target: str, max_lines: int) -> List[Command]:
+    """Cursor query plus a capture of the last ``max_lines`` of history and the screen.
+
+    Sent as one batch, so both describe the same moment of the pane.
+    """
+    return [build_cursor_query(target), build_capture(target, -max_lines)]
+
+
+def parse_pane(session_name: str, window_name: str, output: List[str]) -> TmuxPane:
+    try:
+        window_id, pane_id = output[0].split("\t", 1)
+    except (IndexError, ValueError) as exc:
+        raise TmuxError(f"Unexpected tmux response while creating '{window_name}'.") from exc
+    return TmuxPane(session_name, window_name, window_id.strip(), pane_id.strip())
+
+
+@dataclass(frozen=True)
+class DeltaPlan:
+    """How to split a :func:`build_delta_batch` capture into new lines and screen.
+
+    The capture starts with ``captured`` history lines, of which the last
+    ``history_lines`` are new. With ``anchored`` the history size cannot be
+    trusted (tmux may have trimmed it), so the new lines are found after
+    ``PaneCursor.tail`` instead.
+    """
+
+    captured: int
+    history_lines: int
+    reset: bool
+    anchored: bool
+    history_size: int
+    cursor_y: int
+
+
+def plan_delta(
+    target: str, cursor: PaneCursor, output: List[str], max_lines: int
+) -> DeltaPlan:
+    """Plan the delta for ``cursor`` from the cursor query reply in ``output[0]``.
+
+    Once history reaches ``history-limit`` tmux drops the oldest tenth of it
+    at a time, so the size stays within that band and stops counting new
+    lines; a shrink inside the band is such a trim, not a cleared pane.
+    """
+    try:
+        history_size, cursor_y, limit = (int(value) for value in output[0].split("\t"))
+    except (IndexError, ValueError) as exc:
+        raise TmuxError(f"Unexpected tmux cursor response for '{target}'.") from exc
+    full = min(history_size, max_lines)
+    previous = cursor.history_size
+    if previous is None:
+        return DeltaPlan(full, full, True, False, history_size, cursor_y)
+    if history_size >= limit - max(limit // 10, 1):
+        return DeltaPlan(full, full, False, True, history_size, cursor_y)
+    if history_size < previous:  # clear-history
+        return DeltaPlan(full, full, True, False, history_size, cursor_y)
+    new_lines = min(history_size - previous, full)
+    return DeltaPlan(full, new_lines, False, False, history_size, cursor_y)
+
+
+def lines_after(history: List[str], anchor: List[str]) -> List[str]:
+    """Lines of ``history`` after its last occurrence of ``anchor`` (all if absent)."""
+    size = len(anchor)
+    if not size:
+        return history
+    for end in range(len(history), size - 1, -1):
+        if history[end - size : end] == anchor:
+            return history[end:]
+    # More new output than was captured: everything captured is new.
+    return history
+
+
+def finish_delta(cursor: PaneCursor, output: List[str], plan: DeltaPlan) -> PaneDelta:
+    """Advance ``cursor`` past the capture lines in ``output`` (query reply excluded)."""
+    history = output[: plan.captured]
+    if plan.anchored:
+        lines = lines_after(history, cursor.tail)
+    else:
+        lines = history[len(history) - plan.history_lines :]
+    if history:
+        cursor.tail = history[-ANCHOR_LINES:]
+    cursor.history_size = plan.history_size
+    cursor.cursor_y = plan.cursor_y
+    return PaneDelta(
+        lines=lines,
+        screen="\n".join(output[plan.captured :]),
+        reset=plan.reset,
+    )
+
+
+def chain_commands(commands: Sequence[Sequence[str]]) -> List[str]:
+    """Join commands with ``;`` so one tmux process runs them all."""
+    chained: List[str] = []
+    for args in commands:
+        if chained:
+            chained.append(";")
+        chained.extend(args)
+    return chained
+
+
+def _creation_options(
+    environment: Optional[Dict[str, str]], start_directory: Optional[str]
+) -> List[str]:
+    options: List[str] = []
+    for key, value in (environment or {}).items():
+        options.extend(["-e", f"{key}={value}"])
+    if start_directory:
+        options.extend(["-c", start_directory])
+    return options
+
+
 class TmuxClient:
-    """Minimal helper to encapsulate libtmux operations."""
+    """Minimal helper to encapsulate tmux operations."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        socket_name: Optional[str] = None,
+        backend: Optional[str] = None,
+        paste_threshold: int = PASTE_THRESHOLD,
+        paste_chunk_size: int = PASTE_CHUNK_SIZE,
+    ) -> None:
+        self.socket_name = socket_name
+        self.paste_threshold = paste_threshold
+        self.paste_chunk_size = paste_chunk_size
         try:
-            self._server = libtmux.Server()
+            self._server = libtmux.Server(socket_name=socket_name)
         except Exception as exc:  # pragma: no cover - libtmux specific
             raise TmuxError("Unable to connect to tmux server.") from exc
 
+        self.backend = backend or os.environ.get(constants.TMUX_BACKEND_ENV_VAR, BACKEND_CONTROL)
+        self._control: Optional[ControlModeConnection] = None
+        if self.backend == BACKEND_CONTROL:
+            self._control = self._start_control()
+
+    def close(self) -> None:
+        """Release the control-mode connection, if any."""
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+
     def session_exists(self, name: str) -> bool:
         """Check if a session already exists."""
-        return self._server.has_session(name)
+        try:
+            self._run("has-session", "-t", f"={name}")
+        except TmuxError:
+            return False
+        return True
 
     def create_session(
         self,
@@ -36,23 +403,21 @@ class TmuxClient:
         window_name: str,
         environment: Optional[Dict[str, str]] = None,
         start_directory: Optional[str] = None,
-    ) -> Session:
-        """Create a new tmux session with an initial window."""
-        if self.session_exists(session_name):
-            raise TmuxError(f"tmux session '{session_name}' already exists.")
+        pipe_command: Optional[str] = None,
+    ) -> TmuxPane:
+        """Create a new tmux session with an initial window.
 
+        The environment is passed to the pane's shell with ``-e`` and the
+        optional ``pipe_command`` is attached in the same tmux invocation.
+        """
+        commands = build_create_session(
+            session_name, window_name, environment, start_directory, pipe_command
+        )
         try:
-            kwargs: Dict[str, Any] = {"session_name": session_name, "attach": False}
-            if start_directory:
-                kwargs["start_directory"] = start_directory
-            session = self._server.new_session(**kwargs)
-        except Exception as exc:  # pragma: no cover - libtmux specific
-            raise TmuxError(f"Failed to create tmux session '{session_name}'.") from exc
-
-        window = session.attached_window
-        window.rename_window(window_name)
-        self._apply_environment(window, environment or {})
-        return session
+            output = self.run_batch(commands)
+        except TmuxError as exc:
+            raise TmuxError(f"Failed to create tmux session '{session_name}': {exc}") from exc
+        return parse_pane(session_name, window_name, output)
 
     def create_window(
         self,
@@ -60,33 +425,34 @@ class TmuxClient:
         window_name: str,
         environment: Optional[Dict[str, str]] = None,
         start_directory: Optional[str] = None,
-    ) -> Window:
-        """Spawn a new window inside an existing session."""
-        session = self._get_session(session_name)
+        pipe_command: Optional[str] = None,
+    ) -> TmuxPane:
+        """Spawn a new window inside an existing session.
+
+        Like :meth:`create_session`, the whole setup is one tmux invocation.
+        """
+        commands = build_create_window(
+            session_name, window_name, environment, start_directory, pipe_command
+        )
         try:
-            kwargs: Dict[str, Any] = {"window_name": window_name, "attach": False}
-            if start_directory:
-                kwargs["start_directory"] = start_directory
-            window = session.new_window(**kwargs)
-        except Exception as exc:  # pragma: no cover - libtmux specific
+            output = self.run_batch(commands)
+        except TmuxError as exc:
             raise TmuxError(
-                f"Failed to create window '{window_name}' in session '{session_name}'."
+                f"Failed to create window '{window_name}' in session '{session_name}': {exc}"
             ) from exc
-
-        self._apply_environment(window, environment or {})
-        return window
+        return parse_pane(session_name, window_name, output)
 
     def kill_session(self, session_name: str) -> None:
         """Terminate a tmux session."""
         if not self.session_exists(session_name):
             return
-        session = self._get_session(session_name)
-        session.kill_session()
+        self._run("kill-session", "-t", f"={session_name}")
 
-    def kill_window(self, session_name: str, window_name: str) -> None:
+    def kill_window(
+        self, session_name: str, window_name: str, *, window_id: Optional[str] = None
+    ) -> None:
         """Terminate a window inside a session."""
-        window = self._get_window(session_name, window_name)
-        window.kill_window()
+        self._run("kill-window", "-t", window_id or window_target(session_name, window_name))
 
     def send_keys(
         self,
@@ -97,25 +463,36 @@ class TmuxClient:
         enter: bool = True,
         suppress_history: bool = False,
         literal: bool = False,
+        pane_id: Optional[str] = None,
     ) -> None:
-        """Send keystrokes to a specific window."""
-        window = self._get_window(session_name, window_name)
-        pane = window.attached_pane
-        pane.send_keys(
-            keys,
-            enter=False,
-            suppress_history=suppress_history,
-            literal=literal,
-        )
-        if enter:
-            # libtmux's `enter=True` is occasionally flaky for certain TUIs;
-            # send Enter explicitly as a follow-up keystroke for reliability.
-            pane.send_keys(
-                "Enter",
-                enter=False,
-                suppress_history=suppress_history,
-                literal=False,
+        """Send keystrokes to a specific window.
+
+        Payloads longer than ``paste_threshold`` are pasted through a tmux
+        buffer instead; see :meth:`paste`.
+        """
+        target = pane_id or window_target(session_name, window_name)
+        if len(keys) > self.paste_threshold:
+            self.paste(target, f" {keys}" if suppress_history else keys)
+            if enter:
+                self.run_batch([build_enter(target)])
+            return
+        self.run_batch(
+            build_send_keys(
+                target, keys, enter=enter, suppress_history=suppress_history, literal=literal
             )
+        )
+
+    def paste(self, target: str, text: str) -> None:
+        """Paste ``text`` into ``target`` with bracketed paste, in chunks for large payloads."""
+        buffer_name = new_buffer_name()
+        with paste_file() as path:
+            for index, chunk in enumerate(paste_chunks(text, self.paste_chunk_size)):
+                if index:
+                    time.sleep(PASTE_CHUNK_DELAY)
+                write_paste_chunk(path, chunk)
+                # run_batch returns once tmux has processed the paste, which
+                # paces the next chunk behind it.
+                self.run_batch(build_paste(target, path, buffer_name))
 
     def capture_pane(
         self,
@@ -123,17 +500,79 @@ class TmuxClient:
         window_name: str,
         start: Optional[int] = None,
         end: Optional[int] = None,
+        *,
+        pane_id: Optional[str] = None,
     ) -> str:
         """Return the textual history for a window."""
-        window = self._get_window(session_name, window_name)
-        pane = window.attached_pane
-        result = pane.capture_pane(
-            start=start if start is not None else -1000,
-            end=end,
-        )
-        if isinstance(result, list):
-            return "\n".join(result)
-        return result or ""
+        target = pane_id or window_target(session_name, window_name)
+        return "\n".join(self._run(*build_capture(target, start, end)))
+
+    def capture_many(
+        self,
+        targets: Mapping[str, str],
+        start: Optional[int] = 0,
+        end: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Capture several panes in one round trip.
+
+        ``targets`` maps caller keys (typically terminal IDs) to pane targets.
+        The default ``start=0`` captures only the visible screen. Panes that no
+        longer exist are omitted from the result.
+        """
+        if not targets:
+            return {}
+        control = self._ensure_control()
+        if control is not None:
+            replies = control.execute_each([build_capture(t, start, end) for t in targets.values()])
+            return {
+                key: join_capture(lines)
+                for key, (lines, error) in zip(targets, replies)
+                if not error
+            }
+
+        delimiter = capture_delimiter()
+        try:
+            output = self._run_subprocess(
+                chain_commands(build_capture_chain(targets, start, end, delimiter))
+            )
+        except TmuxError:
+            # tmux aborts a chain at the first missing pane; retry one by one.
+            return self._capture_each(targets, start, end)
+        return split_captures(list(targets), output, delimiter)
+
+    def capture_pane_delta(
+        self,
+        session_name: str,
+        window_name: str,
+        cursor: PaneCursor,
+        *,
+        pane_id: Optional[str] = None,
+        max_lines: int = 1000,
+    ) -> PaneDelta:
+        """Return lines added since ``cursor`` was last advanced, plus the visible screen.
+
+        The first read (or a read after the history was cleared) returns up to
+        ``max_lines`` of recent history with ``reset`` set. The cursor query
+        and a capture of up to ``max_lines`` of history go out in one batch,
+        so lines written meanwhile are neither skipped nor repeated. On a pane
+        at its ``history-limit`` the new lines are those after the ones
+        already seen.
+        """
+        target = pane_id or window_target(session_name, window_name)
+        output = self.run_batch(build_delta_batch(target, max_lines))
+        plan = plan_delta(target, cursor, output, max_lines)
+        return finish_delta(cursor, output[1:], plan)
+
+    def pane_height(
+        self, session_name: str, window_name: str, *, pane_id: Optional[str] = None
+    ) -> int:
+        """Return the pane's height in rows."""
+        target = pane_id or window_target(session_name, window_name)
+        output = self._run("display-message", "-p", "-t", target, "#{pane_height}")
+        try:
+            return int(output[0])
+        except (IndexError, ValueError) as exc:
+            raise TmuxError(f"Unexpected tmux pane height for '{target}'.") from exc
 
     def pipe_pane(
         self,
@@ -141,38 +580,68 @@ class TmuxClient:
         window_name: str,
         command: str,
         append: bool = True,
+        *,
+        pane_id: Optional[str] = None,
     ) -> None:
         """Pipe pane output to an external command (typically tee into a log file)."""
-        window = self._get_window(session_name, window_name)
-        pane = window.attached_pane
-        # Use cmd() to execute pipe-pane command directly
-        flag = "-o" if append else ""
-        if flag:
-            pane.cmd("pipe-pane", flag, command)
-        else:
-            pane.cmd("pipe-pane", command)
-
-    def _get_session(self, name: str) -> Session:
-        session = self._server.find_where({"session_name": name})
-        if session is None:
-            raise TmuxError(f"tmux session '{name}' not found.")
-        return session
-
-    def _get_window(self, session_name: str, window_name: str) -> Window:
-        session = self._get_session(session_name)
-        window = session.find_where({"window_name": window_name})
-        if window is None:
-            raise TmuxError(
-                f"tmux window '{window_name}' not found in session '{session_name}'."
-            )
-        return window
+        target = pane_id or window_target(session_name, window_name)
+        self._run(*build_pipe(target, command, append))
 
-    def _apply_environment(self, window: Window, environment: Dict[str, str]) -> None:
-        if not environment:
-            return
-        pane = window.attached_pane
-        for key, value in environment.items():
+    def run_batch(self, commands: Sequence[Sequence[str]]) -> List[str]:
+        """Execute several tmux commands in one round trip and return their combined output.
+
+        Over control mode the commands are written in a single write; otherwise
+        they are chained with ``;`` into a single tmux process.
+        """
+        if not commands:
+            return []
+        control = self._ensure_control()
+        if control is not None:
+            return control.execute_many(commands)
+        return self._run_subprocess(chain_commands(commands))
+
+    def _capture_each(
+        self, targets: Mapping[str, str], start: Optional[int], end: Optional[int]
+    ) -> Dict[str, str]:
+        captures: Dict[str, str] = {}
+        for key, target in targets.items():
             try:
-                pane.cmd("set-environment", key, value)
-            except Exception as exc:  # pragma: no cover - libtmux specific
-                LOG.warning("Failed to set tmux environment %s: %s", key, exc)
+                lines = self._run_subprocess(build_capture(target, start, end))
+            except TmuxError:
+                continue
+            captures[key] = join_capture(lines)
+        return captures
+
+    def _run(self, *args: str) -> List[str]:
+        """Execute a tmux command and return its stdout lines."""
+        control = self._ensure_control()
+        if control is not None:
+            return control.execute(args)
+        return self._run_subprocess(args)
+
+    def _ensure_control(self) -> Optional[ControlModeConnection]:
+        control = self._control
+        if control is not None and not control.alive:
+            LOG.warning("tmux control-mode connection lost; reconnecting.")
+            control = self._control = self._start_control()
+        return control
+
+    def _run_subprocess(self, args: Sequence[str]) -> List[str]:
+        try:
+            result = self._server.cmd(*args)
+        except Exception as exc:  # pragma: no cover - libtmux specific
+            raise TmuxError(f"tmux command failed: {args[0]}") from exc
+        if result.stderr:
+            raise TmuxError("\n".join(result.stderr))
+        return list(result.stdout)
+
+    def _start_control(self) -> Optional[ControlModeConnection]:
+        from agent_conductor.clients.tmux_control import ControlModeConnection
+
+        connection = ControlModeConnection(socket_name=self.socket_name)
+        try:
+            connection.start()
+        except TmuxError:
+            LOG.warning("tmux control mode unavailable; falling back to libtmux.", exc_info=True)
+            return None
+        return connection
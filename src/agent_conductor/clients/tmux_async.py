@@ -0,0 +1,319 @@
+"""asyncio tmux client for callers running on the event loop.
+
+Mirrors :class:`agent_conductor.clients.tmux.TmuxClient` and issues the same
+commands (see the ``build_*`` helpers there), but every method is awaitable:
+commands travel over an :class:`AsyncControlModeConnection`, or, with the
+libtmux backend, through ``asyncio`` subprocesses instead of worker threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import shutil
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from agent_conductor import constants
+from agent_conductor.clients.tmux import (
+    BACKEND_CONTROL,
+    PASTE_CHUNK_DELAY,
+    PASTE_CHUNK_SIZE,
+    PASTE_THRESHOLD,
+    PaneCursor,
+    PaneDelta,
+    TmuxError,
+    TmuxPane,
+    build_capture,
+    build_capture_chain,
+    build_create_session,
+    build_create_window,
+    build_delta_batch,
+    build_enter,
+    build_paste,
+    build_pipe,
+    build_send_keys,
+    capture_delimiter,
+    chain_commands,
+    finish_delta,
+    join_capture,
+    new_buffer_name,
+    parse_pane,
+    paste_chunks,
+    paste_file,
+    plan_delta,
+    split_captures,
+    window_target,
+    write_paste_chunk,
+)
+from agent_conductor.clients.tmux_control import AsyncControlModeConnection
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncTmuxClient:
+    """Awaitable counterpart of :class:`~agent_conductor.clients.tmux.TmuxClient`.
+
+    The control-mode connection is opened lazily on first use so the client
+    can be constructed outside a running event loop.
+    """
+
+    def __init__(
+        self,
+        socket_name: Optional[str] = None,
+        backend: Optional[str] = None,
+        paste_threshold: int = PASTE_THRESHOLD,
+        paste_chunk_size: int = PASTE_CHUNK_SIZE,
+    ) -> None:
+        self.socket_name = socket_name
+        self.paste_threshold = paste_threshold
+        self.paste_chunk_size = paste_chunk_size
+        self.backend = backend or os.environ.get(constants.TMUX_BACKEND_ENV_VAR, BACKEND_CONTROL)
+        self._control: Optional[AsyncControlModeConnection] = None
+        self._control_failed = False
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+    async def close(self) -> None:
+        """Release the control-mode connection, if any."""
+        if self._control is not None:
+            await self._control.close()
+            self._control = None
+
+    async def session_exists(self, name: str) -> bool:
+        """Check if a session already exists."""
+        try:
+            await self._run("has-session", "-t", f"={name}")
+        except TmuxError:
+            return False
+        return True
+
+    async def create_session(
+        self,
+        session_name: str,
+        window_name: str,
+        environment: Optional[Dict[str, str]] = None,
+        start_directory: Optional[str] = None,
+        pipe_command: Optional[str] = None,
+    ) -> TmuxPane:
+        """Create a new tmux session with an initial window."""
+        commands = build_create_session(
+            session_name, window_name, environment, start_directory, pipe_command
+        )
+        try:
+            output = await self.run_batch(commands)
+        except TmuxError as exc:
+            raise TmuxError(f"Failed to create tmux session '{session_name}': {exc}") from exc
+        return parse_pane(session_name, window_name, output)
+
+    async def create_window(
+        self,
+        session_name: str,
+        window_name: str,
+        environment: Optional[Dict[str, str]] = None,
+        start_directory: Optional[str] = None,
+        pipe_command: Optional[str] = None,
+    ) -> TmuxPane:
+        """Spawn a new window inside an existing session."""
+        commands = build_create_window(
+            session_name, window_name, environment, start_directory, pipe_command
+        )
+        try:
+            output = await self.run_batch(commands)
+        except TmuxError as exc:
+            raise TmuxError(
+                f"Failed to create window '{window_name}' in session '{session_name}': {exc}"
+            ) from exc
+        return parse_pane(session_name, window_name, output)
+
+    async def kill_session(self, session_name: str) -> None:
+        """Terminate a tmux session."""
+        if not await self.session_exists(session_name):
+            return
+        await self._run("kill-session", "-t", f"={session_name}")
+
+    async def kill_window(
+        self, session_name: str, window_name: str, *, window_id: Optional[str] = None
+    ) -> None:
+        """Terminate a window inside a session."""
+        await self._run("kill-window", "-t", window_id or window_target(session_name, window_name))
+
+    async def send_keys(
+        self,
+        session_name: str,
+        window_name: str,
+        keys: str,
+        *,
+        enter: bool = True,
+        suppress_history: bool = False,
+        literal: bool = False,
+        pane_id: Optional[str] = None,
+    ) -> None:
+        """Send keystrokes to a specific window; long payloads are pasted."""
+        target = pane_id or window_target(session_name, window_name)
+        if len(keys) > self.paste_threshold:
+            await self.paste(target, f" {keys}" if suppress_history else keys)
+            if enter:
+                await self.run_batch([build_enter(target)])
+            return
+        await self.run_batch(
+            build_send_keys(
+                target, keys, enter=enter, suppress_history=suppress_history, literal=literal
+            )
+        )
+
+    async def paste(self, target: str, text: str) -> None:
+        """Paste ``text`` into ``target`` with bracketed paste, in chunks for large payloads."""
+        buffer_name = new_buffer_name()
+        with paste_file() as path:
+            for index, chunk in enumerate(paste_chunks(text, self.paste_chunk_size)):
+                if index:
+                    await asyncio.sleep(PASTE_CHUNK_DELAY)
+                write_paste_chunk(path, chunk)
+                await self.run_batch(build_paste(target, path, buffer_name))
+
+    async def capture_pane(
+        self,
+        session_name: str,
+        window_name: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        *,
+        pane_id: Optional[str] = None,
+    ) -> str:
+        """Return the textual history for a window."""
+        target = pane_id or window_target(session_name, window_name)
+        return "\n".join(await self._run(*build_capture(target, start, end)))
+
+    async def capture_many(
+        self,
+        targets: Mapping[str, str],
+        start: Optional[int] = 0,
+        end: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Capture several panes in one round trip; missing panes are omitted."""
+        if not targets:
+            return {}
+        control = await self._ensure_control()
+        if control is not None:
+            replies = await control.execute_each(
+                [build_capture(t, start, end) for t in targets.values()]
+            )
+            return {
+                key: join_capture(lines)
+                for key, (lines, error) in zip(targets, replies)
+                if not error
+            }
+
+        delimiter = capture_delimiter()
+        try:
+            output = await self._run_subprocess(
+                chain_commands(build_capture_chain(targets, start, end, delimiter))
+            )
+        except TmuxError:
+            # tmux aborts a chain at the first missing pane; retry one by one.
+            captures: Dict[str, str] = {}
+            for key, target in targets.items():
+                try:
+                    lines = await self._run_subprocess(build_capture(target, start, end))
+                except TmuxError:
+                    continue
+                captures[key] = join_capture(lines)
+            return captures
+        return split_captures(list(targets), output, delimiter)
+
+    async def capture_pane_delta(
+        self,
+        session_name: str,
+        window_name: str,
+        cursor: PaneCursor,
+        *,
+        pane_id: Optional[str] = None,
+        max_lines: int = 1000,
+    ) -> PaneDelta:
+        """Return lines added since ``cursor`` was last advanced, plus the visible screen."""
+        target = pane_id or window_target(session_name, window_name)
+        output = await self.run_batch(build_delta_batch(target, max_lines))
+        plan = plan_delta(target, cursor, output, max_lines)
+        return finish_delta(cursor, output[1:], plan)
+
+    async def pipe_pane(
+        self,
+        session_name: str,
+        window_name: str,
+        command: str,
+        append: bool = True,
+        *,
+        pane_id: Optional[str] = None,
+    ) -> None:
+        """Pipe pane output to an external command."""
+        target = pane_id or window_target(session_name, window_name)
+        await self._run(*build_pipe(target, command, append))
+
+    async def run_batch(self, commands: Sequence[Sequence[str]]) -> List[str]:
+        """Execute several tmux commands in one round trip and return their combined output."""
+        if not commands:
+            return []
+        control = await self._ensure_control()
+        if control is not None:
+            return await control.execute_many(commands)
+        return await self._run_subprocess(chain_commands(commands))
+
+    async def _run(self, *args: str) -> List[str]:
+        control = await self._ensure_control()
+        if control is not None:
+            return await control.execute(args)
+        return await self._run_subprocess(args)
+
+    async def _ensure_control(self) -> Optional[AsyncControlModeConnection]:
+        if self.backend != BACKEND_CONTROL or self._control_failed:
+            return None
+        control = self._control
+        if control is not None and control.alive:
+            return control
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._control is not None and self._control.alive:
+                return self._control
+            if self._control is not None:
+                LOG.warning("tmux control-mode connection lost; reconnecting.")
+            connection = AsyncControlModeConnection(socket_name=self.socket_name)
+            try:
+                await connection.start()
+            except TmuxError:
+                LOG.warning(
+                    "tmux control mode unavailable; falling back to subprocesses.", exc_info=True
+                )
+                self._control = None
+                self._control_failed = True
+                return None
+            self._control = connection
+            return connection
+
+    async def _run_subprocess(self, args: Sequence[str]) -> List[str]:
+        binary = shutil.which("tmux")
+        if binary is None:
+            raise TmuxError("tmux binary not found on PATH.")
+        command = [binary]
+        if self.socket_name:
+            command.extend(["-L", self.socket_name])
+        command.extend(args)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except OSError as exc:
+            raise TmuxError(f"tmux command failed: {args[0]}") from exc
+        stdout, stderr = await process.communicate()
+        if process.returncode != 0 or stderr.strip():
+            message = stderr.decode("utf-8", errors="replace").strip()
+            raise TmuxError(message or f"tmux command failed: {args[0]}")
+        lines = stdout.decode("utf-8", errors="replace").splitlines()
+        # Match libtmux, which drops trailing blank lines from command output.
+        while lines and not lines[-1]:
+            lines.pop()
+        return lines
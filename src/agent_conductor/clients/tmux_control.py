@@ -0,0 +1,397 @@
+"""Persistent tmux control-mode (``tmux -C``) connection.
+
+A single control-mode client stays attached to a small helper session and
+every command is written to its stdin. tmux answers each command with a
+``%begin``/``%end`` (or ``%error``) block, in submission order, so replies are
+matched to callers with a FIFO queue instead of forking one ``tmux`` process
+per command.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+import subprocess
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from agent_conductor.clients.tmux import TmuxError
+
+LOG = logging.getLogger(__name__)
+
+CONTROL_SESSION_NAME = "_conductor-control"
+
+
+def quote_argument(value: str) -> str:
+    """Quote a single argument for the tmux command parser."""
+    escaped = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("$", "\\$")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+        .replace("\t", "\\t")
+    )
+    return f'"{escaped}"'
+
+
+def format_command(args: Sequence[str]) -> str:
+    """Render an argv-style tmux command as one control-mode input line."""
+    return " ".join(quote_argument(str(arg)) for arg in args)
+
+
+def control_command(socket_name: Optional[str], session_name: str) -> List[str]:
+    """Return the argv that attaches a control-mode client to ``session_name``."""
+    binary = shutil.which("tmux")
+    if binary is None:
+        raise TmuxError("tmux binary not found on PATH.")
+    command = [binary]
+    if socket_name:
+        command.extend(["-L", socket_name])
+    command.extend(["-C", "new-session", "-A", "-s", session_name])
+    return command
+
+
+def _combine_replies(
+    commands: Sequence[Sequence[str]], replies: Sequence[Tuple[List[str], bool]]
+) -> List[str]:
+    """Concatenate reply output, raising the first failure."""
+    output: List[str] = []
+    for args, (lines, error) in zip(commands, replies):
+        if error:
+            raise TmuxError("\n".join(lines) or f"tmux command failed: {args[0] if args else ''}")
+        output.extend(lines)
+    return output
+
+
+class ReplyParser:
+    """Incremental parser for control-mode output, shared by both connections.
+
+    :meth:`feed` returns ``(output, error)`` whenever a reply block closes.
+    """
+
+    def __init__(self) -> None:
+        self.exited = False
+        self._number: Optional[str] = None
+        self._output: List[str] = []
+
+    def feed(self, line: str) -> Optional[Tuple[List[str], bool]]:
+        if self._number is not None:
+            if line.startswith(("%end ", "%error ")):
+                parts = line.split(" ")
+                if len(parts) >= 3 and parts[2] == self._number:
+                    output, self._output, self._number = self._output, [], None
+                    return output, parts[0] == "%error"
+            self._output.append(line)
+            return None
+
+        if line.startswith("%begin "):
+            parts = line.split(" ")
+            self._number = parts[2] if len(parts) >= 3 else ""
+        elif line.startswith("%exit"):
+            self.exited = True
+        else:
+            # Asynchronous notifications (%window-add, %sessions-changed, ...).
+            LOG.debug("tmux control notification: %s", line)
+        return None
+
+
+class _PendingCommand:
+    """Reply slot for a command awaiting its ``%end``/``%error`` block."""
+
+    __slots__ = ("event", "output", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.output: List[str] = []
+        self.error = False
+
+
+class ControlModeConnection:
+    """Multiplex tmux commands over one long-lived control-mode client."""
+
+    def __init__(
+        self,
+        socket_name: Optional[str] = None,
+        session_name: str = CONTROL_SESSION_NAME,
+        timeout: float = 10.0,
+    ) -> None:
+        self.socket_name = socket_name
+        self.session_name = session_name
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._reader: Optional[threading.Thread] = None
+        self._pending: Deque[_PendingCommand] = deque()
+        self._write_lock = threading.Lock()
+        self._closed = True
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed and self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Spawn the control client and wait for tmux to acknowledge it."""
+        command = control_command(self.socket_name, self.session_name)
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+        except OSError as exc:
+            raise TmuxError("Unable to start tmux control-mode client.") from exc
+
+        # The attach command itself produces the first reply block.
+        startup = _PendingCommand()
+        self._pending.append(startup)
+        self._closed = False
+        self._reader = threading.Thread(
+            target=self._read_loop, name="tmux-control-reader", daemon=True
+        )
+        self._reader.start()
+
+        if not startup.event.wait(self.timeout) or startup.error:
+            self.close()
+            raise TmuxError("tmux control-mode client failed to attach.")
+
+        try:
+            # Pane output is never consumed here; keep tmux from streaming it.
+            self.execute(["refresh-client", "-f", "no-output"])
+        except TmuxError:  # pragma: no cover - tmux < 3.2
+            LOG.debug("tmux does not support refresh-client -f no-output")
+
+    def execute(self, args: Sequence[str], timeout: Optional[float] = None) -> List[str]:
+        """Run one tmux command and return its output lines."""
+        return self.execute_many([args], timeout=timeout)
+
+    def execute_many(
+        self, commands: Sequence[Sequence[str]], timeout: Optional[float] = None
+    ) -> List[str]:
+        """Write several commands in one write and return their combined output.
+
+        Every command still gets its own reply block; the first failure is
+        raised once all replies have arrived.
+        """
+        return _combine_replies(commands, self.execute_each(commands, timeout=timeout))
+
+    def execute_each(
+        self, commands: Sequence[Sequence[str]], timeout: Optional[float] = None
+    ) -> List[Tuple[List[str], bool]]:
+        """Write several commands in one write and return ``(output, error)`` per command."""
+        pending = [_PendingCommand() for _ in commands]
+        payload = "".join(format_command(args) + "\n" for args in commands)
+        with self._write_lock:
+            if not self.alive:
+                raise TmuxError("tmux control-mode connection is closed.")
+            self._pending.extend(pending)
+            try:
+                assert self._process is not None and self._process.stdin is not None
+                self._process.stdin.write(payload.encode("utf-8"))
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as exc:
+                for entry in pending:
+                    self._pending.remove(entry)
+                raise TmuxError("tmux control-mode connection is closed.") from exc
+
+        # A timed-out command stays queued so later replies remain aligned.
+        wait = timeout if timeout is not None else self.timeout
+        replies: List[Tuple[List[str], bool]] = []
+        for args, entry in zip(commands, pending):
+            if not entry.event.wait(wait):
+                raise TmuxError(f"tmux command timed out: {args[0] if args else ''}")
+            replies.append((entry.output, entry.error))
+        return replies
+
+    def close(self) -> None:
+        """Detach the control client; the tmux server and sessions keep running."""
+        with self._write_lock:
+            self._closed = True
+            process = self._process
+            if process is not None and process.stdin is not None:
+                try:
+                    process.stdin.close()
+                except OSError:  # pragma: no cover - already closed
+                    pass
+        if process is not None:
+            try:
+                process.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:  # pragma: no cover - defensive guard
+                process.kill()
+        self._fail_pending()
+
+    def _read_loop(self) -> None:
+        process = self._process
+        assert process is not None and process.stdout is not None
+        parser = ReplyParser()
+
+        for raw in process.stdout:
+            reply = parser.feed(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+            if reply is not None and self._pending:
+                entry = self._pending.popleft()
+                entry.output, entry.error = reply
+                entry.event.set()
+            if parser.exited:
+                break
+
+        self._closed = True
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        while self._pending:
+            pending = self._pending.popleft()
+            pending.error = True
+            pending.output.append("tmux control-mode connection closed.")
+            pending.event.set()
+
+
+class AsyncControlModeConnection:
+    """asyncio counterpart of :class:`ControlModeConnection`.
+
+    Replies are matched to futures in submission order by a reader task, so
+    no thread is blocked while tmux works.
+    """
+
+    # Captures of long scrollback arrive as single very long lines.
+    STREAM_LIMIT = 1 << 20
+
+    def __init__(
+        self,
+        socket_name: Optional[str] = None,
+        session_name: str = CONTROL_SESSION_NAME,
+        timeout: float = 10.0,
+    ) -> None:
+        self.socket_name = socket_name
+        self.session_name = session_name
+        self.timeout = timeout
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._reader: Optional[asyncio.Task[None]] = None
+        self._pending: Deque[asyncio.Future[Tuple[List[str], bool]]] = deque()
+        self._write_lock = asyncio.Lock()
+        self._closed = True
+
+    @property
+    def alive(self) -> bool:
+        return not self._closed and self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        """Spawn the control client and wait for tmux to acknowledge it."""
+        command = control_command(self.socket_name, self.session_name)
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=self.STREAM_LIMIT,
+            )
+        except OSError as exc:
+            raise TmuxError("Unable to start tmux control-mode client.") from exc
+
+        # The attach command itself produces the first reply block.
+        startup: asyncio.Future[Tuple[List[str], bool]] = asyncio.get_running_loop().create_future()
+        self._pending.append(startup)
+        self._closed = False
+        self._reader = asyncio.create_task(self._read_loop(), name="tmux-control-reader")
+
+        try:
+            _, error = await asyncio.wait_for(asyncio.shield(startup), self.timeout)
+        except asyncio.TimeoutError:
+            error = True
+        if error:
+            await self.close()
+            raise TmuxError("tmux control-mode client failed to attach.")
+
+        try:
+            await self.execute(["refresh-client", "-f", "no-output"])
+        except TmuxError:  # pragma: no cover - tmux < 3.2
+            LOG.debug("tmux does not support refresh-client -f no-output")
+
+    async def execute(self, args: Sequence[str], timeout: Optional[float] = None) -> List[str]:
+        """Run one tmux command and return its output lines."""
+        return await self.execute_many([args], timeout=timeout)
+
+    async def execute_many(
+        self, commands: Sequence[Sequence[str]], timeout: Optional[float] = None
+    ) -> List[str]:
+        """Write several commands in one write and return their combined output."""
+        return _combine_replies(commands, await self.execute_each(commands, timeout=timeout))
+
+    async def execute_each(
+        self, commands: Sequence[Sequence[str]], timeout: Optional[float] = None
+    ) -> List[Tuple[List[str], bool]]:
+        """Write several commands in one write and return ``(output, error)`` per command."""
+        loop = asyncio.get_running_loop()
+        pending = [loop.create_future() for _ in commands]
+        payload = "".join(format_command(args) + "\n" for args in commands)
+        async with self._write_lock:
+            if not self.alive:
+                raise TmuxError("tmux control-mode connection is closed.")
+            self._pending.extend(pending)
+            try:
+                assert self._process is not None and self._process.stdin is not None
+                self._process.stdin.write(payload.encode("utf-8"))
+                await self._process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError, OSError) as exc:
+                for entry in pending:
+                    self._pending.remove(entry)
+                raise TmuxError("tmux control-mode connection is closed.") from exc
+
+        # Shielded so a timed-out command stays queued and later replies remain aligned.
+        wait = timeout if timeout is not None else self.timeout
+        replies: List[Tuple[List[str], bool]] = []
+        for args, entry in zip(commands, pending):
+            try:
+                replies.append(await asyncio.wait_for(asyncio.shield(entry), wait))
+            except asyncio.TimeoutError as exc:
+                raise TmuxError(f"tmux command timed out: {args[0] if args else ''}") from exc
+        return replies
+
+    async def close(self) -> None:
+        """Detach the control client; the tmux server and sessions keep running."""
+        self._closed = True
+        process = self._process
+        if process is not None and process.stdin is not None:
+            process.stdin.close()
+        if process is not None:
+            try:
+                await asyncio.wait_for(process.wait(), 2.0)
+            except asyncio.TimeoutError:  # pragma: no cover - defensive guard
+                process.kill()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        self._fail_pending()
+
+    async def _read_loop(self) -> None:
+        process = self._process
+        assert process is not None and process.stdout is not None
+        parser = ReplyParser()
+
+        while True:
+            try:
+                raw = await process.stdout.readline()
+            except (ValueError, asyncio.LimitOverrunError):
+                LOG.warning("tmux control-mode reply exceeded the stream limit.")
+                break
+            if not raw:
+                break
+            reply = parser.feed(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+            if reply is not None and self._pending:
+                entry = self._pending.popleft()
+                if not entry.done():
+                    entry.set_result(reply)
+            if parser.exited:
+                break
+
+        self._closed = True
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        while self._pending:
+            entry = self._pending.popleft()
+            if not entry.done():
+                entry.set_result((["tmux control-mode connection closed."], True))
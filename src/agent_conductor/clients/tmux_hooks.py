@@ -0,0 +1,117 @@
+"""tmux hooks that push pane/window/session lifecycle events to the API server.
+
+The server installs global hooks on startup; each one runs this module in the
+background (``python -m agent_conductor.clients.tmux_hooks <url> <event> ...``),
+which posts a :class:`~agent_conductor.models.tmux_event.TmuxEvent` to
+``POST /tmux/events``. Only the standard library is imported here so the hook
+process starts quickly.
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+import sys
+import urllib.error
+import urllib.request
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from agent_conductor import constants
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from agent_conductor.clients.tmux import TmuxClient
+
+HOOK_EVENTS = ("pane-died", "pane-exited", "window-unlinked", "session-closed", "window-resized")
+
+# Hooks are arrays; a fixed slot keeps installation idempotent and leaves the
+# user's own hooks on these events untouched.
+HOOK_INDEX = 42
+
+EVENTS_PATH = "/tmux/events"
+
+
+def default_events_url() -> str:
+    return f"http://{constants.SERVER_HOST}:{constants.SERVER_PORT}{EVENTS_PATH}"
+
+
+def hook_command(url: str, event: str, socket_name: Optional[str] = None) -> str:
+    """Return the tmux command run by the hook for ``event`` on server ``socket_name``."""
+    shell_command = shlex.join(
+        [
+            sys.executable,
+            "-m",
+            __name__,
+            url,
+            event,
+            "#{hook_pane}",
+            "#{hook_window}",
+            "#{hook_session_name}",
+            socket_name or "",
+        ]
+    )
+    escaped = shell_command.replace("\\", "\\\\").replace('"', '\\"').replace("$", "\\$")
+    return f'run-shell -b "{escaped}"'
+
+
+def build_install_commands(url: str, socket_name: Optional[str] = None) -> List[List[str]]:
+    return [
+        ["set-hook", "-g", f"{event}[{HOOK_INDEX}]", hook_command(url, event, socket_name)]
+        for event in HOOK_EVENTS
+    ]
+
+
+def build_remove_commands() -> List[List[str]]:
+    return [["set-hook", "-gu", f"{event}[{HOOK_INDEX}]"] for event in HOOK_EVENTS]
+
+
+def install_hooks(tmux: TmuxClient, url: Optional[str] = None) -> None:
+    """Install the lifecycle hooks on the tmux server ``tmux`` talks to."""
+    tmux.run_batch(build_install_commands(url or default_events_url(), tmux.socket_name))
+
+
+def remove_hooks(tmux: TmuxClient) -> None:
+    tmux.run_batch(build_remove_commands())
+
+
+def event_payload(
+    event: str, pane_id: str, window_id: str, session_name: str, socket_name: str = ""
+) -> Dict[str, Optional[str]]:
+    return {
+        "event": event,
+        "pane_id": pane_id or None,
+        "window_id": window_id or None,
+        "session_name": session_name or None,
+        "socket_name": socket_name or None,
+    }
+
+
+def post_event(url: str, payload: Dict[str, Optional[str]], timeout: float = 2.0) -> bool:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout):
+            return True
+    except (urllib.error.URLError, OSError):
+        # The server may be down; it reconciles with tmux when it next runs a command.
+        return False
+
+
+def main(argv: Sequence[str]) -> int:
+    if len(argv) not in (5, 6):
+        print(
+            "usage: python -m agent_conductor.clients.tmux_hooks "
+            "URL EVENT PANE_ID WINDOW_ID SESSION_NAME [SOCKET_NAME]",
+            file=sys.stderr,
+        )
+        return 2
+    url, event, *fields = argv
+    post_event(url, event_payload(event, *fields))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
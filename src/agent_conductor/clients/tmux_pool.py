@@ -0,0 +1,178 @@
+"""Pool of pre-started tmux windows used to skip shell startup on terminal creation.
+
+Warm windows wait in a private tmux session, one queue per working directory.
+Claiming one moves it into the requested session, renames it and exports the
+terminal environment into its already-running shell, all in one tmux batch.
+A background thread tops each directory's queue back up.
+"""
+
+from __future__ import annotations
+
+import logging
+import shlex
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+from agent_conductor.clients.tmux import TmuxClient, TmuxError, TmuxPane, build_send_keys
+
+LOG = logging.getLogger(__name__)
+
+POOL_SESSION_NAME = "_conductor-pool"
+WARM_WINDOW_NAME = "warm"
+# Off unless CONDUCTOR_WINDOW_POOL_SIZE asks for warm windows.
+DEFAULT_POOL_SIZE = 0
+
+
+def adopt_window_commands(
+    warm: TmuxPane, session_name: str, window_name: str, pipe_command: Optional[str] = None
+) -> List[List[str]]:
+    """Commands moving a pooled window into ``session_name`` as ``window_name``."""
+    commands = [
+        ["move-window", "-d", "-s", warm.window_id, "-t", f"={session_name}:"],
+        ["rename-window", "-t", warm.window_id, window_name],
+    ]
+    if pipe_command:
+        commands.append(["pipe-pane", "-o", "-t", warm.pane_id, pipe_command])
+    return commands
+
+
+class WindowPool:
+    """Keeps ``size`` idle shell windows ready per working directory."""
+
+    def __init__(
+        self,
+        tmux: TmuxClient,
+        size: int = DEFAULT_POOL_SIZE,
+        session_name: str = POOL_SESSION_NAME,
+    ) -> None:
+        self.tmux = tmux
+        self.size = size
+        self.session_name = session_name
+        self._windows: Dict[Optional[str], Deque[TmuxPane]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._wanted: Set[Optional[str]] = set()
+        self._closed = False
+        self._refiller: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and not self._closed
+
+    def available(self, working_directory: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self._windows.get(working_directory, ()))
+
+    def prime(self, working_directory: Optional[str] = None) -> None:
+        """Ask the background thread to fill the pool for ``working_directory``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._wanted.add(working_directory)
+            if self._refiller is None:
+                self._refiller = threading.Thread(
+                    target=self._refill_loop, name="tmux-window-pool", daemon=True
+                )
+                self._refiller.start()
+            self._wakeup.notify()
+
+    def claim(
+        self,
+        session_name: str,
+        window_name: str,
+        working_directory: Optional[str] = None,
+        environment: Optional[Dict[str, str]] = None,
+        pipe_command: Optional[str] = None,
+    ) -> Optional[TmuxPane]:
+        """Move a warm window into ``session_name``, or return None if none is ready."""
+        if not self.enabled:
+            return None
+        try:
+            while True:
+                with self._lock:
+                    queue = self._windows.get(working_directory)
+                    warm = queue.popleft() if queue else None
+                    if warm is None:
+                        self.misses += 1
+                if warm is None:
+                    return None
+                commands = self._claim_commands(
+                    warm, session_name, window_name, environment, pipe_command
+                )
+                try:
+                    self.tmux.run_batch(commands)
+                except TmuxError:
+                    LOG.debug("Discarding stale warm window %s", warm.window_id, exc_info=True)
+                    continue
+                with self._lock:
+                    self.hits += 1
+                return TmuxPane(session_name, window_name, warm.window_id, warm.pane_id)
+        finally:
+            self.prime(working_directory)
+
+    def close(self) -> None:
+        """Stop refilling and kill the warm windows."""
+        with self._lock:
+            self._closed = True
+            self._windows.clear()
+            self._wakeup.notify_all()
+        refiller = self._refiller
+        if refiller is not None:
+            refiller.join(timeout=5.0)
+        try:
+            self.tmux.kill_session(self.session_name)
+        except TmuxError:
+            LOG.debug("tmux window pool session already gone.")
+
+    @staticmethod
+    def _claim_commands(
+        warm: TmuxPane,
+        session_name: str,
+        window_name: str,
+        environment: Optional[Dict[str, str]],
+        pipe_command: Optional[str],
+    ) -> List[List[str]]:
+        commands = adopt_window_commands(warm, session_name, window_name, pipe_command)
+        # The shell is already running, so the environment is exported into it.
+        exports = [
+            f"export {key}={shlex.quote(value)}" for key, value in (environment or {}).items()
+        ]
+        commands.extend(
+            build_send_keys(warm.pane_id, "; ".join([*exports, "clear"]), suppress_history=True)
+        )
+        return commands
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._wanted and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                directory = self._wanted.pop()
+                missing = self.size - len(self._windows.get(directory, ()))
+            for _ in range(max(missing, 0)):
+                try:
+                    warm = self._spawn(directory)
+                except TmuxError:
+                    LOG.warning("Unable to pre-warm a tmux window for %s", directory, exc_info=True)
+                    break
+                with self._lock:
+                    if self._closed:
+                        return
+                    self._windows.setdefault(directory, deque()).append(warm)
+
+    def _spawn(self, directory: Optional[str]) -> TmuxPane:
+        if not self.tmux.session_exists(self.session_name):
+            try:
+                # The placeholder window keeps the session alive while warm windows move out.
+                self.tmux.create_session(self.session_name, "idle")
+            except TmuxError:
+                if not self.tmux.session_exists(self.session_name):
+                    raise
+        return self.tmux.create_window(
+            self.session_name, WARM_WINDOW_NAME, start_directory=directory
+        )
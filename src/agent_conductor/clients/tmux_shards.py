@@ -0,0 +1,118 @@
+"""Spread conductor sessions across several tmux servers.
+
+tmux runs every command of a server on one thread, so with many panes a busy
+session slows captures and sends for all the others. :class:`TmuxShards`
+hands out one :class:`TmuxClient` (and :class:`AsyncTmuxClient`) per server
+socket (``-L conductor-<n>``); a session lives entirely on one socket, chosen
+by a placement policy when the session is created, and the socket is stored on
+each terminal row so later operations are routed back to it.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, List, Mapping, Optional
+
+from agent_conductor.clients.tmux import TmuxClient
+from agent_conductor.clients.tmux_async import AsyncTmuxClient
+
+SOCKET_PREFIX = "conductor"
+
+PlacementPolicy = Callable[[Mapping[Optional[str], int]], Optional[str]]
+
+
+def least_loaded(load: Mapping[Optional[str], int]) -> Optional[str]:
+    """Pick the socket with the fewest live terminals (first socket on ties)."""
+    return min(load, key=lambda socket: load[socket])
+
+
+def shard_sockets(count: int, prefix: str = SOCKET_PREFIX) -> List[Optional[str]]:
+    """Socket names for ``count`` shards; a single shard uses the default tmux server."""
+    if count <= 1:
+        return [None]
+    return [f"{prefix}-{index}" for index in range(count)]
+
+
+class TmuxShards:
+    """Per-socket tmux clients plus the placement policy for new sessions."""
+
+    def __init__(
+        self,
+        count: int = 1,
+        *,
+        policy: PlacementPolicy = least_loaded,
+        backend: Optional[str] = None,
+        clients: Optional[Mapping[Optional[str], TmuxClient]] = None,
+        async_clients: Optional[Mapping[Optional[str], AsyncTmuxClient]] = None,
+    ) -> None:
+        self.sockets = list(clients) if clients else shard_sockets(count)
+        self.policy = policy
+        self.backend = backend
+        self._clients: Dict[Optional[str], TmuxClient] = dict(clients or {})
+        self._async_clients: Dict[Optional[str], AsyncTmuxClient] = dict(async_clients or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def single(
+        cls, tmux: TmuxClient, async_tmux: Optional[AsyncTmuxClient] = None
+    ) -> "TmuxShards":
+        """Wrap existing clients for one server (the unsharded setup)."""
+        socket = tmux.socket_name
+        return cls(
+            clients={socket: tmux},
+            async_clients={socket: async_tmux} if async_tmux is not None else None,
+        )
+
+    @property
+    def default_socket(self) -> Optional[str]:
+        return self.sockets[0]
+
+    def client(self, socket_name: Optional[str] = None) -> TmuxClient:
+        """Return the client for ``socket_name``, starting it on first use."""
+        with self._lock:
+            client = self._clients.get(socket_name)
+            if client is None:
+                client = self._clients[socket_name] = TmuxClient(
+                    socket_name=socket_name, backend=self.backend
+                )
+            return client
+
+    def async_client(self, socket_name: Optional[str] = None) -> Optional[AsyncTmuxClient]:
+        """Return the asyncio client for ``socket_name``, if asyncio clients are in use."""
+        with self._lock:
+            if not self._async_clients:
+                return None
+            client = self._async_clients.get(socket_name)
+            if client is None:
+                client = self._async_clients[socket_name] = AsyncTmuxClient(
+                    socket_name=socket_name, backend=self.backend
+                )
+            return client
+
+    def enable_async(self) -> None:
+        """Create asyncio clients alongside the sync ones for every shard."""
+        with self._lock:
+            for socket in self.sockets:
+                if socket not in self._async_clients:
+                    self._async_clients[socket] = AsyncTmuxClient(
+                        socket_name=socket, backend=self.backend
+                    )
+
+    def place(self, load: Mapping[Optional[str], int]) -> Optional[str]:
+        """Choose the socket for a new session given live terminal counts per socket."""
+        return self.policy({socket: load.get(socket, 0) for socket in self.sockets})
+
+    def clients(self) -> Dict[Optional[str], TmuxClient]:
+        return {socket: self.client(socket) for socket in self.sockets}
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+        for client in clients:
+            client.close()
+
+    async def aclose(self) -> None:
+        with self._lock:
+            clients = list(self._async_clients.values())
+        for client in clients:
+            await client.close()
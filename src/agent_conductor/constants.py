@@ -13,6 +13,14 @@ AGENT_CONTEXT_DIR = HOME_DIR / "agent-context"
 FLOWS_DIR = HOME_DIR / "flows"
 APPROVALS_DIR = HOME_DIR / "approvals"
 SESSION_PREFIX = "conductor-"
+# Terminal role of the session's first terminal; window names start with the role.
+SUPERVISOR_ROLE = "supervisor"
 SERVER_HOST = "127.0.0.1"
 SERVER_PORT = 9889
 TERMINAL_ENV_VAR = "CONDUCTOR_TERMINAL_ID"
+TMUX_BACKEND_ENV_VAR = "CONDUCTOR_TMUX_BACKEND"
+WINDOW_POOL_SIZE_ENV_VAR = "CONDUCTOR_WINDOW_POOL_SIZE"
+TMUX_SHARDS_ENV_VAR = "CONDUCTOR_TMUX_SHARDS"
+STARTUP_CONCURRENCY_ENV_VAR = "CONDUCTOR_STARTUP_CONCURRENCY"
+PROVIDER_POOL_SIZE_ENV_VAR = "CONDUCTOR_PROVIDER_POOL_SIZE"
+STRUCTURED_OUTPUT_ENV_VAR = "CONDUCTOR_STRUCTURED_OUTPUT"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from typing import Any, Dict, Optional
 
 import httpx
@@ -34,6 +35,14 @@ def _request(method: str, path: str, payload: Optional[Dict[str, Any]] = None) -
     return response.json() if response.content else None
 
 
+def _wait_until_started(terminal: Dict[str, Any], timeout: float = 180) -> Dict[str, Any]:
+    """Long-poll the API until a new terminal leaves STARTING (or ``timeout`` passes)."""
+    deadline = time.monotonic() + timeout
+    while terminal.get("status") == "STARTING" and time.monotonic() < deadline:
+        terminal = _request("GET", f"/terminals/{terminal['id']}/wait?timeout=30")
+    return terminal
+
+
 def send_message(receiver_id: str, message: str) -> Dict[str, Any]:
     """Queue a message for another terminal."""
     sender_id = _terminal_id()
@@ -55,6 +64,9 @@ def handoff(
         {"provider": provider, "agent_profile": agent_profile, "role": role},
     )
     worker_id = worker["id"]
+    worker = _wait_until_started(worker)
+    if worker["status"] in ("STARTING", "ERROR", "EXITED"):
+        raise MCPError(f"Worker {worker_id} failed to start (status {worker['status']}).")
     _request("POST", f"/terminals/{worker_id}/input", {"message": message})
     # Returns worker metadata; caller can poll output as needed.
     return worker
@@ -67,7 +79,10 @@ def assign(
     message: str,
     role: str = "worker",
 ) -> Dict[str, Any]:
-    """Create a worker terminal asynchronously."""
+    """Create a worker terminal asynchronously.
+
+    The message is queued in the inbox and delivered once the worker has started.
+    """
     worker = _request(
         "POST",
         f"/sessions/{session_name}/terminals",
@@ -6,10 +6,12 @@ from enum import Enum
 
 
 class TerminalStatus(str, Enum):
+    STARTING = "STARTING"
     READY = "READY"
     RUNNING = "RUNNING"
     COMPLETED = "COMPLETED"
     ERROR = "ERROR"
+    EXITED = "EXITED"
 
 
 class InboxStatus(str, Enum):
@@ -16,8 +16,13 @@ class Terminal(BaseModel):
     id: str
     session_name: str
     window_name: str
+    tmux_window_id: Optional[str] = None
+    tmux_pane_id: Optional[str] = None
+    tmux_socket: Optional[str] = None
+    role: str = "worker"
     provider: str
     agent_profile: Optional[str] = None
+    working_directory: Optional[str] = None
     status: TerminalStatus
     created_at: Optional[datetime] = None
 
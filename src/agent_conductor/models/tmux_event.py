@@ -0,0 +1,17 @@
+"""Models for events pushed by tmux hooks."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class TmuxEvent(BaseModel):
+    """Lifecycle notification posted by the hooks in ``clients/tmux_hooks.py``."""
+
+    event: str
+    pane_id: Optional[str] = None
+    window_id: Optional[str] = None
+    session_name: Optional[str] = None
+    socket_name: Optional[str] = None
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, ClassVar, Optional, Set
 
-from agent_conductor.clients.tmux import TmuxClient
+from agent_conductor.clients.tmux import PaneCursor, PaneDelta, TmuxClient
 from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.providers.status_engine import StatusEngine
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from agent_conductor.clients.tmux_async import AsyncTmuxClient
+    from agent_conductor.services.status_tracker import StatusTracker
 
 
 class ProviderInitializationError(RuntimeError):
@@ -15,7 +21,17 @@ class ProviderInitializationError(RuntimeError):
 
 
 class BaseProvider(ABC):
-    """Abstract interface for CLI providers."""
+    """Abstract interface for CLI providers.
+
+    Providers that set ``status_engine`` get :meth:`get_status` for free. With
+    a ``status_tracker`` the status comes from the terminal's pane log;
+    otherwise each call reads the pane delta since the previous poll and
+    evaluates the engine's rules against it.
+    """
+
+    status_engine: ClassVar[Optional[StatusEngine]] = None
+    # Headless providers run their CLI as a subprocess, without a tmux window.
+    headless: ClassVar[bool] = False
 
     def __init__(
         self,
@@ -24,13 +40,25 @@ class BaseProvider(ABC):
         window_name: str,
         agent_profile: Optional[str],
         tmux: TmuxClient,
+        pane_id: Optional[str] = None,
     ) -> None:
         self.terminal_id = terminal_id
         self.session_name = session_name
         self.window_name = window_name
         self.agent_profile = agent_profile
         self.tmux = tmux
+        self.pane_id = pane_id
+        # Set by ProviderManager when the server runs an asyncio tmux client.
+        self.async_tmux: Optional[AsyncTmuxClient] = None
+        # Set by ProviderManager when pane logs are tailed for status.
+        self.status_tracker: Optional[StatusTracker] = None
+        # Set by ProviderManager; tmux providers start in their window's directory instead.
+        self.working_directory: Optional[str] = None
+        # Set by ProviderManager; providers that can read structured output opt in.
+        self.structured_output = False
         self._status = TerminalStatus.READY
+        self._status_cursor = PaneCursor()
+        self._latched: Set[str] = set()
 
     @property
     def status(self) -> TerminalStatus:
@@ -40,19 +68,91 @@ class BaseProvider(ABC):
         """Launch the provider inside the tmux window."""
         command = self.build_startup_command()
         if command:
-            self.tmux.send_keys(self.session_name, self.window_name, command)
+            self.tmux.send_keys(self.session_name, self.window_name, command, pane_id=self.pane_id)
+        self._status = TerminalStatus.READY
+
+    def reattach(self) -> None:
+        """Take over a CLI started by a previous server process; :meth:`initialize` is not run."""
+
+    @classmethod
+    def supports_warm_start(cls, agent_profile: Optional[str]) -> bool:
+        """Whether ``agent_profile`` can be applied to a CLI from :meth:`start_idle`.
+
+        With ``None``, whether the provider can be pre-started at all.
+        """
+        return False
+
+    def start_idle(self) -> None:
+        """Launch the CLI without a persona and wait until it is idle (provider pool)."""
+        raise ProviderInitializationError(
+            f"{type(self).__name__} cannot be started ahead of its terminal."
+        )
+
+    def apply_persona(self) -> None:
+        """Apply ``agent_profile`` to a CLI that was started by :meth:`start_idle`."""
         self._status = TerminalStatus.READY
 
     def send_input(self, message: str) -> None:
         """Send keystrokes to the provider process."""
         self._status = TerminalStatus.RUNNING
-        self.tmux.send_keys(self.session_name, self.window_name, message)
+        self.tmux.send_keys(self.session_name, self.window_name, message, pane_id=self.pane_id)
         self._status = TerminalStatus.READY
 
+    def send_briefing(self, message: str) -> None:
+        """Give the CLI standing instructions, such as the worker bootstrap."""
+        self.send_input(message)
+
     def get_status(self) -> TerminalStatus:
         """Return current status."""
+        if self.status_engine is None:
+            return self._status
+        if self._refresh_from_log():
+            return self._status
+        delta = self.tmux.capture_pane_delta(
+            self.session_name, self.window_name, self._status_cursor, pane_id=self.pane_id
+        )
+        return self._status_from_delta(delta)
+
+    async def send_input_async(self, message: str) -> None:
+        """Awaitable :meth:`send_input`; runs in a worker thread without ``async_tmux``."""
+        if self.async_tmux is None:
+            await asyncio.to_thread(self.send_input, message)
+            return
+        self._status = TerminalStatus.RUNNING
+        await self.async_tmux.send_keys(
+            self.session_name, self.window_name, message, pane_id=self.pane_id
+        )
+        self._status = TerminalStatus.READY
+
+    async def get_status_async(self) -> TerminalStatus:
+        """Awaitable :meth:`get_status`."""
+        if self.status_engine is not None and self._refresh_from_log():
+            return self._status
+        if self.status_engine is None or self.async_tmux is None:
+            return await asyncio.to_thread(self.get_status)
+        delta = await self.async_tmux.capture_pane_delta(
+            self.session_name, self.window_name, self._status_cursor, pane_id=self.pane_id
+        )
+        return self._status_from_delta(delta)
+
+    def _refresh_from_log(self) -> bool:
+        """Update ``_status`` from the tracked pane log; False if there is none yet."""
+        if self.status_tracker is None:
+            return False
+        state = self.status_tracker.refresh(self.terminal_id)
+        if state is None:
+            return False
+        self._status = state.status
+        return True
+
+    def _status_from_delta(self, delta: PaneDelta) -> TerminalStatus:
+        self._status = self.status_engine.evaluate(delta, self._latched)
         return self._status
 
+    def last_response(self) -> Optional[str]:
+        """The last answer from structured output, or None to scrape the history instead."""
+        return None
+
     def extract_last_message_from_history(self, history: str) -> str:
         """Return last non-empty block from tmux history."""
         lines = [line.strip() for line in history.rstrip().splitlines() if line.strip()]
@@ -60,7 +160,7 @@ class BaseProvider(ABC):
 
     def cleanup(self) -> None:
         """Terminate the provider gracefully."""
-        self.tmux.send_keys(self.session_name, self.window_name, "exit")
+        self.tmux.send_keys(self.session_name, self.window_name, "exit", pane_id=self.pane_id)
         self._status = TerminalStatus.COMPLETED
 
     @abstractmethod
@@ -77,3 +177,11 @@ class BaseProvider(ABC):
     def detect_interactive_prompt(self) -> Optional[str]:  # pragma: no cover - default noop
         """Return a textual prompt requiring operator attention, or None if idle."""
         return None
+
+    async def detect_interactive_prompt_async(self) -> Optional[str]:
+        """Awaitable :meth:`detect_interactive_prompt`."""
+        return await asyncio.to_thread(self.detect_interactive_prompt)
+
+    def interactive_prompt_from_screen(self, screen: str) -> Optional[str]:
+        """Like :meth:`detect_interactive_prompt`, for a screen captured by the caller."""
+        return None
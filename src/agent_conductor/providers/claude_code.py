@@ -6,11 +6,15 @@ import logging
 import re
 import shlex
 import time
-from typing import Optional
+import uuid
+from typing import List, Optional
 
 from agent_conductor.clients.tmux import TmuxError
+from agent_conductor.models.agent_profile import AgentProfile
 from agent_conductor.models.enums import TerminalStatus
 from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
+from agent_conductor.providers.claude_transcript import ClaudeTranscript
+from agent_conductor.providers.status_engine import Latch, StatusEngine, StatusRule
 from agent_conductor.utils.agent_profiles import AgentProfileError, load_agent_profile
 
 ANSI_CODE_PATTERN = r"\x1b\[[0-9;]*m"
@@ -19,12 +23,65 @@ PROCESSING_PATTERN = r"[✶✢✽✻·✳].*….*\(esc to interrupt.*\)"
 IDLE_PROMPT_PATTERN = r">[\s\xa0]"
 WAITING_USER_ANSWER_PATTERN = r"❯.*\d+\."
 
+ANSI_CODE_RE = re.compile(ANSI_CODE_PATTERN)
+RESPONSE_RE = re.compile(RESPONSE_PATTERN)
+IDLE_PROMPT_RE = re.compile(IDLE_PROMPT_PATTERN)
+WAITING_USER_ANSWER_RE = re.compile(WAITING_USER_ANSWER_PATTERN)
+INPUT_LINE_RE = re.compile(r">\s")
+
+# Responses scroll into history, so a printed response is latched; everything
+# else describes the current state and lives at the bottom of the screen.
+STATUS_ENGINE = StatusEngine(
+    rules=[
+        StatusRule(TerminalStatus.RUNNING, re.compile(PROCESSING_PATTERN)),
+        StatusRule(TerminalStatus.RUNNING, WAITING_USER_ANSWER_RE, prompt=True),
+        StatusRule(TerminalStatus.COMPLETED, IDLE_PROMPT_RE, latch="response"),
+        StatusRule(TerminalStatus.READY, IDLE_PROMPT_RE),
+    ],
+    latches=[Latch("response", RESPONSE_RE)],
+)
+
+# First message for a pre-started CLI, which was launched without the persona.
+PERSONA_MESSAGE = (
+    "Adopt the following instructions as your role for the rest of this session:\n\n"
+    "{prompt}\n\n"
+    "Reply with a one-line confirmation and wait for your first task."
+)
+
 LOG = logging.getLogger(__name__)
 
 
+def conversation_uuid(terminal_id: str) -> str:
+    """Claude session ID of a terminal; derived, so it survives re-attaching."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"agent-conductor:{terminal_id}"))
+
+
+def profile_prompt(profile: AgentProfile) -> str:
+    """The profile's prompt and body, as Claude Code's appended system prompt."""
+    prompt_sections = []
+    if profile.prompt:
+        prompt_sections.append(profile.prompt.strip())
+    if profile.body:
+        prompt_sections.append(profile.body.strip())
+    return "\n\n".join(filter(None, prompt_sections)).strip()
+
+
+def claude_options(profile: AgentProfile) -> List[str]:
+    """Unquoted ``claude`` arguments applying ``profile`` (system prompt, MCP servers)."""
+    options: List[str] = []
+    system_prompt = profile_prompt(profile)
+    if system_prompt:
+        options.extend(["--append-system-prompt", system_prompt])
+    if profile.mcpServers:
+        options.extend(["--mcp-config", profile.model_dump_json(include={"mcpServers"})])
+    return options
+
+
 class ClaudeCodeProvider(BaseProvider):
     """Provider that manages the Claude Code CLI inside tmux."""
 
+    status_engine = STATUS_ENGINE
+
     def __init__(
         self,
         terminal_id: str,
@@ -32,44 +89,83 @@ class ClaudeCodeProvider(BaseProvider):
         window_name: str,
         agent_profile: Optional[str],
         tmux,
+        pane_id: Optional[str] = None,
     ) -> None:
-        super().__init__(terminal_id, session_name, window_name, agent_profile, tmux)
+        super().__init__(terminal_id, session_name, window_name, agent_profile, tmux, pane_id)
         self._initialized = False
         self._last_prompt_signature: Optional[int] = None
+        self._transcript: Optional[ClaudeTranscript] = None
+
+    @property
+    def conversation_id(self) -> str:
+        return conversation_uuid(self.terminal_id)
+
+    def _session_options(self) -> list[str]:
+        # A known session ID lets last_response() follow the session transcript.
+        return ["--session-id", self.conversation_id] if self.structured_output else []
 
     def build_startup_command(self) -> Optional[str]:
         """Not used – command is assembled in initialize."""
         return None
 
-    def _build_claude_command(self) -> list[str]:
-        command_parts = ["claude"]
+    @classmethod
+    def supports_warm_start(cls, agent_profile: Optional[str]) -> bool:
+        # MCP servers are a launch flag, so such profiles need a CLI of their own.
+        if not agent_profile:
+            return True
+        try:
+            return not load_agent_profile(agent_profile).mcpServers
+        except AgentProfileError:
+            return False
+
+    def _system_prompt(self) -> str:
+        if not self.agent_profile:
+            return ""
+        return profile_prompt(self._load_profile())
+
+    def _load_profile(self):
+        try:
+            return load_agent_profile(self.agent_profile)
+        except AgentProfileError as exc:
+            raise ProviderInitializationError(str(exc)) from exc
 
+    def _build_claude_command(self) -> list[str]:
+        options = self._session_options()
         if self.agent_profile:
-            try:
-                profile = load_agent_profile(self.agent_profile)
-            except AgentProfileError as exc:
-                raise ProviderInitializationError(str(exc)) from exc
+            options.extend(claude_options(self._load_profile()))
+        return ["claude", *(shlex.quote(part) for part in options)]
 
-            prompt_sections = []
-            if profile.prompt:
-                prompt_sections.append(profile.prompt.strip())
-            if profile.body:
-                prompt_sections.append(profile.body.strip())
-            system_prompt = "\n\n".join(filter(None, prompt_sections)).strip()
+    def initialize(self) -> None:
+        self.ensure_binary_exists("claude")
+        self._launch(" ".join(self._build_claude_command()))
 
-            if system_prompt:
-                command_parts.extend(["--append-system-prompt", shlex.quote(system_prompt)])
+    def start_idle(self) -> None:
+        self.ensure_binary_exists("claude")
+        self._launch(" ".join(["claude", *self._session_options()]))
 
-            if profile.mcpServers:
-                mcp_json = profile.model_dump_json(include={"mcpServers"})
-                command_parts.extend(["--mcp-config", shlex.quote(mcp_json)])
+    def apply_persona(self) -> None:
+        """Send the profile prompt as the first message and wait for Claude's reply.
 
-        return command_parts
+        The reply leaves a response on screen, so the terminal then reports
+        COMPLETED when idle, as after any finished turn.
+        """
+        self._initialized = True
+        system_prompt = self._system_prompt()
+        if system_prompt:
+            self.tmux.send_keys(
+                self.session_name,
+                self.window_name,
+                PERSONA_MESSAGE.format(prompt=system_prompt),
+                pane_id=self.pane_id,
+            )
+            if not self._wait_for_status(TerminalStatus.COMPLETED, timeout=60.0):
+                raise ProviderInitializationError(
+                    "Claude Code did not acknowledge the persona prompt."
+                )
+        self._status = TerminalStatus.READY
 
-    def initialize(self) -> None:
-        self.ensure_binary_exists("claude")
-        command = " ".join(self._build_claude_command())
-        self.tmux.send_keys(self.session_name, self.window_name, command)
+    def _launch(self, command: str) -> None:
+        self.tmux.send_keys(self.session_name, self.window_name, command, pane_id=self.pane_id)
 
         if not self._wait_for_status(TerminalStatus.READY, timeout=30.0):
             raise ProviderInitializationError("Claude Code initialization timed out.")
@@ -88,34 +184,16 @@ class ClaudeCodeProvider(BaseProvider):
             time.sleep(polling_interval)
         return False
 
-    def get_status(self) -> TerminalStatus:
-        output = self.tmux.capture_pane(self.session_name, self.window_name)
-
-        if not output:
-            self._status = TerminalStatus.RUNNING
-            return self._status
-
-        if re.search(PROCESSING_PATTERN, output):
-            self._status = TerminalStatus.RUNNING
-            return self._status
-
-        if re.search(WAITING_USER_ANSWER_PATTERN, output):
-            self._status = TerminalStatus.RUNNING
-            return self._status
-
-        if re.search(RESPONSE_PATTERN, output) and re.search(IDLE_PROMPT_PATTERN, output):
-            self._status = TerminalStatus.COMPLETED
-            return self._status
-
-        if re.search(IDLE_PROMPT_PATTERN, output):
-            self._status = TerminalStatus.READY
-            return self._status
-
-        self._status = TerminalStatus.RUNNING
-        return self._status
+    def last_response(self) -> Optional[str]:
+        """Read the last answer from the session transcript (structured output only)."""
+        if not self.structured_output:
+            return None
+        if self._transcript is None:
+            self._transcript = ClaudeTranscript(self.conversation_id)
+        return self._transcript.refresh()
 
     def extract_last_message_from_history(self, history: str) -> str:
-        matches = list(re.finditer(RESPONSE_PATTERN, history))
+        matches = list(RESPONSE_RE.finditer(history))
         if not matches:
             raise ValueError("No Claude Code response detected in history.")
 
@@ -124,7 +202,7 @@ class ClaudeCodeProvider(BaseProvider):
 
         response_lines = []
         for line in remaining_text.splitlines():
-            if re.match(r">\s", line) or "────────" in line:
+            if INPUT_LINE_RE.match(line) or "────────" in line:
                 break
             stripped = line.strip()
             if stripped:
@@ -134,13 +212,15 @@ class ClaudeCodeProvider(BaseProvider):
             raise ValueError("Claude Code response was empty after ⏺ marker.")
 
         final_answer = "\n".join(response_lines).strip()
-        final_answer = re.sub(ANSI_CODE_PATTERN, "", final_answer)
+        final_answer = ANSI_CODE_RE.sub("", final_answer)
         return final_answer.strip()
 
     def cleanup(self) -> None:
         if self._initialized:
             try:
-                self.tmux.send_keys(self.session_name, self.window_name, "/exit")
+                self.tmux.send_keys(
+                    self.session_name, self.window_name, "/exit", pane_id=self.pane_id
+                )
             except TmuxError:
                 LOG.warning(
                     "Skipping exit command for %s/%s — tmux window no longer exists.",
@@ -151,8 +231,22 @@ class ClaudeCodeProvider(BaseProvider):
 
     def detect_interactive_prompt(self) -> Optional[str]:
         """Return the latest Claude Code choice prompt, if one is awaiting input."""
-        history = self.tmux.capture_pane(self.session_name, self.window_name)
-        snippet = self._extract_choice_prompt(history)
+        # A pending menu is always on the visible screen; skip the scrollback.
+        screen = self.tmux.capture_pane(
+            self.session_name, self.window_name, start=0, pane_id=self.pane_id
+        )
+        return self.interactive_prompt_from_screen(screen)
+
+    async def detect_interactive_prompt_async(self) -> Optional[str]:
+        if self.async_tmux is None:
+            return await super().detect_interactive_prompt_async()
+        screen = await self.async_tmux.capture_pane(
+            self.session_name, self.window_name, start=0, pane_id=self.pane_id
+        )
+        return self.interactive_prompt_from_screen(screen)
+
+    def interactive_prompt_from_screen(self, screen: str) -> Optional[str]:
+        snippet = self._extract_choice_prompt(screen)
 
         if not snippet:
             self._last_prompt_signature = None
@@ -174,7 +268,7 @@ class ClaudeCodeProvider(BaseProvider):
         prompt_index: Optional[int] = None
         for idx in range(len(lines) - 1, -1, -1):
             line = lines[idx]
-            if re.search(WAITING_USER_ANSWER_PATTERN, line) or line.strip().startswith("❯"):
+            if WAITING_USER_ANSWER_RE.search(line) or line.strip().startswith("❯"):
                 prompt_index = idx
                 break
 
@@ -184,12 +278,12 @@ class ClaudeCodeProvider(BaseProvider):
         header_lines: list[str] = []
         i = prompt_index - 1
         while i >= 0 and lines[i].strip() and not lines[i].strip().startswith(">"):
-            header_lines.insert(0, re.sub(ANSI_CODE_PATTERN, "", lines[i]).strip())
+            header_lines.insert(0, ANSI_CODE_RE.sub("", lines[i]).strip())
             i -= 1
 
         option_lines: list[str] = []
         for line in lines[prompt_index:]:
-            stripped = re.sub(ANSI_CODE_PATTERN, "", line).rstrip()
+            stripped = ANSI_CODE_RE.sub("", line).rstrip()
             if not stripped:
                 break
             if stripped.lstrip().startswith(">"):
@@ -0,0 +1,116 @@
+"""Incremental reader for Claude Code session transcripts.
+
+Besides drawing its TUI, Claude Code appends every message of a session to
+``~/.claude/projects/<project>/<session-id>.jsonl`` as one JSON object per
+line. When the CLI is launched with a known ``--session-id``,
+:class:`ClaudeTranscript` follows that file from its last offset and keeps the
+parsed turns, so the last assistant answer is a lookup instead of a regex scan
+over the pane history.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+LOG = logging.getLogger(__name__)
+
+CONFIG_DIR_ENV_VAR = "CLAUDE_CONFIG_DIR"
+
+
+def default_projects_dir() -> Path:
+    config_dir = os.environ.get(CONFIG_DIR_ENV_VAR)
+    return (Path(config_dir) if config_dir else Path.home() / ".claude") / "projects"
+
+
+@dataclass
+class TranscriptTurn:
+    """A user prompt and the text of the last assistant message that followed it."""
+
+    prompt: str
+    reply: Optional[str] = None
+    # ID of the assistant message ``reply`` came from.
+    _message_id: Optional[str] = field(default=None, repr=False)
+
+
+def _text_blocks(content: Any) -> List[str]:
+    if isinstance(content, str):
+        return [content]
+    if not isinstance(content, list):
+        return []
+    return [
+        block.get("text", "")
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    ]
+
+
+class ClaudeTranscript:
+    """Parsed turns of one Claude Code session, read incrementally."""
+
+    def __init__(self, session_id: str, projects_dir: Optional[Path] = None) -> None:
+        self.session_id = session_id
+        self.projects_dir = projects_dir or default_projects_dir()
+        self.path: Optional[Path] = None
+        self.turns: List[TranscriptTurn] = []
+        self.last_message: Optional[str] = None
+        self._offset = 0
+        self._partial = b""
+
+    def refresh(self) -> Optional[str]:
+        """Parse lines appended since the last call and return the last assistant message."""
+        path = self._locate()
+        if path is None:
+            return self.last_message
+        try:
+            with open(path, "rb") as handle:
+                handle.seek(self._offset)
+                data = handle.read()
+        except FileNotFoundError:
+            return self.last_message
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        # The CLI may be mid-write; an unterminated line is kept for the next read.
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self._apply(line)
+        return self.last_message
+
+    def _locate(self) -> Optional[Path]:
+        if self.path is None:
+            # The project directory name is derived from the CLI's working directory.
+            matches = list(self.projects_dir.glob(f"*/{self.session_id}.jsonl"))
+            if matches:
+                self.path = matches[0]
+        return self.path
+
+    def _apply(self, line: bytes) -> None:
+        try:
+            record: Dict[str, Any] = json.loads(line)
+        except ValueError:
+            LOG.debug("Skipping malformed transcript line in %s", self.path)
+            return
+        message = record.get("message")
+        if not isinstance(message, dict) or record.get("isSidechain"):
+            return
+        texts = [text for text in _text_blocks(message.get("content")) if text.strip()]
+        if record.get("type") == "user":
+            # Tool results come back as user records without text blocks.
+            if texts and not record.get("isMeta"):
+                self.turns.append(TranscriptTurn(prompt="\n".join(texts)))
+        elif record.get("type") == "assistant" and texts:
+            if not self.turns:
+                self.turns.append(TranscriptTurn(prompt=""))
+            turn = self.turns[-1]
+            message_id = message.get("id")
+            text = "\n".join(texts)
+            # One assistant message may be written as several records.
+            same_message = message_id is not None and message_id == turn._message_id
+            turn.reply = f"{turn.reply}\n{text}" if same_message and turn.reply else text
+            turn._message_id = message_id
+            self.last_message = turn.reply.strip()
@@ -7,10 +7,18 @@ import re
 import shlex
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
+from agent_conductor.clients.tmux import PaneCursor
+from agent_conductor.models.agent_profile import AgentProfile
 from agent_conductor.models.enums import TerminalStatus
 from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
+from agent_conductor.providers.status_engine import (
+    Latch,
+    StatusEngine,
+    StatusRule,
+    compile_any,
+)
 from agent_conductor.utils.agent_profiles import AgentProfileError, load_agent_profile
 
 LOG = logging.getLogger(__name__)
@@ -36,19 +44,94 @@ HARD_ERROR_PATTERNS = [
     r"failed to initialize rollout recorder",
     r"rollout recorder: (?:operation not permitted|permission denied)",
     r"agent loop died",
-    r"fatal error",
-    r"panic",
     r"Failed to create session",
+    # Bare "panic"/"fatal error" also occur in answers (a Go stack trace being
+    # explained); once latched they would never clear. Only Codex's own "■"
+    # error lines and the Rust panic banner of the CLI itself count.
+    r"^■ .*(?:panic|fatal error)",
+    r"^thread '[^']*' panicked at",
 ]
 
-COMPILED_READY = [re.compile(p, re.IGNORECASE) for p in READY_PATTERNS]
-COMPILED_BUSY = [re.compile(p, re.IGNORECASE) for p in BUSY_PATTERNS]
-COMPILED_ERRORS = [re.compile(p, re.IGNORECASE) for p in HARD_ERROR_PATTERNS]
+# Profile variables read when the codex command is built (see codex_environment).
+LAUNCH_VARIABLES = frozenset(
+    {
+        "codex_args",
+        "codex_env",
+        "HOME",
+        "TMPDIR",
+        "XDG_STATE_HOME",
+        "XDG_CACHE_HOME",
+        "CODEX_DISABLE_RECORDER",
+        "CODEX_ROLLOUT_DIR",
+    }
+)
+
+# Matched against lower-cased text (the status engine runs with ignore_case).
+ANY_READY_RE = compile_any(pattern.lower() for pattern in READY_PATTERNS)
+ANY_BUSY_RE = compile_any(pattern.lower() for pattern in BUSY_PATTERNS)
+ANY_ERROR_RE = compile_any(
+    (pattern.lower() for pattern in HARD_ERROR_PATTERNS), re.MULTILINE
+)
+
+# Fatal errors may scroll away before the next poll, so they are latched;
+# busy/ready markers only count while they are on screen.
+STATUS_ENGINE = StatusEngine(
+    rules=[
+        StatusRule(TerminalStatus.ERROR, latch="error"),
+        StatusRule(TerminalStatus.READY, PROMPT_RE, last_line=True),
+        StatusRule(TerminalStatus.RUNNING, ANY_BUSY_RE),
+        StatusRule(TerminalStatus.READY, ANY_READY_RE),
+    ],
+    latches=[Latch("error", ANY_ERROR_RE)],
+    ignore_case=True,
+)
+
+
+def _variable(profile: Optional[AgentProfile], key: str) -> Optional[str]:
+    return (profile.variables or {}).get(key) if profile else None
+
+
+def codex_environment(terminal_id: str, profile: Optional[AgentProfile]) -> Dict[str, str]:
+    """Environment giving Codex a writable HOME/TMP per terminal, with the recorder disabled."""
+    base_path = Path.home() / ".conductor" / "providers" / "codex" / terminal_id
+    for sub in ("tmp", "state", "cache", "rollouts"):
+        (base_path / sub).mkdir(parents=True, exist_ok=True)
+
+    base = str(base_path)
+    environment = {
+        "HOME": _variable(profile, "HOME") or str(Path.home() / ".conductor"),
+        "TMPDIR": _variable(profile, "TMPDIR") or f"{base}/tmp",
+        "XDG_STATE_HOME": _variable(profile, "XDG_STATE_HOME") or f"{base}/state",
+        "XDG_CACHE_HOME": _variable(profile, "XDG_CACHE_HOME") or f"{base}/cache",
+        "CODEX_DISABLE_RECORDER": _variable(profile, "CODEX_DISABLE_RECORDER") or "1",
+        "CODEX_ROLLOUT_DIR": _variable(profile, "CODEX_ROLLOUT_DIR") or f"{base}/rollouts",
+    }
+
+    extra_env = _variable(profile, "codex_env")
+    if extra_env:
+        for pair in shlex.split(extra_env):
+            if "=" in pair:
+                key, value = pair.split("=", 1)
+                environment[key] = value
+    return environment
+
+
+def codex_options(profile: Optional[AgentProfile]) -> List[str]:
+    """Model and extra arguments a profile adds to any codex command."""
+    options: List[str] = []
+    if profile and profile.model:
+        options.extend(["--model", profile.model])
+    extra_args = _variable(profile, "codex_args")
+    if extra_args:
+        options.extend(shlex.split(extra_args))
+    return options
 
 
 class CodexProvider(BaseProvider):
     """Provider that manages the Codex CLI inside tmux."""
 
+    status_engine = STATUS_ENGINE
+
     def __init__(
         self,
         terminal_id: str,
@@ -56,8 +139,9 @@ class CodexProvider(BaseProvider):
         window_name: str,
         agent_profile: Optional[str],
         tmux,
+        pane_id: Optional[str] = None,
     ) -> None:
-        super().__init__(terminal_id, session_name, window_name, agent_profile, tmux)
+        super().__init__(terminal_id, session_name, window_name, agent_profile, tmux, pane_id)
         self._profile = None
         self._persona_seeded = False
         if agent_profile:
@@ -71,78 +155,65 @@ class CodexProvider(BaseProvider):
         return None
 
     def _profile_var(self, key: str) -> Optional[str]:
-        if not self._profile:
-            return None
-        return (self._profile.variables or {}).get(key)
+        return _variable(self._profile, key)
 
     def _build_env_prefix(self) -> list[str]:
         """Return ['env', KEY=VAL, ...] so Codex has a writable HOME/TMP and recorder disabled."""
-        base_path = Path.home() / ".conductor" / "providers" / "codex" / self.terminal_id
-        for sub in ("tmp", "state", "cache", "rollouts"):
-            (base_path / sub).mkdir(parents=True, exist_ok=True)
-
-        base = str(base_path)
-        defaults = {
-            "HOME": self._profile_var("HOME") or str(Path.home() / ".conductor"),
-            "TMPDIR": self._profile_var("TMPDIR") or f"{base}/tmp",
-            "XDG_STATE_HOME": self._profile_var("XDG_STATE_HOME") or f"{base}/state",
-            "XDG_CACHE_HOME": self._profile_var("XDG_CACHE_HOME") or f"{base}/cache",
-            "CODEX_DISABLE_RECORDER": self._profile_var("CODEX_DISABLE_RECORDER") or "1",
-            "CODEX_ROLLOUT_DIR": self._profile_var("CODEX_ROLLOUT_DIR") or f"{base}/rollouts",
-        }
-
-        extra_env = self._profile_var("codex_env")
-        if extra_env:
-            for pair in shlex.split(extra_env):
-                if "=" in pair:
-                    key, value = pair.split("=", 1)
-                    defaults[key] = value
-
-        env_prefix = ["env"]
-        env_prefix.extend(f"{k}={v}" for k, v in defaults.items())
-        return env_prefix
+        environment = codex_environment(self.terminal_id, self._profile)
+        return ["env", *(f"{key}={value}" for key, value in environment.items())]
 
     def _build_codex_command(self) -> list[str]:
         """Assemble the codex command with sensible defaults."""
         cmd = ["codex", "--full-auto", "--sandbox", "workspace-write", "--search"]
+        cmd.extend(codex_options(self._profile))
+        return self._build_env_prefix() + cmd
 
-        model_from_profile = None
-        extra_args = None
-        if self._profile:
-            model_from_profile = self._profile.model
-            extra_args = (self._profile.variables or {}).get("codex_args")
+    @classmethod
+    def supports_warm_start(cls, agent_profile: Optional[str]) -> bool:
+        # The model, extra arguments and environment are fixed when codex launches.
+        if not agent_profile:
+            return True
+        try:
+            profile = load_agent_profile(agent_profile)
+        except AgentProfileError:
+            return False
+        return not profile.model and not LAUNCH_VARIABLES & set(profile.variables or {})
 
-        if model_from_profile:
-            cmd.extend(["--model", model_from_profile])
-        if extra_args:
-            cmd.extend(shlex.split(extra_args))
+    def initialize(self) -> None:
+        self._launch()
+        self._seed_persona()
 
-        return self._build_env_prefix() + cmd
+    def start_idle(self) -> None:
+        self._launch()
 
-    def initialize(self) -> None:
+    def apply_persona(self) -> None:
+        self._seed_persona()
+        self._status = TerminalStatus.READY
+
+    def _launch(self) -> None:
         self.ensure_binary_exists("codex")
         command = " ".join(shlex.quote(part) for part in self._build_codex_command())
 
         # Nudge shell so the banner renders reliably.
-        self.tmux.send_keys(self.session_name, self.window_name, "")
+        self.tmux.send_keys(self.session_name, self.window_name, "", pane_id=self.pane_id)
         time.sleep(0.2)
 
-        self.tmux.send_keys(self.session_name, self.window_name, command)
+        self.tmux.send_keys(self.session_name, self.window_name, command, pane_id=self.pane_id)
 
         if not self._wait_for_status(
             TerminalStatus.READY,
             timeout=60.0,
             polling_interval=0.5,
         ):
-            history = self.tmux.capture_pane(self.session_name, self.window_name)
-            for cre in COMPILED_ERRORS:
-                match = cre.search(history)
-                if match:
-                    raise ProviderInitializationError(f"Codex init failed: {match.group(0)}")
+            history = self.tmux.capture_pane(
+                self.session_name, self.window_name, pane_id=self.pane_id
+            )
+            match = ANY_ERROR_RE.search(history.lower())
+            if match:
+                raise ProviderInitializationError(f"Codex init failed: {match.group(0)}")
             raise ProviderInitializationError("Codex initialization timed out.")
 
         self._status = TerminalStatus.READY
-        self._seed_persona()
 
     def _wait_for_status(
         self,
@@ -158,39 +229,6 @@ class CodexProvider(BaseProvider):
             time.sleep(polling_interval)
         return False
 
-    def get_status(self) -> TerminalStatus:
-        history = self.tmux.capture_pane(self.session_name, self.window_name)
-        if not history.strip():
-            self._status = TerminalStatus.RUNNING
-            return self._status
-
-        for cre in COMPILED_ERRORS:
-            if cre.search(history):
-                self._status = TerminalStatus.ERROR
-                return self._status
-
-        lines = [
-            ln.rstrip()
-            for ln in history.replace("\r", "").splitlines()
-            if ln.strip()
-        ]
-        if lines and PROMPT_RE.match(lines[-1]):
-            self._status = TerminalStatus.READY
-            return self._status
-
-        for cre in COMPILED_BUSY:
-            if cre.search(history):
-                self._status = TerminalStatus.RUNNING
-                return self._status
-
-        for cre in COMPILED_READY:
-            if cre.search(history):
-                self._status = TerminalStatus.READY
-                return self._status
-
-        self._status = TerminalStatus.RUNNING
-        return self._status
-
     def extract_last_message_from_history(self, history: str) -> str:
         """Return the last Codex response from the tmux history."""
         sanitized = history.replace("\r", "")
@@ -206,7 +244,7 @@ class CodexProvider(BaseProvider):
 
             if PROMPT_RE.match(lines[-1]):
                 continue
-            if any(cre.search(text) for cre in COMPILED_READY):
+            if ANY_READY_RE.search(lower_text):
                 continue
             if any(marker in lower_text for marker in ["implement {feature", "100% context left", "to get started", "/model to change"]):
                 continue
@@ -256,6 +294,7 @@ class CodexProvider(BaseProvider):
             self.window_name,
             seed_message,
             suppress_history=True,
+            pane_id=self.pane_id,
         )
         try:
             self._wait_for_seed_ack(timeout=15.0)
@@ -285,9 +324,12 @@ class CodexProvider(BaseProvider):
             return
 
         deadline = time.time() + timeout
+        ack_cursor = PaneCursor()
         while time.time() < deadline:
-            history = self.tmux.capture_pane(self.session_name, self.window_name)
-            if ack_phrase in history:
+            delta = self.tmux.capture_pane_delta(
+                self.session_name, self.window_name, ack_cursor, pane_id=self.pane_id
+            )
+            if ack_phrase in delta.text:
                 remaining = max(0.5, deadline - time.time())
                 if not self._wait_for_status(
                     TerminalStatus.READY,
@@ -0,0 +1,301 @@
+"""Providers that run a CLI non-interactively, without tmux.
+
+A headless terminal has no window. Every message sent to it runs one turn of
+the CLI in print/exec mode (``claude -p``, ``codex exec``) as a subprocess in
+the terminal's working directory, with the message on stdin. Both output
+streams are appended to the terminal log
+(``~/.conductor/logs/terminal/<id>.log``) as they arrive, and the status
+follows the process: RUNNING while a turn runs, then COMPLETED, or ERROR for a
+non-zero exit. Messages sent during a turn are queued and run next. Nothing
+types keystrokes or scrapes a screen, so a host can run many more of these
+workers than tmux-backed ones.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import threading
+from abc import abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import IO, ClassVar, Deque, Dict, List, Optional
+
+from agent_conductor import constants
+from agent_conductor.models.agent_profile import AgentProfile
+from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
+from agent_conductor.providers.claude_code import (
+    claude_options,
+    conversation_uuid,
+    profile_prompt,
+)
+from agent_conductor.providers.codex import codex_environment, codex_options
+from agent_conductor.utils.agent_profiles import AgentProfileError, load_agent_profile
+
+LOG = logging.getLogger(__name__)
+
+CLEANUP_TIMEOUT_SECONDS = 5.0
+
+
+class HeadlessProvider(BaseProvider):
+    """Runs one CLI subprocess per message instead of typing into a tmux pane.
+
+    Subclasses name the ``binary`` and build the argv of a turn. With
+    ``keeps_context`` the CLI resumes its own conversation, so briefings
+    (:meth:`send_briefing`) are sent once; otherwise every turn repeats them.
+    """
+
+    headless = True
+    binary: ClassVar[str]
+    keeps_context: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        terminal_id: str,
+        session_name: str,
+        window_name: str,
+        agent_profile: Optional[str],
+        tmux,
+        pane_id: Optional[str] = None,
+    ) -> None:
+        super().__init__(terminal_id, session_name, window_name, agent_profile, tmux, pane_id)
+        self.turns = 0
+        # Set by reattach() when turns ran before a server restart.
+        self.resumed = False
+        self.last_message: Optional[str] = None
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._queue: Deque[str] = deque()
+        self._briefings: List[str] = []
+        self._output: List[str] = []
+        self._closed = False
+        self._profile: Optional[AgentProfile] = None
+
+    @property
+    def log_path(self) -> Path:
+        return constants.TERMINAL_LOG_DIR / f"{self.terminal_id}.log"
+
+    def build_startup_command(self) -> Optional[str]:
+        """Not used – each turn runs :meth:`build_turn_command`."""
+        return None
+
+    @abstractmethod
+    def build_turn_command(self) -> List[str]:
+        """Return the argv of one non-interactive turn; the prompt arrives on stdin."""
+
+    def turn_environment(self) -> Dict[str, str]:
+        """Variables added to the server's environment for every turn."""
+        return {}
+
+    def persona(self) -> str:
+        """Profile instructions prefixed to the conversation (empty if none)."""
+        profile = self.profile()
+        return profile_prompt(profile) if profile else ""
+
+    def profile(self) -> Optional[AgentProfile]:
+        if self.agent_profile and self._profile is None:
+            try:
+                self._profile = load_agent_profile(self.agent_profile)
+            except AgentProfileError as exc:
+                raise ProviderInitializationError(str(exc)) from exc
+        return self._profile
+
+    def initialize(self) -> None:
+        self.ensure_binary_exists(self.binary)
+        self.profile()
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.log_path.touch()
+        self._status = TerminalStatus.READY
+
+    def reattach(self) -> None:
+        # Every turn logs its message first, so a non-empty log means one has run.
+        try:
+            self.resumed = self.log_path.stat().st_size > 0
+        except FileNotFoundError:
+            self.resumed = False
+
+    @property
+    def has_run(self) -> bool:
+        """Whether a turn ran, in this process or before :meth:`reattach`."""
+        return self.turns > 0 or self.resumed
+
+    def send_briefing(self, message: str) -> None:
+        """Keep ``message`` as context for the next turn (every turn without ``keeps_context``)."""
+        with self._lock:
+            self._briefings.append(message)
+
+    def send_input(self, message: str) -> None:
+        """Run ``message`` as a turn now, or after the running one."""
+        with self._lock:
+            if self._process is not None:
+                self._queue.append(message)
+                return
+            self._start_turn(message)
+
+    async def send_input_async(self, message: str) -> None:
+        # Starting a turn only spawns the process; it never waits on the CLI.
+        self.send_input(message)
+
+    async def get_status_async(self) -> TerminalStatus:
+        return self._status
+
+    def read_history(self) -> str:
+        """Return everything the terminal's turns have printed."""
+        try:
+            return self.log_path.read_text(encoding="utf-8", errors="replace")
+        except FileNotFoundError:
+            return ""
+
+    def last_response(self) -> Optional[str]:
+        """Return the stdout of the last finished turn (its answer)."""
+        return self.last_message
+
+    def cleanup(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._queue.clear()
+            process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=CLEANUP_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._status = TerminalStatus.COMPLETED
+
+    def _compose_prompt(self, message: str) -> str:
+        resumed = self.keeps_context and self.has_run
+        context = ["" if resumed else self.persona(), *self._briefings]
+        if self.keeps_context:
+            self._briefings.clear()
+        return "\n\n".join(part for part in (*context, message) if part)
+
+    def _start_turn(self, message: str) -> None:
+        """Spawn the CLI for ``message`` (called with ``_lock`` held)."""
+        try:
+            command = self.build_turn_command()
+            prompt = self._compose_prompt(message)
+            environment = {
+                **os.environ,
+                **self.turn_environment(),
+                constants.TERMINAL_ENV_VAR: self.terminal_id,
+            }
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            process = subprocess.Popen(
+                command,
+                cwd=self.working_directory,
+                env=environment,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except (OSError, ProviderInitializationError) as exc:
+            LOG.warning(
+                "Unable to start a turn for headless terminal %s: %s", self.terminal_id, exc
+            )
+            self._status = TerminalStatus.ERROR
+            return
+        self._process = process
+        self._output = []
+        self.turns += 1
+        self._status = TerminalStatus.RUNNING
+        threading.Thread(
+            target=self._follow,
+            args=(process, message, prompt),
+            name=f"headless-{self.terminal_id}",
+            daemon=True,
+        ).start()
+
+    def _follow(self, process: subprocess.Popen, message: str, prompt: str) -> None:
+        with open(self.log_path, "a", encoding="utf-8") as log:
+            log_lock = threading.Lock()
+
+            def append(text: str) -> None:
+                with log_lock:
+                    log.write(text)
+                    log.flush()
+
+            def pump(stream: IO[str], keep: bool) -> None:
+                for line in stream:
+                    if keep:
+                        self._output.append(line)
+                    append(line)
+
+            append(f"> {message}\n")
+            errors = threading.Thread(target=pump, args=(process.stderr, False), daemon=True)
+            errors.start()
+            try:
+                process.stdin.write(prompt)
+                process.stdin.close()
+            except OSError:
+                LOG.debug("Headless terminal %s closed stdin early", self.terminal_id)
+            pump(process.stdout, True)
+            errors.join()
+            returncode = process.wait()
+            if returncode != 0:
+                append(f"[exit status {returncode}]\n")
+        self._finish_turn(process, returncode)
+
+    def _finish_turn(self, process: subprocess.Popen, returncode: int) -> None:
+        with self._lock:
+            if self._process is not process:
+                return  # cleaned up meanwhile
+            self._process = None
+            self.last_message = "".join(self._output).strip()
+            self._status = TerminalStatus.COMPLETED if returncode == 0 else TerminalStatus.ERROR
+            if self._queue:
+                self._start_turn(self._queue.popleft())
+            status = self._status
+        if self.status_tracker is not None:
+            self.status_tracker.report(self.terminal_id, status)
+
+
+class ClaudeCodeHeadlessProvider(HeadlessProvider):
+    """Claude Code in print mode (``claude -p``); turns resume one conversation."""
+
+    binary = "claude"
+    keeps_context = True
+
+    @property
+    def conversation_id(self) -> str:
+        return conversation_uuid(self.terminal_id)
+
+    def persona(self) -> str:
+        # The profile goes in as a system prompt instead (see build_turn_command).
+        return ""
+
+    def build_turn_command(self) -> List[str]:
+        command = ["claude", "-p", "--output-format", "text"]
+        if self.has_run:
+            command.extend(["--resume", self.conversation_id])
+        else:
+            command.extend(["--session-id", self.conversation_id])
+        profile = self.profile()
+        if profile:
+            command.extend(claude_options(profile))
+        return command
+
+
+class CodexHeadlessProvider(HeadlessProvider):
+    """Codex in exec mode (``codex exec``); every turn is a fresh conversation."""
+
+    binary = "codex"
+
+    def build_turn_command(self) -> List[str]:
+        return [
+            "codex",
+            "exec",
+            "--full-auto",
+            "--sandbox",
+            "workspace-write",
+            *codex_options(self.profile()),
+            "-",
+        ]
+
+    def turn_environment(self) -> Dict[str, str]:
+        return codex_environment(self.terminal_id, self.profile())
@@ -3,14 +3,24 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, Type
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Set, Type
 
-from agent_conductor.clients.tmux import TmuxClient
+from agent_conductor.clients.tmux import TmuxClient, TmuxError, TmuxPane
 from agent_conductor.models.enums import TerminalStatus
 from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
 from agent_conductor.providers.claude_code import ClaudeCodeProvider
 from agent_conductor.providers.codex import CodexProvider
+from agent_conductor.providers.headless import (
+    ClaudeCodeHeadlessProvider,
+    CodexHeadlessProvider,
+)
+from agent_conductor.providers.pool import ProviderPool, WarmProvider
 from agent_conductor.providers.q_cli import QCLIProvider
+from agent_conductor.providers.synthetic import SyntheticProvider
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from agent_conductor.clients.tmux_async import AsyncTmuxClient
+    from agent_conductor.services.status_tracker import StatusTracker
 
 LOG = logging.getLogger(__name__)
 
@@ -26,11 +36,31 @@ class ProviderManager:
         "q_cli": QCLIProvider,
         "claude_code": ClaudeCodeProvider,
         "codex": CodexProvider,
+        "claude_code_headless": ClaudeCodeHeadlessProvider,
+        "codex_headless": CodexHeadlessProvider,
+        "synthetic": SyntheticProvider,
     }
 
-    def __init__(self, tmux: Optional[TmuxClient] = None) -> None:
+    def __init__(
+        self,
+        tmux: Optional[TmuxClient] = None,
+        async_tmux: Optional[AsyncTmuxClient] = None,
+        status_tracker: Optional[StatusTracker] = None,
+        pool_size: int = 0,
+        structured_output: bool = False,
+    ) -> None:
         self.tmux = tmux or TmuxClient()
+        # Providers that support it report answers from structured CLI output.
+        self.structured_output = structured_output
+        self.async_tmux = async_tmux
+        self.status_tracker = status_tracker
         self._providers: Dict[str, BaseProvider] = {}
+        # Built but still initializing (see prepare_provider).
+        self._starting: Dict[str, BaseProvider] = {}
+        # Terminals that took an already-running CLI from the pool.
+        self._warm: Set[str] = set()
+        # Idle CLIs live on this manager's tmux server.
+        self.pool = ProviderPool(self.tmux, self._build_idle, size=pool_size)
 
     def create_provider(
         self,
@@ -39,25 +69,128 @@ class ProviderManager:
         session_name: str,
         window_name: str,
         agent_profile: Optional[str],
+        pane_id: Optional[str] = None,
+        *,
+        tmux: Optional[TmuxClient] = None,
+        async_tmux: Optional[AsyncTmuxClient] = None,
+        working_directory: Optional[str] = None,
     ) -> BaseProvider:
-        if provider_key not in self._registry:
-            raise UnknownProviderError(f"Provider '{provider_key}' is not registered.")
+        self.prepare_provider(
+            provider_key,
+            terminal_id,
+            session_name,
+            window_name,
+            agent_profile,
+            pane_id,
+            tmux=tmux,
+            async_tmux=async_tmux,
+            working_directory=working_directory,
+        )
+        return self.initialize_provider(terminal_id)
 
-        provider_cls = self._registry[provider_key]
-        provider = provider_cls(
-            terminal_id=terminal_id,
-            session_name=session_name,
-            window_name=window_name,
-            agent_profile=agent_profile,
-            tmux=self.tmux,
+    def prepare_provider(
+        self,
+        provider_key: str,
+        terminal_id: str,
+        session_name: str,
+        window_name: str,
+        agent_profile: Optional[str],
+        pane_id: Optional[str] = None,
+        *,
+        tmux: Optional[TmuxClient] = None,
+        async_tmux: Optional[AsyncTmuxClient] = None,
+        warm: bool = False,
+        working_directory: Optional[str] = None,
+    ) -> BaseProvider:
+        """Build a provider for :meth:`initialize_provider` without starting its CLI.
+
+        Until it is initialized the provider is not returned by :meth:`get_provider`.
+        ``warm`` means the pane already runs an idle CLI from :meth:`claim_warm`,
+        so initializing only applies the persona.
+        """
+        provider = self._build_provider(
+            provider_key,
+            terminal_id,
+            session_name,
+            window_name,
+            agent_profile,
+            pane_id,
+            tmux=tmux,
+            async_tmux=async_tmux,
         )
+        provider.working_directory = working_directory
+        self._starting[terminal_id] = provider
+        if warm:
+            self._warm.add(terminal_id)
+        return provider
+
+    def initialize_provider(self, terminal_id: str) -> BaseProvider:
+        """Start a prepared provider's CLI (blocking) and make it available."""
+        provider = self._starting.get(terminal_id)
+        if provider is None:
+            raise UnknownProviderError(f"Provider for terminal '{terminal_id}' is not prepared.")
+        warm = terminal_id in self._warm
+        self._warm.discard(terminal_id)
         try:
-            provider.initialize()
-        except ProviderInitializationError:
+            if warm:
+                provider.apply_persona()
+            else:
+                provider.initialize()
+        except Exception:
+            self._starting.pop(terminal_id, None)
+            self._untrack(terminal_id)
             raise
+        if self._starting.pop(terminal_id, None) is None:
+            # The terminal was deleted while its CLI was starting.
+            raise ProviderInitializationError(
+                f"Terminal '{terminal_id}' was removed during startup."
+            )
         self._providers[terminal_id] = provider
         return provider
 
+    def is_headless(self, provider_key: str) -> bool:
+        """Whether ``provider_key`` runs without a tmux window."""
+        provider_cls = self._registry.get(provider_key)
+        if provider_cls is None:
+            raise UnknownProviderError(f"Provider '{provider_key}' is not registered.")
+        return provider_cls.headless
+
+    def claim_warm(
+        self,
+        provider_key: str,
+        agent_profile: Optional[str],
+        session_name: str,
+        window_name: str,
+        working_directory: Optional[str] = None,
+        *,
+        pipe_command: Optional[Callable[[str], str]] = None,
+        tmux: Optional[TmuxClient] = None,
+    ) -> Optional[WarmProvider]:
+        """Move an idle CLI from the pool into ``session_name``, if one fits.
+
+        The caller must use the returned terminal ID and pane, then
+        :meth:`prepare_provider` with ``warm=True``. Sessions on another tmux
+        server (``tmux``) and profiles with launch-time options never match.
+        """
+        provider_cls = self._registry.get(provider_key)
+        if tmux not in (None, self.tmux) or provider_cls is None:
+            return None
+        if not provider_cls.supports_warm_start(agent_profile):
+            return None
+        return self.pool.claim(
+            provider_key, session_name, window_name, working_directory, pipe_command
+        )
+
+    def prime_warm(self, provider_key: str, working_directory: Optional[str] = None) -> None:
+        """Start filling the pool for ``provider_key`` in ``working_directory``."""
+        provider_cls = self._registry.get(provider_key)
+        if provider_cls is not None and provider_cls.supports_warm_start(None):
+            self.pool.prime(provider_key, working_directory)
+
+    def close(self) -> None:
+        """Stop the provider pool and kill its idle CLIs."""
+        self.pool.close()
+
     def get_provider(self, terminal_id: str) -> BaseProvider:
         if terminal_id not in self._providers:
             raise UnknownProviderError(f"Provider for terminal '{terminal_id}' is not loaded.")
@@ -70,12 +203,45 @@ class ProviderManager:
         session_name: str,
         window_name: str,
         agent_profile: Optional[str],
+        pane_id: Optional[str] = None,
+        *,
+        tmux: Optional[TmuxClient] = None,
+        async_tmux: Optional[AsyncTmuxClient] = None,
+        working_directory: Optional[str] = None,
     ) -> BaseProvider:
         """Attach to an existing tmux window without re-initializing the provider process."""
         existing = self._providers.get(terminal_id)
         if existing:
             return existing
 
+        provider = self._build_provider(
+            provider_key,
+            terminal_id,
+            session_name,
+            window_name,
+            agent_profile,
+            pane_id,
+            tmux=tmux,
+            async_tmux=async_tmux,
+        )
+        provider.working_directory = working_directory
+        provider.reattach()
+        self._providers[terminal_id] = provider
+        return provider
+
+    def _build_provider(
+        self,
+        provider_key: str,
+        terminal_id: str,
+        session_name: str,
+        window_name: str,
+        agent_profile: Optional[str],
+        pane_id: Optional[str],
+        *,
+        tmux: Optional[TmuxClient] = None,
+        async_tmux: Optional[AsyncTmuxClient] = None,
+    ) -> BaseProvider:
+        """Build a provider bound to ``tmux`` (the terminal's shard) or the default client."""
         if provider_key not in self._registry:
             raise UnknownProviderError(f"Provider '{provider_key}' is not registered.")
 
@@ -85,22 +251,83 @@ class ProviderManager:
             session_name=session_name,
             window_name=window_name,
             agent_profile=agent_profile,
+            tmux=tmux or self.tmux,
+            pane_id=pane_id,
+        )
+        provider.async_tmux = async_tmux if tmux is not None else self.async_tmux
+        provider.structured_output = self.structured_output
+        if self.status_tracker is not None and provider.status_engine is not None:
+            provider.status_tracker = self.status_tracker
+            self.status_tracker.track(
+                terminal_id, provider.status_engine, height=self._pane_height(provider)
+            )
+        elif provider.headless:
+            # Headless providers report process exits instead of being tailed.
+            provider.status_tracker = self.status_tracker
+        return provider
+
+    def _build_idle(self, provider_key: str, terminal_id: str, pane: TmuxPane) -> BaseProvider:
+        """Build a persona-less provider for a pool window (no status tracking)."""
+        provider = self._registry[provider_key](
+            terminal_id=terminal_id,
+            session_name=pane.session_name,
+            window_name=pane.window_name,
+            agent_profile=None,
             tmux=self.tmux,
+            pane_id=pane.pane_id,
         )
-        self._providers[terminal_id] = provider
+        provider.structured_output = self.structured_output
         return provider
 
+    def resize_screen(self, terminal_id: str) -> None:
+        """Re-read the pane height of a tracked terminal after its window was resized."""
+        provider = self._providers.get(terminal_id) or self._starting.get(terminal_id)
+        if provider is None or provider.status_tracker is None or provider.headless:
+            return
+        height = self._pane_height(provider)
+        if height is not None:
+            provider.status_tracker.resize(terminal_id, height)
+
+    @staticmethod
+    def _pane_height(provider: BaseProvider) -> Optional[int]:
+        """Height of the provider's pane, or None if tmux cannot tell (pane gone)."""
+        try:
+            return provider.tmux.pane_height(
+                provider.session_name, provider.window_name, pane_id=provider.pane_id
+            )
+        except TmuxError:
+            LOG.debug("Unable to read the pane height of %s", provider.terminal_id, exc_info=True)
+            return None
+
+    def _untrack(self, terminal_id: str) -> None:
+        if self.status_tracker is not None:
+            self.status_tracker.untrack(terminal_id)
+
     def cleanup_provider(self, terminal_id: str) -> None:
+        self._starting.pop(terminal_id, None)
+        self._warm.discard(terminal_id)
         provider = self._providers.pop(terminal_id, None)
+        self._untrack(terminal_id)
         if provider:
             try:
                 provider.cleanup()
             except Exception:  # pragma: no cover - defensive guard
                 LOG.warning("Provider cleanup failed for %s", terminal_id, exc_info=True)
 
+    def discard_provider(self, terminal_id: str) -> None:
+        """Forget a provider whose tmux pane is already gone, without cleanup keystrokes."""
+        self._starting.pop(terminal_id, None)
+        self._warm.discard(terminal_id)
+        self._providers.pop(terminal_id, None)
+        self._untrack(terminal_id)
+
     def status(self, terminal_id: str) -> TerminalStatus:
         provider = self.get_provider(terminal_id)
         return provider.get_status()
 
+    async def status_async(self, terminal_id: str) -> TerminalStatus:
+        provider = self.get_provider(terminal_id)
+        return await provider.get_status_async()
+
     def iter_providers(self):
         return self._providers.items()
@@ -0,0 +1,212 @@
+"""Pool of provider CLIs that are already running and idle.
+
+Booting ``claude`` or ``codex`` until its idle prompt appears dominates worker
+spawn time. :class:`ProviderPool` keeps up to ``size`` CLIs per provider key
+and working directory running in a private tmux session, each launched
+without a persona under a terminal ID reserved in advance (so
+``CONDUCTOR_TERMINAL_ID`` is right for the CLI and its MCP servers).
+Claiming one moves its window into the requested session; the provider then
+applies the persona at runtime (:meth:`BaseProvider.apply_persona`). Like
+:class:`~agent_conductor.clients.tmux_pool.WindowPool`, a directory is only
+filled once it has been asked for, by a background thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Set, Tuple
+
+from agent_conductor import constants
+from agent_conductor.clients.tmux import TmuxClient, TmuxError, TmuxPane
+from agent_conductor.clients.tmux_pool import adopt_window_commands
+from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
+from agent_conductor.utils.terminal import generate_terminal_id
+
+LOG = logging.getLogger(__name__)
+
+PROVIDER_POOL_SESSION_NAME = "_conductor-providers"
+IDLE_WINDOW_NAME = "idle-cli"
+
+PoolKey = Tuple[str, Optional[str]]
+# build(provider_key, terminal_id, pane) -> provider bound to the pool window.
+ProviderBuilder = Callable[[str, str, TmuxPane], BaseProvider]
+
+
+@dataclass(frozen=True)
+class WarmProvider:
+    """An idle CLI handed out by :meth:`ProviderPool.claim`, now in the caller's session."""
+
+    terminal_id: str
+    pane: TmuxPane
+
+
+class ProviderPool:
+    """Keeps ``size`` started, persona-less CLIs per (provider key, working directory)."""
+
+    def __init__(
+        self,
+        tmux: TmuxClient,
+        build: ProviderBuilder,
+        size: int = 0,
+        session_name: str = PROVIDER_POOL_SESSION_NAME,
+    ) -> None:
+        self.tmux = tmux
+        self.build = build
+        self.size = size
+        self.session_name = session_name
+        self._idle: Dict[PoolKey, Deque[WarmProvider]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._wanted: Set[PoolKey] = set()
+        # Keys whose CLI failed to start; they are not retried.
+        self._broken: Set[PoolKey] = set()
+        self._closed = False
+        self._refiller: Optional[threading.Thread] = None
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and not self._closed
+
+    def available(self, provider_key: str, working_directory: Optional[str] = None) -> int:
+        with self._lock:
+            return len(self._idle.get((provider_key, working_directory), ()))
+
+    def prime(self, provider_key: str, working_directory: Optional[str] = None) -> None:
+        """Ask the background thread to fill the pool for this provider and directory."""
+        if not self.enabled:
+            return
+        key = (provider_key, working_directory)
+        with self._lock:
+            if key in self._broken:
+                return
+            self._wanted.add(key)
+            if self._refiller is None:
+                self._refiller = threading.Thread(
+                    target=self._refill_loop, name="provider-pool", daemon=True
+                )
+                self._refiller.start()
+            self._wakeup.notify()
+
+    def claim(
+        self,
+        provider_key: str,
+        session_name: str,
+        window_name: str,
+        working_directory: Optional[str] = None,
+        pipe_command: Optional[Callable[[str], str]] = None,
+    ) -> Optional[WarmProvider]:
+        """Move an idle CLI into ``session_name``, or return None if none is ready.
+
+        ``pipe_command(terminal_id)`` gives the log pipe for the reserved ID.
+        """
+        if not self.enabled:
+            return None
+        try:
+            while True:
+                with self._lock:
+                    queue = self._idle.get((provider_key, working_directory))
+                    warm = queue.popleft() if queue else None
+                    if warm is None:
+                        self.misses[provider_key] = self.misses.get(provider_key, 0) + 1
+                        return None
+                pipe = pipe_command(warm.terminal_id) if pipe_command else None
+                try:
+                    self.tmux.run_batch(
+                        adopt_window_commands(warm.pane, session_name, window_name, pipe)
+                    )
+                except TmuxError:
+                    LOG.debug("Discarding stale idle CLI %s", warm.terminal_id, exc_info=True)
+                    continue
+                with self._lock:
+                    self.hits[provider_key] = self.hits.get(provider_key, 0) + 1
+                return WarmProvider(
+                    warm.terminal_id,
+                    TmuxPane(session_name, window_name, warm.pane.window_id, warm.pane.pane_id),
+                )
+        finally:
+            self.prime(provider_key, working_directory)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Hits, misses, hit rate and idle CLIs per provider key."""
+        with self._lock:
+            keys = set(self.hits) | set(self.misses) | {key for key, _ in self._idle}
+            stats = {}
+            for provider_key in sorted(keys):
+                hits = self.hits.get(provider_key, 0)
+                misses = self.misses.get(provider_key, 0)
+                stats[provider_key] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                    "idle": sum(
+                        len(queue) for (key, _), queue in self._idle.items() if key == provider_key
+                    ),
+                }
+            return stats
+
+    def close(self) -> None:
+        """Stop refilling and kill the idle CLIs with their pool session."""
+        with self._lock:
+            self._closed = True
+            self._idle.clear()
+            self._wakeup.notify_all()
+        refiller = self._refiller
+        if refiller is not None:
+            # A CLI may be mid-boot; killing the session below ends that wait early.
+            refiller.join(timeout=1.0)
+        try:
+            self.tmux.kill_session(self.session_name)
+        except TmuxError:
+            LOG.debug("Provider pool session already gone.")
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._lock:
+                while not self._wanted and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                key = self._wanted.pop()
+                missing = self.size - len(self._idle.get(key, ()))
+            for _ in range(max(missing, 0)):
+                try:
+                    warm = self._spawn(*key)
+                except (TmuxError, ProviderInitializationError):
+                    LOG.warning("Unable to pre-start a %s CLI for %s", *key, exc_info=True)
+                    with self._lock:
+                        self._broken.add(key)
+                    break
+                with self._lock:
+                    if self._closed:
+                        return
+                    self._idle.setdefault(key, deque()).append(warm)
+
+    def _spawn(self, provider_key: str, directory: Optional[str]) -> WarmProvider:
+        if not self.tmux.session_exists(self.session_name):
+            try:
+                # The placeholder window keeps the session alive while CLIs move out.
+                self.tmux.create_session(self.session_name, "idle")
+            except TmuxError:
+                if not self.tmux.session_exists(self.session_name):
+                    raise
+        terminal_id = generate_terminal_id()
+        pane = self.tmux.create_window(
+            self.session_name,
+            IDLE_WINDOW_NAME,
+            environment={constants.TERMINAL_ENV_VAR: terminal_id},
+            start_directory=directory,
+        )
+        try:
+            self.build(provider_key, terminal_id, pane).start_idle()
+        except Exception:
+            try:
+                self.tmux.kill_window(self.session_name, IDLE_WINDOW_NAME, window_id=pane.window_id)
+            except TmuxError:
+                LOG.debug("Idle CLI window %s already gone.", pane.window_id)
+            raise
+        return WarmProvider(terminal_id, pane)
@@ -0,0 +1,148 @@
+"""Shared status detection for providers that run a TUI inside tmux.
+
+A provider declares its screen markers once, as precompiled
+:class:`StatusRule` and :class:`Latch` tables, and :class:`StatusEngine`
+evaluates them against a :class:`~agent_conductor.clients.tmux.PaneDelta`:
+
+* rules are tried in order against the last ``tail_lines`` rows of the
+  visible screen (or only its last non-blank line) and the first match wins;
+* latches are markers that may scroll off screen between polls (a finished
+  response, a fatal error); they are searched in the new history lines too and
+  stay set until the pane is reset.
+
+Patterns that lead to the same status are combined into one alternation with
+:func:`compile_any`, so each rule costs a single regex scan. Python's ``re``
+is slow with ``IGNORECASE`` alternations, so case-insensitive providers pass
+``ignore_case=True`` and lower-case patterns instead: the text is lowered once
+per poll.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import AbstractSet, Iterable, MutableSet, Optional, Pattern, Sequence
+
+from agent_conductor.clients.tmux import PaneDelta
+from agent_conductor.models.enums import TerminalStatus
+
+DEFAULT_TAIL_LINES = 40
+
+
+def compile_any(patterns: Iterable[str], flags: int = 0) -> Pattern[str]:
+    """Compile ``patterns`` into one regex matching any of them."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+
+def trim_blank_lines(text: str) -> str:
+    """Drop trailing blank rows (tmux pads the screen) but keep the last line intact."""
+    content = text.rstrip()
+    if not content:
+        return ""
+    end = text.find("\n", len(content))
+    return text if end < 0 else text[:end]
+
+
+def tail_lines(text: str, count: int) -> str:
+    """Return the last ``count`` lines of ``text`` without splitting all of it."""
+    position = len(text)
+    for _ in range(count):
+        position = text.rfind("\n", 0, position)
+        if position < 0:
+            return text
+    return text[position + 1 :]
+
+
+def last_line(text: str) -> str:
+    """Return the last non-blank line of ``text``, right-stripped."""
+    content = text.rstrip()
+    return content[content.rfind("\n") + 1 :]
+
+
+@dataclass(frozen=True)
+class Latch:
+    """A marker that is remembered once seen, until the pane is reset."""
+
+    name: str
+    pattern: Pattern[str]
+
+
+@dataclass(frozen=True)
+class StatusRule:
+    """``status`` applies when ``pattern`` matches and ``latch`` (if any) is set.
+
+    A rule without a pattern matches whenever its latch is set. With
+    ``last_line`` the pattern only sees the last non-blank screen line.
+    ``prompt`` marks rules that mean the CLI is waiting on a choice prompt.
+    """
+
+    status: TerminalStatus
+    pattern: Optional[Pattern[str]] = None
+    last_line: bool = False
+    latch: Optional[str] = None
+    prompt: bool = False
+
+
+class StatusEngine:
+    """Evaluates ordered status rules over the tail of a pane."""
+
+    def __init__(
+        self,
+        rules: Sequence[StatusRule],
+        latches: Sequence[Latch] = (),
+        *,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+        default: TerminalStatus = TerminalStatus.RUNNING,
+        ignore_case: bool = False,
+    ) -> None:
+        self.rules = tuple(rules)
+        self.latches = tuple(latches)
+        self.tail_lines = tail_lines
+        self.default = default
+        self.ignore_case = ignore_case
+
+    def evaluate(self, delta: PaneDelta, latched: MutableSet[str]) -> TerminalStatus:
+        """Return the status for ``delta``, updating the caller's ``latched`` names."""
+        rule = self.match(delta, latched)
+        return self.default if rule is None else rule.status
+
+    def match(self, delta: PaneDelta, latched: MutableSet[str]) -> Optional[StatusRule]:
+        """Like :meth:`evaluate`, but return the winning rule (None for the default)."""
+        if delta.reset:
+            latched.clear()
+        screen = trim_blank_lines(delta.screen)
+        if self.ignore_case:
+            screen = screen.lower()
+        if len(latched) < len(self.latches):
+            history = "\n".join(delta.lines)
+            if self.ignore_case:
+                history = history.lower()
+            for latch in self.latches:
+                if latch.name in latched:
+                    continue
+                if latch.pattern.search(screen) or (history and latch.pattern.search(history)):
+                    latched.add(latch.name)
+
+        if not screen and not delta.lines:
+            return None
+        return self.match_screen(tail_lines(screen, self.tail_lines), latched)
+
+    def match_screen(
+        self, screen: str, latched: AbstractSet[str] = frozenset()
+    ) -> Optional[StatusRule]:
+        """Apply the rules to an already-trimmed (and, with ``ignore_case``, lowered) tail."""
+        final_line: Optional[str] = None
+        for rule in self.rules:
+            if rule.latch is not None and rule.latch not in latched:
+                continue
+            if rule.pattern is None:
+                return rule
+            if rule.last_line:
+                if final_line is None:
+                    final_line = last_line(screen.replace("\r", ""))
+                text = final_line
+            else:
+                text = screen
+            if rule.pattern.search(text):
+                return rule
+        return None
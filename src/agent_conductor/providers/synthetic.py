@@ -0,0 +1,53 @@
+"""Synthetic provider: a bundled fake agent for offline load tests."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from agent_conductor.providers.claude_code import ClaudeCodeProvider
+from agent_conductor.utils.agent_profiles import AgentProfileError, load_agent_profile
+
+AGENT_SCRIPT = Path(__file__).with_name("synthetic_agent.py")
+
+
+class SyntheticProvider(ClaudeCodeProvider):
+    """Runs ``synthetic_agent.py`` in the tmux pane instead of a real CLI.
+
+    The fake agent draws Claude Code's screen markers, so status detection,
+    answer extraction and choice prompts go through the Claude Code paths.
+    Its latency, output volume and menus come from the profile variable
+    ``synthetic_args`` (see ``python synthetic_agent.py --help``).
+    """
+
+    @classmethod
+    def supports_warm_start(cls, agent_profile: Optional[str]) -> bool:
+        if not agent_profile:
+            return True
+        try:
+            return "synthetic_args" not in (load_agent_profile(agent_profile).variables or {})
+        except AgentProfileError:
+            return False
+
+    def agent_command(self) -> List[str]:
+        command = [sys.executable, str(AGENT_SCRIPT)]
+        if self.agent_profile:
+            extra_args = (self._load_profile().variables or {}).get("synthetic_args")
+            if extra_args:
+                command.extend(shlex.split(extra_args))
+        return command
+
+    def _build_claude_command(self) -> list[str]:
+        return [shlex.quote(part) for part in self.agent_command()]
+
+    def initialize(self) -> None:
+        self._launch(" ".join(self._build_claude_command()))
+
+    def start_idle(self) -> None:
+        self._launch(" ".join(self._build_claude_command()))
+
+    def last_response(self) -> Optional[str]:
+        # The fake agent writes no session transcript.
+        return None
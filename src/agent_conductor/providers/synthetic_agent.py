@@ -0,0 +1,130 @@
+"""Fake agent CLI used by the ``synthetic`` provider for offline load tests.
+
+It draws the same screen markers as Claude Code, so the Claude status engine,
+answer extraction and choice-prompt detection run on it unchanged:
+
+* an idle ``> `` prompt between a rule and a ``? for shortcuts`` footer, and a
+  ``✻ Thinking… (esc to interrupt)`` spinner line (erased again) while a
+  message is being "processed";
+* answers that start with ``⏺`` followed by ``--lines`` lines of filler text;
+* every ``--prompt-every``-th message, or with probability ``--prompt-rate``,
+  a numbered choice menu (``❯ 1. Yes``) that waits for an answer first.
+
+Randomness (latency jitter, prompt rate) comes from ``--seed``, so a run is
+reproducible. ``/exit`` quits. The script only uses the standard library, so
+any Python can run it by path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import select
+import sys
+import time
+from typing import List, Optional
+
+# Claude Code's input box: a rule, the prompt, and a footer under it. The
+# cursor goes back up to the prompt so typed input is echoed there.
+IDLE_PROMPT = "─" * 40 + "\n> \n? for shortcuts\x1b[1A\x1b[3G"
+SPINNER = "✻ Thinking… (esc to interrupt)"
+CHOICE_MENU = ["Do you want to make this edit?", "❯ 1. Yes", "  2. No"]
+# Pasted messages arrive as several lines; lines this close together are one message.
+PASTE_GAP_SECONDS = 0.05
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fake agent CLI for load tests.")
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per answer.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra seconds.")
+    parser.add_argument("--lines", type=int, default=5, help="Filler lines per answer.")
+    parser.add_argument("--width", type=int, default=60, help="Characters per filler line.")
+    parser.add_argument("--prompt-every", type=int, default=0, help="Menu every Nth message.")
+    parser.add_argument("--prompt-rate", type=float, default=0.0, help="Menu probability.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter and menus.")
+    return parser.parse_args(argv)
+
+
+def emit(text: str) -> None:
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+class MessageReader:
+    """Reads stdin unbuffered so lines pasted together are seen together."""
+
+    def __init__(self) -> None:
+        self.fd = sys.stdin.fileno()
+        self.buffer = b""
+        self.closed = False
+
+    def _fill(self, timeout: Optional[float]) -> bool:
+        if self.closed or not select.select([self.fd], [], [], timeout)[0]:
+            return False
+        data = os.read(self.fd, 65536)
+        if not data:
+            self.closed = True
+            return False
+        self.buffer += data
+        return True
+
+    def read_message(self) -> Optional[str]:
+        """Return the next message (pasted lines joined), or None at end of input."""
+        while b"\n" not in self.buffer:
+            if not self._fill(None):
+                return None
+        while self._fill(PASTE_GAP_SECONDS):
+            pass
+        complete, _, self.buffer = self.buffer.rpartition(b"\n")
+        return complete.decode("utf-8", errors="replace").strip()
+
+
+def answer(
+    message: str, count: int, args: argparse.Namespace, rng: random.Random, reader: MessageReader
+) -> None:
+    emit(SPINNER)
+    time.sleep(args.latency + rng.uniform(0, args.jitter))
+    emit("\r\x1b[2K")
+
+    wants_menu = (args.prompt_every and count % args.prompt_every == 0) or (
+        args.prompt_rate and rng.random() < args.prompt_rate
+    )
+    if wants_menu:
+        emit("\n".join(CHOICE_MENU) + "\n")
+        choice = reader.read_message()
+        # Remove the menu and the echoed choice, as the real CLI redraws over it.
+        emit(f"\x1b[{len(CHOICE_MENU) + 1}F\x1b[J")
+        if choice is None:
+            return
+        message = f"{message} (choice {choice})"
+
+    first_line = message.splitlines()[0] if message else ""
+    emit(f"⏺ Done: {first_line[: args.width]}\n")
+    filler = ("lorem ipsum dolor sit amet " * (args.width // 27 + 1))[: args.width]
+    for index in range(args.lines):
+        emit(f"  {index + 1:>4} {filler}\n")
+    emit("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    rng = random.Random(args.seed)
+    emit(f"Synthetic agent (pid {os.getpid()})\n\n{IDLE_PROMPT}")
+    reader = MessageReader()
+    count = 0
+    while True:
+        message = reader.read_message()
+        if message is None or message == "/exit":
+            emit("\r\x1b[J")  # clear the footer for the shell prompt
+            return 0
+        if not message:
+            emit(IDLE_PROMPT)
+            continue
+        count += 1
+        answer(message, count, args, rng, reader)
+        emit(IDLE_PROMPT)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
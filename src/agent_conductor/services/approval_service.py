@@ -8,7 +8,13 @@ from pathlib import Path
 from typing import List, Optional
 
 from agent_conductor import constants
-from agent_conductor.clients.database import ApprovalRequest as ApprovalORM, session_scope
+from sqlalchemy import select
+
+from agent_conductor.clients.database import (
+    ApprovalRequest as ApprovalORM,
+    async_session_scope,
+    session_scope,
+)
 from agent_conductor.models.approval import ApprovalRequest
 from agent_conductor.models.enums import ApprovalStatus
 from agent_conductor.services.inbox_service import InboxService
@@ -58,6 +64,17 @@ class ApprovalService:
             approvals = query.all()
         return [ApprovalRequest.model_validate(obj, from_attributes=True) for obj in approvals]
 
+    async def list_requests_async(
+        self, status: Optional[ApprovalStatus] = None
+    ) -> List[ApprovalRequest]:
+        """Awaitable :meth:`list_requests` for callers on the event loop."""
+        query = select(ApprovalORM).order_by(ApprovalORM.created_at.asc())
+        if status:
+            query = query.where(ApprovalORM.status == status)
+        async with async_session_scope() as db:
+            approvals = list(await db.scalars(query))
+        return [ApprovalRequest.model_validate(obj, from_attributes=True) for obj in approvals]
+
     def approve(self, request_id: int) -> ApprovalRequest:
         with session_scope() as db:
             approval = db.get(ApprovalORM, request_id)
@@ -25,7 +25,7 @@ class CleanupService:
                 db.query(TerminalORM)
                 .filter(
                     TerminalORM.status.in_(
-                        [TerminalStatus.COMPLETED, TerminalStatus.ERROR]
+                        [TerminalStatus.COMPLETED, TerminalStatus.ERROR, TerminalStatus.EXITED]
                     ),
                     TerminalORM.created_at <= cutoff,
                 )
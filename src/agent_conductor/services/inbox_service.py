@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
 
-from agent_conductor.clients.database import InboxMessage as InboxORM, session_scope
-from agent_conductor.models.enums import InboxStatus
+from sqlalchemy import select
+
+from agent_conductor.clients.database import InboxMessage as InboxORM
+from agent_conductor.clients.database import Terminal as TerminalORM
+from agent_conductor.clients.database import async_session_scope, session_scope
+from agent_conductor.models.enums import InboxStatus, TerminalStatus
 from agent_conductor.models.inbox import InboxMessage
 from agent_conductor.services.terminal_service import TerminalService
 
+LOG = logging.getLogger(__name__)
+
 
 class InboxService:
     """Queues and delivers messages between terminals."""
 
     def __init__(self, terminal_service: TerminalService) -> None:
         self.terminals = terminal_service
+        self._locks: Optional[Tuple[asyncio.AbstractEventLoop, Dict[str, asyncio.Lock]]] = None
 
     def queue_message(self, sender_id: str, receiver_id: str, message: str) -> InboxMessage:
         """Persist a message with PENDING status."""
@@ -30,6 +39,22 @@ class InboxService:
             db.refresh(inbox)
         return InboxMessage.model_validate(inbox, from_attributes=True)
 
+    async def queue_message_async(
+        self, sender_id: str, receiver_id: str, message: str
+    ) -> InboxMessage:
+        """Awaitable :meth:`queue_message` for callers on the event loop."""
+        inbox = InboxORM(
+            receiver_id=receiver_id,
+            sender_id=sender_id,
+            message=message,
+            status=InboxStatus.PENDING,
+        )
+        async with async_session_scope() as db:
+            db.add(inbox)
+            await db.flush()
+            await db.refresh(inbox)
+        return InboxMessage.model_validate(inbox, from_attributes=True)
+
     def list_messages(self, receiver_id: str) -> List[InboxMessage]:
         with session_scope() as db:
             messages = (
@@ -40,6 +65,16 @@ class InboxService:
             )
             return [InboxMessage.model_validate(obj, from_attributes=True) for obj in messages]
 
+    async def list_messages_async(self, receiver_id: str) -> List[InboxMessage]:
+        """Awaitable :meth:`list_messages` for callers on the event loop."""
+        async with async_session_scope() as db:
+            messages = await db.scalars(
+                select(InboxORM)
+                .where(InboxORM.receiver_id == receiver_id)
+                .order_by(InboxORM.created_at.asc())
+            )
+            return [InboxMessage.model_validate(obj, from_attributes=True) for obj in messages]
+
     def deliver_pending(self, receiver_id: str) -> None:
         """Attempt to deliver pending messages by injecting them into the receiver terminal."""
         with session_scope() as db:
@@ -57,21 +92,96 @@ class InboxService:
                 except Exception:  # pragma: no cover - failure path for manual review
                     entry.status = InboxStatus.FAILED
 
+    def _receiver_lock(self, receiver_id: str) -> asyncio.Lock:
+        """Lock serializing deliveries to ``receiver_id`` on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._locks is None or self._locks[0] is not loop:
+            self._locks = (loop, {})
+        return self._locks[1].setdefault(receiver_id, asyncio.Lock())
+
+    async def deliver_pending_async(self, receiver_id: str) -> None:
+        """Awaitable :meth:`deliver_pending`; no database session is held while sending.
+
+        The inbox loop and ``POST /inbox/{id}/deliver`` can overlap at the
+        awaits below, so each receiver's read-send-write cycle runs under a
+        lock; otherwise both would read the same PENDING rows and type them twice.
+        """
+        async with self._receiver_lock(receiver_id):
+            await self._deliver_pending_locked(receiver_id)
+
+    async def _deliver_pending_locked(self, receiver_id: str) -> None:
+        async with async_session_scope() as db:
+            pending = [
+                (entry.id, f"[INBOX:{entry.sender_id}] {entry.message}")
+                for entry in await db.scalars(
+                    select(InboxORM)
+                    .where(
+                        InboxORM.receiver_id == receiver_id,
+                        InboxORM.status == InboxStatus.PENDING,
+                    )
+                    .order_by(InboxORM.created_at.asc())
+                )
+            ]
+
+        outcomes = {}
+        for message_id, formatted in pending:
+            try:
+                await self.terminals.send_input_async(receiver_id, formatted)
+                outcomes[message_id] = InboxStatus.DELIVERED
+            except Exception:  # pragma: no cover - failure path for manual review
+                LOG.warning("Failed to deliver inbox message %s", message_id, exc_info=True)
+                outcomes[message_id] = InboxStatus.FAILED
+
+        if not outcomes:
+            return
+        async with async_session_scope() as db:
+            for message_id, status in outcomes.items():
+                entry = await db.get(InboxORM, message_id)
+                if entry:
+                    entry.status = status
+
     def mark_failed(self, message_id: int) -> None:
         with session_scope() as db:
             message = db.get(InboxORM, message_id)
             if message:
                 message.status = InboxStatus.FAILED
 
+    def fail_pending(self, receiver_id: str) -> int:
+        """Mark every pending message for ``receiver_id`` as FAILED; returns the count."""
+        with session_scope() as db:
+            return (
+                db.query(InboxORM)
+                .filter(InboxORM.receiver_id == receiver_id, InboxORM.status == InboxStatus.PENDING)
+                .update({InboxORM.status: InboxStatus.FAILED}, synchronize_session=False)
+            )
+
+    @staticmethod
+    def _deliverable_receivers_query():
+        """Receivers with pending messages, except terminals still starting."""
+        starting = select(TerminalORM.id).where(TerminalORM.status == TerminalStatus.STARTING)
+        return (
+            select(InboxORM.receiver_id)
+            .where(InboxORM.status == InboxStatus.PENDING, InboxORM.receiver_id.not_in(starting))
+            .distinct()
+        )
+
+    @classmethod
+    def _deliverable_receivers(cls) -> List[str]:
+        with session_scope() as db:
+            return list(db.scalars(cls._deliverable_receivers_query()))
+
+    @classmethod
+    async def _deliverable_receivers_async(cls) -> List[str]:
+        async with async_session_scope() as db:
+            return list(await db.scalars(cls._deliverable_receivers_query()))
+
     def deliver_all_pending(self) -> None:
         """Deliver pending messages for every receiver terminal."""
-        with session_scope() as db:
-            receivers = [
-                row[0]
-                for row in db.query(InboxORM.receiver_id)
-                .filter(InboxORM.status == InboxStatus.PENDING)
-                .distinct()
-                .all()
-            ]
+        receivers = self._deliverable_receivers()
         for receiver_id in receivers:
             self.deliver_pending(receiver_id)
+
+    async def deliver_all_pending_async(self) -> None:
+        """Deliver pending messages for every receiver concurrently."""
+        receivers = await self._deliverable_receivers_async()
+        await asyncio.gather(*(self.deliver_pending_async(receiver) for receiver in receivers))
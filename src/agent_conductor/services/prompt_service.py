@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
+from agent_conductor import constants
 from agent_conductor.models.session import Session
 from agent_conductor.models.terminal import Terminal
+from agent_conductor.providers.base import BaseProvider
 from agent_conductor.providers.manager import UnknownProviderError
 from agent_conductor.services.inbox_service import InboxService
 from agent_conductor.services.session_service import SessionService
@@ -30,7 +32,26 @@ class PromptWatcher:
 
     def scan(self) -> None:
         """Scan all sessions for workers awaiting interactive approval."""
-        for session in self.sessions.list_sessions():
+        watched = self._watched_workers(self.sessions.list_sessions())
+        if not watched:
+            return
+        # One tmux round trip for every worker's screen, however many there are.
+        screens = self.terminals.capture_screens(worker for _, worker, _ in watched)
+        self._forward_prompts(watched, screens)
+
+    async def scan_async(self) -> None:
+        """Awaitable :meth:`scan`."""
+        watched = self._watched_workers(await self.sessions.list_sessions_async())
+        if not watched:
+            return
+        screens = await self.terminals.capture_screens_async(worker for _, worker, _ in watched)
+        self._forward_prompts(watched, screens)
+
+    def _watched_workers(
+        self, sessions: List[Session]
+    ) -> List[Tuple[Terminal, Terminal, BaseProvider]]:
+        watched = []
+        for session in sessions:
             supervisor = self._locate_supervisor(session)
             if not supervisor:
                 continue
@@ -38,22 +59,38 @@ class PromptWatcher:
             for terminal in session.terminals:
                 if terminal.id == supervisor.id:
                     continue
-                self._notify_if_prompt(supervisor, terminal)
+                try:
+                    # Headless workers have no screen and never show a prompt.
+                    if self.terminals.providers.is_headless(terminal.provider):
+                        continue
+                    provider = self.terminals.ensure_provider_loaded(terminal.id)
+                except UnknownProviderError:  # provider not loaded yet or no longer registered
+                    continue
+                watched.append((supervisor, terminal, provider))
+        return watched
+
+    def _forward_prompts(
+        self,
+        watched: List[Tuple[Terminal, Terminal, BaseProvider]],
+        screens: Dict[str, str],
+    ) -> None:
+        for supervisor, worker, provider in watched:
+            screen = screens.get(worker.id)
+            if screen is None:  # pane vanished between listing and capture
+                continue
+            prompt_text = provider.interactive_prompt_from_screen(screen)
+            self._forward_prompt(supervisor, worker, prompt_text)
 
     @staticmethod
     def _locate_supervisor(session: Session) -> Optional[Terminal]:
         for terminal in session.terminals:
-            if terminal.window_name.startswith("supervisor-"):
+            if terminal.role == constants.SUPERVISOR_ROLE:
                 return terminal
         return None
 
-    def _notify_if_prompt(self, supervisor: Terminal, worker: Terminal) -> None:
-        try:
-            provider = self.terminals.ensure_provider_loaded(worker.id)
-        except UnknownProviderError:  # pragma: no cover - provider may not be loaded yet
-            return
-
-        prompt_text = provider.detect_interactive_prompt()
+    def _forward_prompt(
+        self, supervisor: Terminal, worker: Terminal, prompt_text: Optional[str]
+    ) -> None:
         if not prompt_text:
             return
 
@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
-from typing import List
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable, List, Optional
 
-from agent_conductor.clients.database import Terminal as TerminalORM, session_scope
+from sqlalchemy import select
+
+from agent_conductor.clients.database import (
+    Terminal as TerminalORM,
+    async_session_scope,
+    session_scope,
+)
 from agent_conductor.models.session import Session as SessionModel
+from agent_conductor.models.terminal import Terminal as TerminalModel
 from agent_conductor.services.terminal_service import TerminalService
 
 
@@ -16,21 +25,49 @@ class SessionService:
         self.terminals = terminal_service
 
     def list_sessions(self) -> List[SessionModel]:
-        """Return active sessions and their terminals."""
+        """Return active sessions and their terminals (one query, grouped here)."""
         with session_scope() as db:
-            session_names = [
-                row[0]
-                for row in db.query(TerminalORM.session_name)
-                .distinct()
-                .order_by(TerminalORM.session_name)
+            rows = (
+                db.query(TerminalORM)
+                .order_by(TerminalORM.session_name, TerminalORM.created_at.asc())
                 .all()
-            ]
+            )
+            return self._group_sessions(rows)
+
+    async def list_sessions_async(self) -> List[SessionModel]:
+        """Awaitable :meth:`list_sessions` for callers on the event loop."""
+        async with async_session_scope() as db:
+            rows = await db.scalars(
+                select(TerminalORM).order_by(TerminalORM.session_name, TerminalORM.created_at.asc())
+            )
+            return self._group_sessions(rows)
 
+    @staticmethod
+    def _group_sessions(rows: Iterable[TerminalORM]) -> List[SessionModel]:
         return [
-            SessionModel(name=name, terminals=self.terminals.list_terminals(name))
-            for name in session_names
+            SessionModel(
+                name=name,
+                terminals=[
+                    TerminalModel.model_validate(row, from_attributes=True) for row in group
+                ],
+            )
+            for name, group in groupby(rows, key=attrgetter("session_name"))
         ]
 
+    def get_session(self, session_name: str) -> Optional[SessionModel]:
+        """Return one session, or None if it has no terminals."""
+        terminals = self.terminals.list_terminals(session_name)
+        if not terminals:
+            return None
+        return SessionModel(name=session_name, terminals=terminals)
+
+    async def get_session_async(self, session_name: str) -> Optional[SessionModel]:
+        """Awaitable :meth:`get_session` for callers on the event loop."""
+        terminals = await self.terminals.list_terminals_async(session_name)
+        if not terminals:
+            return None
+        return SessionModel(name=session_name, terminals=terminals)
+
     def delete_session(self, session_name: str) -> None:
         """Terminate every terminal in the session."""
         terminals = self.terminals.list_terminals(session_name)
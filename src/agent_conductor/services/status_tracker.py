@@ -0,0 +1,161 @@
+"""Follow terminal pane logs and keep each terminal's status up to date.
+
+Instead of asking tmux for the screen on every ``get_status`` call, the
+tracker tails ``~/.conductor/logs/terminal/<id>.log`` from the last byte it
+read, replays new output onto a :class:`LogScreen`, and runs the provider's
+:class:`~agent_conductor.providers.status_engine.StatusEngine` only when
+output arrived. Providers read the cached result; :meth:`StatusTracker.poll`
+refreshes every terminal and publishes changes to subscribers.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from agent_conductor import constants
+from agent_conductor.clients.terminal_log import DEFAULT_SCREEN_HEIGHT, LogScreen, LogTail
+from agent_conductor.clients.tmux import PaneDelta
+from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.providers.status_engine import StatusEngine
+
+LOG = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TrackedStatus:
+    """Status derived from a terminal's log."""
+
+    status: TerminalStatus
+    prompt_pending: bool = False
+
+
+StatusListener = Callable[[str, TrackedStatus], None]
+
+
+@dataclass
+class _Terminal:
+    engine: StatusEngine
+    tail: LogTail
+    screen: LogScreen
+    latched: Set[str] = field(default_factory=set)
+    state: Optional[TrackedStatus] = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class StatusTracker:
+    """Per-terminal log followers feeding provider status engines."""
+
+    def __init__(self, log_dir: Optional[Path] = None) -> None:
+        self._log_dir = log_dir
+        self._terminals: Dict[str, _Terminal] = {}
+        self._listeners: List[StatusListener] = []
+        self._lock = threading.Lock()
+
+    def log_path(self, terminal_id: str) -> Path:
+        return (self._log_dir or constants.TERMINAL_LOG_DIR) / f"{terminal_id}.log"
+
+    def track(
+        self, terminal_id: str, engine: StatusEngine, height: Optional[int] = None
+    ) -> None:
+        """Start following ``terminal_id``'s log (recent output first, if it exists).
+
+        ``height`` is the pane's height in rows, which the replayed screen needs
+        to place full-screen redraws.
+        """
+        with self._lock:
+            if terminal_id in self._terminals:
+                return
+            self._terminals[terminal_id] = _Terminal(
+                engine=engine,
+                tail=LogTail(self.log_path(terminal_id)),
+                screen=LogScreen(height or DEFAULT_SCREEN_HEIGHT),
+            )
+
+    def resize(self, terminal_id: str, height: int) -> None:
+        """Follow a resize of ``terminal_id``'s pane to ``height`` rows."""
+        terminal = self._terminals.get(terminal_id)
+        if terminal is not None:
+            with terminal.lock:
+                terminal.screen.resize(height)
+
+    def untrack(self, terminal_id: str) -> None:
+        with self._lock:
+            self._terminals.pop(terminal_id, None)
+
+    def tracked(self) -> List[str]:
+        with self._lock:
+            return list(self._terminals)
+
+    def subscribe(self, listener: StatusListener) -> None:
+        """Call ``listener(terminal_id, state)`` whenever a terminal's state changes."""
+        self._listeners.append(listener)
+
+    def status(self, terminal_id: str) -> Optional[TrackedStatus]:
+        """Return the cached state without reading the log."""
+        terminal = self._terminals.get(terminal_id)
+        return terminal.state if terminal is not None else None
+
+    def refresh(self, terminal_id: str) -> Optional[TrackedStatus]:
+        """Consume new log output for ``terminal_id`` and return its state.
+
+        Returns None when the terminal is not tracked or nothing was logged yet.
+        """
+        terminal = self._terminals.get(terminal_id)
+        if terminal is None:
+            return None
+        state, changed = self._advance(terminal)
+        if changed:
+            self._publish(terminal_id, state)
+        return state
+
+    def poll(self) -> Dict[str, TrackedStatus]:
+        """Refresh every tracked terminal and return the states that changed."""
+        changes: Dict[str, TrackedStatus] = {}
+        with self._lock:
+            terminals = list(self._terminals.items())
+        for terminal_id, terminal in terminals:
+            try:
+                state, changed = self._advance(terminal)
+            except OSError:
+                LOG.warning("Unable to read log for terminal %s", terminal_id, exc_info=True)
+                continue
+            if changed:
+                changes[terminal_id] = state
+                self._publish(terminal_id, state)
+        return changes
+
+    def report(self, terminal_id: str, status: TerminalStatus) -> None:
+        """Publish a status known without a log, such as a headless process exit."""
+        self._publish(terminal_id, TrackedStatus(status))
+
+    @staticmethod
+    def _advance(terminal: _Terminal) -> Tuple[Optional[TrackedStatus], bool]:
+        with terminal.lock:
+            text, reset = terminal.tail.read()
+            if not text and not reset:
+                return terminal.state, False
+            if reset:
+                terminal.screen.reset()
+            printed = terminal.screen.feed(text)
+            delta = PaneDelta(
+                lines=printed.splitlines(), screen=terminal.screen.render(), reset=reset
+            )
+            rule = terminal.engine.match(delta, terminal.latched)
+            state = TrackedStatus(
+                status=terminal.engine.default if rule is None else rule.status,
+                prompt_pending=rule is not None and rule.prompt,
+            )
+            changed = state != terminal.state
+            terminal.state = state
+            return state, changed
+
+    def _publish(self, terminal_id: str, state: TrackedStatus) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(terminal_id, state)
+            except Exception:  # pragma: no cover - defensive guard
+                LOG.warning("Status listener failed for %s", terminal_id, exc_info=True)
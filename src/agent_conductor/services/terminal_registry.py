@@ -0,0 +1,103 @@
+"""In-memory copy of the terminal table for the server's hot paths."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from agent_conductor.models.terminal import Terminal as TerminalModel
+
+# (registry generation, writes to the terminal) when a database read started.
+Stamp = Tuple[int, int]
+
+
+class TerminalRegistry:
+    """Terminal metadata by ID, kept in step with the database by its writers.
+
+    :class:`TerminalService` loads it at startup. Every database access to a
+    terminal takes a :meth:`stamp` first. After committing, writers pass
+    their row to :meth:`update` (or :meth:`invalidate` it), and a miss is read
+    from the database and added with :meth:`fill`. Both drop the row instead
+    if another write to the terminal came in between, so a reader or writer
+    that loses a race with a delete or a newer status cannot put its stale
+    row back. Entries are replaced, never mutated, so a model returned by
+    :meth:`get` can be shared but must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._terminals: Dict[str, TerminalModel] = {}
+        # Writes per terminal ID; kept after a delete as its tombstone.
+        self._writes: Dict[str, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._terminals)
+
+    def load(self, terminals: Iterable[TerminalModel]) -> None:
+        """Replace the contents with ``terminals``."""
+        with self._lock:
+            self._terminals = {terminal.id: terminal for terminal in terminals}
+
+    def get(self, terminal_id: str) -> Optional[TerminalModel]:
+        with self._lock:
+            terminal = self._terminals.get(terminal_id)
+            if terminal is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return terminal
+
+    def stamp(self, terminal_id: str) -> Stamp:
+        """Take before reading ``terminal_id`` from the database; pass to :meth:`fill`."""
+        with self._lock:
+            return self._stamp(terminal_id)
+
+    def fill(self, terminal: TerminalModel, stamp: Stamp) -> None:
+        """Cache a row read after ``stamp`` unless the terminal was written since."""
+        with self._lock:
+            if self._stamp(terminal.id) == stamp:
+                self._terminals.setdefault(terminal.id, terminal)
+
+    def put(self, terminal: TerminalModel) -> None:
+        """Cache a terminal that no other caller can know about yet (just created)."""
+        with self._lock:
+            self._terminals[terminal.id] = terminal
+
+    def update(self, terminal: TerminalModel, stamp: Stamp) -> None:
+        """Cache a row a writer committed after ``stamp`` unless another write came between."""
+        with self._lock:
+            current = self._stamp(terminal.id)
+            self._writes[terminal.id] = current[1] + 1
+            if current == stamp:
+                self._terminals[terminal.id] = terminal
+            else:
+                self._terminals.pop(terminal.id, None)
+
+    def invalidate(self, terminal_id: str) -> None:
+        """Drop ``terminal_id`` after its row was updated or deleted (post-commit)."""
+        with self._lock:
+            self._terminals.pop(terminal_id, None)
+            self._writes[terminal_id] = self._writes.get(terminal_id, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._terminals.clear()
+            self._writes.clear()
+            self._generation += 1
+
+    def _stamp(self, terminal_id: str) -> Stamp:
+        return self._generation, self._writes.get(terminal_id, 0)
+
+    def stats(self) -> Dict[str, float]:
+        """Cached terminals, hits, misses and hit rate of :meth:`get`."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "terminals": len(self._terminals),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -2,30 +2,81 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import shlex
 import textwrap
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, select
 
 from agent_conductor import constants
-from agent_conductor.clients.database import Terminal as TerminalORM, session_scope
-from agent_conductor.clients.tmux import TmuxClient, TmuxError
+from agent_conductor.clients.database import Terminal as TerminalORM
+from agent_conductor.clients.database import async_session_scope, session_scope
+from agent_conductor.clients.tmux import TmuxClient, TmuxError, TmuxPane, window_target
+from agent_conductor.clients.tmux_pool import WindowPool
+from agent_conductor.clients.tmux_shards import TmuxShards
 from agent_conductor.models.enums import TerminalStatus
 from agent_conductor.models.terminal import Terminal as TerminalModel
+from agent_conductor.models.tmux_event import TmuxEvent
 from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
 from agent_conductor.providers.manager import ProviderManager, UnknownProviderError
+from agent_conductor.services.terminal_registry import TerminalRegistry
 from agent_conductor.utils.pathing import ensure_runtime_directories
 from agent_conductor.utils.terminal import generate_session_name, generate_terminal_id, window_name
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from agent_conductor.clients.tmux_async import AsyncTmuxClient
+    from agent_conductor.services.status_tracker import TrackedStatus
+
 LOG = logging.getLogger(__name__)
 
+# Provider CLIs booted at once by background starts.
+DEFAULT_STARTUP_CONCURRENCY = 8
+
 
 class TerminalService:
-    """Business logic for managing terminals."""
+    """Business logic for managing terminals.
+
+    With ``shards`` each new session is placed on one of several tmux servers
+    and every later operation on its terminals goes to that server
+    (``Terminal.tmux_socket``). Without it, ``tmux`` is the only server.
 
-    def __init__(self, tmux: Optional[TmuxClient] = None, providers: Optional[ProviderManager] = None) -> None:
-        self.tmux = tmux or TmuxClient()
-        self.providers = providers or ProviderManager(self.tmux)
+    Terminal lookups are served from :attr:`registry`, an in-memory copy of
+    the terminal table that every write below updates (or invalidates) after
+    it commits.
+    """
+
+    def __init__(
+        self,
+        tmux: Optional[TmuxClient] = None,
+        providers: Optional[ProviderManager] = None,
+        async_tmux: Optional[AsyncTmuxClient] = None,
+        window_pool: Optional[WindowPool] = None,
+        shards: Optional[TmuxShards] = None,
+        window_pools: Optional[Mapping[Optional[str], WindowPool]] = None,
+        startup_concurrency: int = DEFAULT_STARTUP_CONCURRENCY,
+        registry: Optional[TerminalRegistry] = None,
+    ) -> None:
+        if shards is None:
+            self.tmux = tmux or TmuxClient()
+            shards = TmuxShards.single(self.tmux, async_tmux)
+        else:
+            self.tmux = tmux or shards.client(shards.default_socket)
+            async_tmux = async_tmux or shards.async_client(shards.default_socket)
+        self.shards = shards
+        self.async_tmux = async_tmux
+        # One warm window pool per tmux server, keyed by socket name.
+        self.window_pools: Dict[Optional[str], WindowPool] = dict(window_pools or {})
+        if window_pool is not None:
+            self.window_pools[shards.default_socket] = window_pool
+        self.providers = providers or ProviderManager(self.tmux, async_tmux)
+        self.registry = registry or TerminalRegistry()
+        # Background starts in flight, set when each one finishes.
+        self.startup_concurrency = max(startup_concurrency, 1)
+        self._started: Dict[str, asyncio.Event] = {}
+        self._start_tasks: Set[asyncio.Task] = set()
+        self._slots: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
         ensure_runtime_directories()
 
     def create_terminal(
@@ -35,55 +86,162 @@ class TerminalService:
         agent_profile: Optional[str],
         session_name: Optional[str] = None,
         working_directory: Optional[str] = None,
+        *,
+        initialize: bool = True,
     ) -> TerminalModel:
-        """Create a terminal, spawning a new tmux session if needed."""
-        terminal_id = generate_terminal_id()
+        """Create a terminal, spawning a new tmux session if needed.
+
+        With ``initialize=False`` the terminal is returned as ``STARTING`` right
+        after its window exists; the provider CLI is started later by
+        :meth:`initialize_terminal` or :meth:`start_in_background`.
+        Headless providers get no window and can only join an existing session.
+        """
+        headless = self.providers.is_headless(provider_key)
+        if headless and session_name is None:
+            raise UnknownProviderError(
+                f"Provider '{provider_key}' is headless and only runs workers; "
+                "start the session with a tmux provider."
+            )
         target_session = session_name or generate_session_name()
         window = window_name(role, agent_profile, provider_key)
-        environment = {constants.TERMINAL_ENV_VAR: terminal_id}
-
-        if session_name is None:
-            self.tmux.create_session(
-                target_session, window, environment=environment, start_directory=working_directory
+        socket = self._place_session(session_name)
+        tmux = self.shards.client(socket)
+        window_pool = self.window_pools.get(socket)
+        warm = None
+        pane: Optional[TmuxPane] = None
+        if session_name is not None and not headless:
+            # Workers can take a CLI that is already running, under its reserved ID.
+            warm = self.providers.claim_warm(
+                provider_key,
+                agent_profile,
+                target_session,
+                window,
+                working_directory,
+                pipe_command=self._log_pipe_command,
+                tmux=tmux,
             )
+        if warm is not None:
+            terminal_id, pane = warm.terminal_id, warm.pane
+        elif headless:
+            # Each turn of a headless CLI appends to the terminal log itself.
+            terminal_id = generate_terminal_id()
         else:
-            self.tmux.create_window(
-                target_session, window, environment=environment, start_directory=working_directory
-            )
-
-        self._pipe_logs(target_session, window, terminal_id)
-
-        try:
-            self.providers.create_provider(
-                provider_key=provider_key,
-                terminal_id=terminal_id,
-                session_name=target_session,
-                window_name=window,
-                agent_profile=agent_profile,
+            terminal_id = generate_terminal_id()
+            pane = self._open_window(
+                tmux,
+                window_pool,
+                terminal_id,
+                target_session,
+                window,
+                new_session=session_name is None,
+                working_directory=working_directory,
             )
-        except ProviderInitializationError:
-            self.tmux.kill_window(target_session, window)
-            raise
+        if session_name is None:
+            # A new supervisor usually fans out workers in the same directory next.
+            if window_pool is not None:
+                window_pool.prime(working_directory)
+            self.providers.prime_warm(provider_key, working_directory)
+
+        self.providers.prepare_provider(
+            provider_key=provider_key,
+            terminal_id=terminal_id,
+            session_name=target_session,
+            window_name=window,
+            agent_profile=agent_profile,
+            pane_id=pane.pane_id if pane else None,
+            tmux=tmux,
+            async_tmux=self.shards.async_client(socket),
+            warm=warm is not None,
+            working_directory=working_directory,
+        )
 
         db_obj = TerminalORM(
             id=terminal_id,
             session_name=target_session,
             window_name=window,
+            tmux_window_id=pane.window_id if pane else None,
+            tmux_pane_id=pane.pane_id if pane else None,
+            tmux_socket=socket,
+            role=role,
             provider=provider_key,
             agent_profile=agent_profile,
-            status=TerminalStatus.READY,
+            working_directory=working_directory,
+            status=TerminalStatus.STARTING,
         )
         with session_scope() as db:
             db.add(db_obj)
+            db.flush()
+            db.refresh(db_obj)  # server defaults (created_at, role) for the registry
 
         terminal_model = TerminalModel.model_validate(db_obj, from_attributes=True)
+        self.registry.put(terminal_model)
+        if not initialize:
+            return terminal_model
+        try:
+            return self.initialize_terminal(terminal_id)
+        except ProviderInitializationError:
+            self.delete_terminal(terminal_id)
+            raise
+
+    def _open_window(
+        self,
+        tmux: TmuxClient,
+        window_pool: Optional[WindowPool],
+        terminal_id: str,
+        session_name: str,
+        window: str,
+        *,
+        new_session: bool,
+        working_directory: Optional[str],
+    ) -> TmuxPane:
+        """Create the terminal's window, from the warm window pool if possible."""
+        environment = {constants.TERMINAL_ENV_VAR: terminal_id}
+        pipe_command = self._log_pipe_command(terminal_id)
+        pane = None
+        if not new_session and window_pool is not None:
+            # Workers can take a pre-started shell instead of waiting for a cold one.
+            pane = window_pool.claim(
+                session_name,
+                window,
+                working_directory=working_directory,
+                environment=environment,
+                pipe_command=pipe_command,
+            )
+        if pane is None:
+            # Window creation, environment and log piping go out as one tmux batch.
+            create = tmux.create_session if new_session else tmux.create_window
+            pane = create(
+                session_name,
+                window,
+                environment=environment,
+                start_directory=working_directory,
+                pipe_command=pipe_command,
+            )
+        return pane
+
+    def initialize_terminal(self, terminal_id: str) -> TerminalModel:
+        """Start a ``STARTING`` terminal's provider CLI and mark it READY (blocking).
+
+        On failure the terminal is marked ERROR, its window is left for
+        inspection, and :class:`ProviderInitializationError` propagates.
+        """
+        try:
+            self.providers.initialize_provider(terminal_id)
+        except ProviderInitializationError:
+            self._finish_start(terminal_id, TerminalStatus.ERROR)
+            raise
+        terminal = self._finish_start(terminal_id, TerminalStatus.READY)
+        if terminal is None:
+            raise ProviderInitializationError(
+                f"Terminal '{terminal_id}' was removed during startup."
+            )
 
-        if session_name is not None and not window.startswith("supervisor-"):
+        if terminal.role != constants.SUPERVISOR_ROLE:
             try:
                 self._send_worker_bootstrap(
-                    session_name=target_session,
+                    session_name=terminal.session_name,
                     worker_terminal_id=terminal_id,
-                    agent_profile=agent_profile,
+                    agent_profile=terminal.agent_profile,
                 )
             except Exception:  # pragma: no cover - defensive guard
                 LOG.warning(
@@ -91,16 +249,137 @@ class TerminalService:
                     terminal_id,
                     exc_info=True,
                 )
+        return terminal
+
+    def start_in_background(self, terminal_id: str) -> asyncio.Task:
+        """Run :meth:`initialize_terminal` in a worker thread from the event loop.
+
+        :meth:`wait_until_started` returns once the task has finished.
+        """
+        return self._start_group([terminal_id], rollback=False)
+
+    def start_session_in_background(self, terminal_ids: Sequence[str]) -> asyncio.Task:
+        """Start several terminals concurrently, all or nothing.
+
+        At most ``startup_concurrency`` provider CLIs boot at once. If any
+        terminal fails to start, the others are deleted once every start has
+        finished; the failed ones stay as ERROR. Waiters are released after
+        that decision.
+        """
+        return self._start_group(list(terminal_ids), rollback=True)
+
+    def _start_group(self, terminal_ids: List[str], *, rollback: bool) -> asyncio.Task:
+        events = [
+            self._started.setdefault(terminal_id, asyncio.Event()) for terminal_id in terminal_ids
+        ]
+
+        async def _run() -> None:
+            try:
+                results = await asyncio.gather(
+                    *(self._start_one(terminal_id) for terminal_id in terminal_ids)
+                )
+                if rollback and not all(results):
+                    for terminal_id, started in zip(terminal_ids, results):
+                        if started:
+                            LOG.info("Rolling back terminal %s after a failed start", terminal_id)
+                            await asyncio.to_thread(self.delete_terminal, terminal_id)
+            finally:
+                for terminal_id, event in zip(terminal_ids, events):
+                    self._started.pop(terminal_id, None)
+                    event.set()
+
+        task = asyncio.create_task(_run())
+        self._start_tasks.add(task)
+        task.add_done_callback(self._start_tasks.discard)
+        return task
+
+    async def _start_one(self, terminal_id: str) -> bool:
+        async with self._startup_slots():
+            try:
+                await asyncio.to_thread(self.initialize_terminal, terminal_id)
+                return True
+            except ProviderInitializationError as exc:
+                LOG.warning("Terminal %s failed to start: %s", terminal_id, exc)
+            except Exception:
+                LOG.exception("Terminal %s failed to start", terminal_id)
+                self._finish_start(terminal_id, TerminalStatus.ERROR)
+            return False
+
+    def _startup_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding concurrent provider starts on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots[0] is not loop:
+            self._slots = (loop, asyncio.Semaphore(self.startup_concurrency))
+        return self._slots[1]
+
+    async def wait_until_started(
+        self, terminal_id: str, timeout: Optional[float] = None
+    ) -> Optional[TerminalModel]:
+        """Wait up to ``timeout`` seconds for a background start; return the terminal.
+
+        The terminal is still ``STARTING`` if the timeout ran out first, and
+        None if it does not exist.
+        """
+        started = self._started.get(terminal_id)
+        if started is not None:
+            try:
+                await asyncio.wait_for(started.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return await self.get_terminal_async(terminal_id)
+
+    def fail_interrupted_starts(self) -> int:
+        """Mark terminals left ``STARTING`` by a previous server process as ERROR.
+
+        Called at startup, before any background start; returns the count.
+        """
+        with session_scope() as db:
+            failed = (
+                db.query(TerminalORM)
+                .filter(TerminalORM.status == TerminalStatus.STARTING)
+                .update({TerminalORM.status: TerminalStatus.ERROR}, synchronize_session=False)
+            )
+        if failed:
+            self.registry.clear()  # cached rows may still say STARTING
+        return failed
 
-        return terminal_model
+    def load_registry(self) -> int:
+        """Fill :attr:`registry` with every terminal row; returns the count."""
+        with session_scope() as db:
+            terminals = [
+                TerminalModel.model_validate(row, from_attributes=True)
+                for row in db.query(TerminalORM).all()
+            ]
+        self.registry.load(terminals)
+        return len(terminals)
 
     def get_terminal(self, terminal_id: str) -> Optional[TerminalModel]:
-        """Return terminal metadata if it exists."""
+        """Return terminal metadata if it exists (from the registry when cached)."""
+        cached = self.registry.get(terminal_id)
+        if cached is not None:
+            return cached
+        stamp = self.registry.stamp(terminal_id)
         with session_scope() as db:
             terminal = db.get(TerminalORM, terminal_id)
             if not terminal:
                 return None
-            return TerminalModel.model_validate(terminal, from_attributes=True)
+            model = TerminalModel.model_validate(terminal, from_attributes=True)
+        self.registry.fill(model, stamp)
+        return model
+
+    async def get_terminal_async(self, terminal_id: str) -> Optional[TerminalModel]:
+        """Awaitable :meth:`get_terminal` for callers on the event loop."""
+        cached = self.registry.get(terminal_id)
+        if cached is not None:
+            return cached
+        stamp = self.registry.stamp(terminal_id)
+        async with async_session_scope() as db:
+            terminal = await db.get(TerminalORM, terminal_id)
+            if not terminal:
+                return None
+            model = TerminalModel.model_validate(terminal, from_attributes=True)
+        self.registry.fill(model, stamp)
+        return model
 
     def list_terminals(self, session_name: str) -> List[TerminalModel]:
         with session_scope() as db:
@@ -112,6 +391,16 @@ class TerminalService:
             )
             return [TerminalModel.model_validate(obj, from_attributes=True) for obj in results]
 
+    async def list_terminals_async(self, session_name: str) -> List[TerminalModel]:
+        """Awaitable :meth:`list_terminals` for callers on the event loop."""
+        async with async_session_scope() as db:
+            results = await db.scalars(
+                select(TerminalORM)
+                .where(TerminalORM.session_name == session_name)
+                .order_by(TerminalORM.created_at.asc())
+            )
+            return [TerminalModel.model_validate(obj, from_attributes=True) for obj in results]
+
     def ensure_provider_loaded(self, terminal_id: str) -> BaseProvider:
         """Ensure an in-memory provider exists for a terminal (handles API reloads)."""
         try:
@@ -120,6 +409,10 @@ class TerminalService:
             terminal = self.get_terminal(terminal_id)
             if not terminal:
                 raise
+            if terminal.status == TerminalStatus.EXITED:
+                raise UnknownProviderError(f"Terminal '{terminal_id}' has exited.")
+            if terminal.status == TerminalStatus.STARTING:
+                raise UnknownProviderError(f"Terminal '{terminal_id}' is still starting.")
             LOG.info(
                 "Re-attaching provider %s for terminal %s (%s/%s)",
                 terminal.provider,
@@ -133,6 +426,10 @@ class TerminalService:
                 session_name=terminal.session_name,
                 window_name=terminal.window_name,
                 agent_profile=terminal.agent_profile,
+                pane_id=terminal.tmux_pane_id,
+                tmux=self.shards.client(terminal.tmux_socket),
+                async_tmux=self.shards.async_client(terminal.tmux_socket),
+                working_directory=terminal.working_directory,
             )
 
     def send_input(self, terminal_id: str, message: str) -> None:
@@ -144,9 +441,79 @@ class TerminalService:
         terminal = self.get_terminal(terminal_id)
         if not terminal:
             raise RuntimeError(f"Terminal '{terminal_id}' not found.")
-        history = self.tmux.capture_pane(terminal.session_name, terminal.window_name)
+        if self.providers.is_headless(terminal.provider):
+            return self._headless_output(terminal_id, last_only)
         if last_only:
             provider = self.ensure_provider_loaded(terminal_id)
+            answer = provider.last_response()
+            if answer is not None:
+                return answer
+        history = self.shards.client(terminal.tmux_socket).capture_pane(
+            terminal.session_name, terminal.window_name, pane_id=terminal.tmux_pane_id
+        )
+        if last_only:
+            return provider.extract_last_message_from_history(history)
+        return history
+
+    def _headless_output(self, terminal_id: str, last_only: bool) -> str:
+        provider = self.ensure_provider_loaded(terminal_id)
+        answer = provider.last_response() if last_only else None
+        if answer is not None:
+            return answer
+        history = provider.read_history()
+        return provider.extract_last_message_from_history(history) if last_only else history
+
+    def capture_screens(self, terminals: Iterable[TerminalModel]) -> Dict[str, str]:
+        """Capture the visible screen of many terminals, one tmux call per server.
+
+        Results are keyed by terminal ID.
+        """
+        screens: Dict[str, str] = {}
+        for socket, targets in self._pane_targets(terminals).items():
+            screens.update(self.shards.client(socket).capture_many(targets))
+        return screens
+
+    async def capture_screens_async(self, terminals: Iterable[TerminalModel]) -> Dict[str, str]:
+        """Awaitable :meth:`capture_screens`; the tmux servers are queried concurrently."""
+        terminals = list(terminals)
+        by_socket = self._pane_targets(terminals)
+        clients = {socket: self.shards.async_client(socket) for socket in by_socket}
+        if any(client is None for client in clients.values()):
+            return await asyncio.to_thread(self.capture_screens, terminals)
+        results = await asyncio.gather(
+            *(clients[socket].capture_many(targets) for socket, targets in by_socket.items())
+        )
+        screens: Dict[str, str] = {}
+        for captured in results:
+            screens.update(captured)
+        return screens
+
+    async def send_input_async(self, terminal_id: str, message: str) -> None:
+        """Awaitable :meth:`send_input` for callers on the event loop."""
+        provider = self.ensure_provider_loaded(terminal_id)
+        await provider.send_input_async(message)
+        await self._update_status_async(terminal_id, await provider.get_status_async())
+
+    async def capture_output_async(self, terminal_id: str, last_only: bool = False) -> str:
+        """Awaitable :meth:`capture_output` for callers on the event loop."""
+        terminal = await self.get_terminal_async(terminal_id)
+        if not terminal:
+            raise RuntimeError(f"Terminal '{terminal_id}' not found.")
+        if self.providers.is_headless(terminal.provider):
+            return await asyncio.to_thread(self._headless_output, terminal_id, last_only)
+        async_tmux = self.shards.async_client(terminal.tmux_socket)
+        if async_tmux is None:
+            return await asyncio.to_thread(self.capture_output, terminal_id, last_only)
+        if last_only:
+            provider = self.ensure_provider_loaded(terminal_id)
+            # With structured output the answer is already parsed; no capture needed.
+            answer = provider.last_response()
+            if answer is not None:
+                return answer
+        history = await async_tmux.capture_pane(
+            terminal.session_name, terminal.window_name, pane_id=terminal.tmux_pane_id
+        )
+        if last_only:
             return provider.extract_last_message_from_history(history)
         return history
 
@@ -157,8 +524,12 @@ class TerminalService:
 
         # Clean up provider and tmux window
         self.providers.cleanup_provider(terminal_id)
+        tmux = self.shards.client(terminal.tmux_socket)
         try:
-            self.tmux.kill_window(terminal.session_name, terminal.window_name)
+            if not self.providers.is_headless(terminal.provider):
+                tmux.kill_window(
+                    terminal.session_name, terminal.window_name, window_id=terminal.tmux_window_id
+                )
         except TmuxError:
             LOG.warning(
                 "tmux window %s/%s already missing during delete_terminal(%s)",
@@ -181,10 +552,11 @@ class TerminalService:
             else:
                 session = terminal.session_name
                 remaining = 0
+        self.registry.invalidate(terminal_id)
 
         if remaining == 0:
             try:
-                self.tmux.kill_session(session)
+                tmux.kill_session(session)
             except TmuxError:
                 LOG.debug(
                     "tmux session %s already missing while cleaning up terminal %s",
@@ -192,18 +564,148 @@ class TerminalService:
                     terminal_id,
                 )
 
+    @staticmethod
+    def _pane_targets(
+        terminals: Iterable[TerminalModel],
+    ) -> Dict[Optional[str], Dict[str, str]]:
+        """Group capture targets by tmux socket: ``{socket: {terminal_id: target}}``."""
+        targets: Dict[Optional[str], Dict[str, str]] = {}
+        for terminal in terminals:
+            targets.setdefault(terminal.tmux_socket, {})[terminal.id] = (
+                terminal.tmux_pane_id
+                or window_target(terminal.session_name, terminal.window_name)
+            )
+        return targets
+
+    def _place_session(self, session_name: Optional[str]) -> Optional[str]:
+        """Return the tmux socket for a new terminal.
+
+        Workers join their session's server; new sessions go where the
+        placement policy puts them given the live terminals per socket.
+        """
+        if len(self.shards.sockets) == 1 and session_name is None:
+            return self.shards.default_socket
+        with session_scope() as db:
+            if session_name is not None:
+                row = (
+                    db.query(TerminalORM.tmux_socket)
+                    .filter(TerminalORM.session_name == session_name)
+                    .first()
+                )
+                return row[0] if row else self.shards.default_socket
+            load = dict(
+                db.query(TerminalORM.tmux_socket, func.count(TerminalORM.id))
+                .filter(TerminalORM.status != TerminalStatus.EXITED)
+                .group_by(TerminalORM.tmux_socket)
+                .all()
+            )
+        return self.shards.place(load)
+
+    def handle_tmux_event(self, event: TmuxEvent) -> List[str]:
+        """Mark terminals whose pane, window or session disappeared as EXITED.
+
+        Returns the affected terminal IDs. Their providers are dropped so
+        nothing polls or types into the dead panes. A ``window-resized`` event
+        only resizes the window's replayed pane-log screens and returns none.
+        """
+        if event.event == "window-resized":
+            self._resize_screens(event)
+            return []
+        with session_scope() as db:
+            # Pane, window and session IDs are only unique within one tmux server.
+            query = db.query(TerminalORM).filter(
+                TerminalORM.status != TerminalStatus.EXITED,
+                TerminalORM.tmux_socket == event.socket_name,
+            )
+            if event.event in ("pane-died", "pane-exited") and event.pane_id:
+                query = query.filter(TerminalORM.tmux_pane_id == event.pane_id)
+            elif event.event == "window-unlinked" and event.window_id:
+                query = query.filter(TerminalORM.tmux_window_id == event.window_id)
+                # Windows also unlink when moved between sessions (e.g. out of the
+                # warm pool); only an unlink from the terminal's own session counts.
+                if event.session_name:
+                    query = query.filter(TerminalORM.session_name == event.session_name)
+            elif event.event == "session-closed" and event.session_name:
+                query = query.filter(TerminalORM.session_name == event.session_name)
+            else:
+                return []
+            terminals = query.all()
+            for terminal in terminals:
+                terminal.status = TerminalStatus.EXITED
+            exited = [terminal.id for terminal in terminals]
+
+        for terminal_id in exited:
+            LOG.info("Terminal %s exited (tmux %s)", terminal_id, event.event)
+            self.registry.invalidate(terminal_id)
+            self.providers.discard_provider(terminal_id)
+        return exited
+
+    def _resize_screens(self, event: TmuxEvent) -> None:
+        if not event.window_id:
+            return
+        with session_scope() as db:
+            terminal_ids = [
+                terminal_id
+                for (terminal_id,) in db.query(TerminalORM.id).filter(
+                    TerminalORM.status != TerminalStatus.EXITED,
+                    TerminalORM.tmux_socket == event.socket_name,
+                    TerminalORM.tmux_window_id == event.window_id,
+                )
+            ]
+        for terminal_id in terminal_ids:
+            self.providers.resize_screen(terminal_id)
+
+    def record_status(self, terminal_id: str, state: TrackedStatus) -> None:
+        """Persist a status published by the pane-log :class:`StatusTracker`."""
+        stamp = self.registry.stamp(terminal_id)
+        with session_scope() as db:
+            terminal = db.get(TerminalORM, terminal_id)
+            # STARTING is left for initialize_terminal to resolve.
+            if not terminal or terminal.status in (TerminalStatus.EXITED, TerminalStatus.STARTING):
+                return
+            terminal.status = state.status
+            model = TerminalModel.model_validate(terminal, from_attributes=True)
+        self.registry.update(model, stamp)
+
+    def _finish_start(
+        self, terminal_id: str, status: TerminalStatus
+    ) -> Optional[TerminalModel]:
+        """Move a terminal out of ``STARTING`` (unless it exited meanwhile)."""
+        stamp = self.registry.stamp(terminal_id)
+        with session_scope() as db:
+            terminal = db.get(TerminalORM, terminal_id)
+            if not terminal:
+                return None
+            if terminal.status == TerminalStatus.STARTING:
+                terminal.status = status
+            model = TerminalModel.model_validate(terminal, from_attributes=True)
+        self.registry.update(model, stamp)
+        return model
+
     def _update_status(self, terminal_id: str, status: TerminalStatus) -> None:
+        stamp = self.registry.stamp(terminal_id)
         with session_scope() as db:
             terminal = db.get(TerminalORM, terminal_id)
             if not terminal:
                 return
             terminal.status = status
+            model = TerminalModel.model_validate(terminal, from_attributes=True)
+        self.registry.update(model, stamp)
+
+    async def _update_status_async(self, terminal_id: str, status: TerminalStatus) -> None:
+        stamp = self.registry.stamp(terminal_id)
+        async with async_session_scope() as db:
+            terminal = await db.get(TerminalORM, terminal_id)
+            if not terminal:
+                return
+            terminal.status = status
+            model = TerminalModel.model_validate(terminal, from_attributes=True)
+        self.registry.update(model, stamp)
 
-    def _pipe_logs(self, session_name: str, window_name: str, terminal_id: str) -> None:
+    def _log_pipe_command(self, terminal_id: str) -> str:
         log_path = constants.TERMINAL_LOG_DIR / f"{terminal_id}.log"
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        command = f"cat >> {shlex.quote(str(log_path))}"
-        self.tmux.pipe_pane(session_name, window_name, command)
+        return f"cat >> {shlex.quote(str(log_path))}"
 
     def _find_supervisor_id(self, session_name: str) -> Optional[str]:
         with session_scope() as db:
@@ -211,7 +713,7 @@ class TerminalService:
                 db.query(TerminalORM)
                 .filter(
                     TerminalORM.session_name == session_name,
-                    TerminalORM.window_name.startswith("supervisor-"),
+                    TerminalORM.role == constants.SUPERVISOR_ROLE,
                 )
                 .order_by(TerminalORM.created_at.asc())
                 .first()
@@ -254,4 +756,6 @@ class TerminalService:
             """
         ).strip()
 
-        self.send_input(worker_terminal_id, message)
+        provider = self.ensure_provider_loaded(worker_terminal_id)
+        provider.send_briefing(message)
+        self._update_status(worker_terminal_id, provider.get_status())
@@ -5,6 +5,7 @@ from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 
+from agent_conductor import constants
 from agent_conductor.services.session_service import SessionService
 from agent_conductor.services.inbox_service import InboxService
 from agent_conductor.services.approval_service import ApprovalService
@@ -33,7 +34,7 @@ def create_router(
             terminal.id: inbox_service.list_messages(terminal.id)
             for session in sessions
             for terminal in session.terminals
-            if terminal.window_name.startswith("supervisor-")
+            if terminal.role == constants.SUPERVISOR_ROLE
         }
         return templates.TemplateResponse(
             "dashboard.html",
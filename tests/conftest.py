@@ -9,21 +9,27 @@ from fastapi.testclient import TestClient
 from agent_conductor import constants
 from agent_conductor.api import main as api_main
 from agent_conductor.clients import database
+from agent_conductor.clients.tmux import TmuxPane
 from agent_conductor.models.enums import TerminalStatus
 from agent_conductor.services.approval_service import ApprovalService
 from agent_conductor.services.inbox_service import InboxService
 from agent_conductor.services.session_service import SessionService
 from agent_conductor.services.terminal_service import TerminalService
+from agent_conductor.providers.base import ProviderInitializationError
 from agent_conductor.providers.manager import UnknownProviderError
 
 
 class FakeTmuxClient:
     """Minimal tmux stand-in for tests."""
 
-    def __init__(self) -> None:
+    def __init__(self, socket_name: Optional[str] = None) -> None:
+        self.socket_name = socket_name
         self.sessions: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self.panes: Dict[str, Dict[str, str]] = {}
         self.killed_windows = []
         self.killed_sessions = []
+        self.capture_many_calls = []
+        self._next_id = 0
 
     # Session / window lifecycle -------------------------------------------------
     def session_exists(self, name: str) -> bool:
@@ -35,11 +41,12 @@ class FakeTmuxClient:
         window_name: str,
         environment=None,
         start_directory: Optional[str] = None,
-    ):
+        pipe_command: Optional[str] = None,
+    ) -> TmuxPane:
         if self.session_exists(session_name):
             raise RuntimeError("session exists")
         self.sessions[session_name] = {}
-        self.create_window(session_name, window_name, environment)
+        return self.create_window(session_name, window_name, environment, pipe_command=pipe_command)
 
     def create_window(
         self,
@@ -47,32 +54,54 @@ class FakeTmuxClient:
         window_name: str,
         environment=None,
         start_directory: Optional[str] = None,
-    ):
+        pipe_command: Optional[str] = None,
+    ) -> TmuxPane:
+        self._next_id += 1
+        pane = TmuxPane(session_name, window_name, f"@{self._next_id}", f"%{self._next_id}")
         session = self.sessions.setdefault(session_name, {})
         session[window_name] = {
             "history": "",
             "environment": environment or {},
-            "pipe_commands": [],
+            "pipe_commands": [(pipe_command, True)] if pipe_command else [],
+            "window_id": pane.window_id,
         }
+        self.panes[pane.pane_id] = session[window_name]
+        return pane
 
     def kill_session(self, session_name: str) -> None:
         self.sessions.pop(session_name, None)
         self.killed_sessions.append(session_name)
 
-    def kill_window(self, session_name: str, window_name: str) -> None:
+    def kill_window(self, session_name: str, window_name: str, window_id=None) -> None:
         windows = self.sessions.get(session_name, {})
         windows.pop(window_name, None)
         self.killed_windows.append((session_name, window_name))
 
     # Pane interactions ----------------------------------------------------------
-    def send_keys(self, session_name: str, window_name: str, keys: str) -> None:
-        self.append_history(session_name, window_name, keys)
+    def send_keys(self, session_name: str, window_name: str, keys: str, pane_id=None, **_) -> None:
+        self._pane(session_name, window_name, pane_id)["history"] += f"{keys}\n"
+
+    def capture_pane(
+        self, session_name: str, window_name: str, start=None, end=None, pane_id=None
+    ) -> str:
+        return self._pane(session_name, window_name, pane_id)["history"]
+
+    def capture_many(self, targets, start=0, end=None) -> Dict[str, str]:
+        self.capture_many_calls.append(dict(targets))
+        return {
+            key: self.panes[target]["history"]
+            for key, target in targets.items()
+            if target in self.panes
+        }
 
-    def capture_pane(self, session_name: str, window_name: str, start=None, end=None) -> str:
-        return self.sessions[session_name][window_name]["history"]
+    def pane_height(self, session_name: str, window_name: str, pane_id=None) -> int:
+        self._pane(session_name, window_name, pane_id)
+        return 24
 
-    def pipe_pane(self, session_name: str, window_name: str, command: str, append: bool = True) -> None:
-        self.sessions[session_name][window_name]["pipe_commands"].append((command, append))
+    def pipe_pane(
+        self, session_name: str, window_name: str, command: str, append: bool = True, pane_id=None
+    ) -> None:
+        self._pane(session_name, window_name, pane_id)["pipe_commands"].append((command, append))
 
     # Test helpers ---------------------------------------------------------------
     def append_history(self, session_name: str, window_name: str, text: str) -> None:
@@ -80,6 +109,11 @@ class FakeTmuxClient:
         existing = data["history"]
         data["history"] = f"{existing}{text}\n"
 
+    def _pane(self, session_name: str, window_name: str, pane_id: Optional[str]):
+        if pane_id is not None:
+            return self.panes[pane_id]
+        return self.sessions[session_name][window_name]
+
 
 class StubProvider:
     """Lightweight provider for exercising TerminalService."""
@@ -93,6 +127,8 @@ class StubProvider:
         self.sent_messages = []
         self.cleaned = False
         self.pending_prompt: Optional[str] = None
+        # Set to answer ``last_response`` without reading the history.
+        self.structured_answer: Optional[str] = None
         self._prompt_consumed = False
 
     def initialize(self) -> None:
@@ -104,9 +140,21 @@ class StubProvider:
         # Simulate immediate completion for tests
         self.status = TerminalStatus.COMPLETED
 
+    async def send_input_async(self, message: str) -> None:
+        self.send_input(message)
+
+    def send_briefing(self, message: str) -> None:
+        self.send_input(message)
+
     def get_status(self) -> TerminalStatus:
         return self.status
 
+    async def get_status_async(self) -> TerminalStatus:
+        return self.status
+
+    def last_response(self) -> Optional[str]:
+        return self.structured_answer
+
     def extract_last_message_from_history(self, history: str) -> str:
         lines = [line for line in history.splitlines() if line.strip()]
         return lines[-1] if lines else ""
@@ -122,6 +170,12 @@ class StubProvider:
         self._prompt_consumed = True
         return self.pending_prompt
 
+    async def detect_interactive_prompt_async(self) -> Optional[str]:
+        return self.detect_interactive_prompt()
+
+    def interactive_prompt_from_screen(self, screen: str) -> Optional[str]:
+        return self.detect_interactive_prompt()
+
 
 class StubProviderManager:
     """Test double that mirrors ProviderManager behaviour."""
@@ -129,16 +183,47 @@ class StubProviderManager:
     def __init__(self, tmux: FakeTmuxClient) -> None:
         self.tmux = tmux
         self.providers: Dict[str, StubProvider] = {}
+        self.starting: Dict[str, StubProvider] = {}
+        # Set to make the next initialize_provider call fail with this message.
+        self.init_error: Optional[str] = None
 
-    def create_provider(
+    def create_provider(self, *args, **kwargs) -> StubProvider:
+        provider = self.prepare_provider(*args, **kwargs)
+        return self.initialize_provider(provider.terminal_id)
+
+    def prepare_provider(
         self,
         provider_key: str,
         terminal_id: str,
         session_name: str,
         window_name: str,
         agent_profile: str | None,
+        pane_id: str | None = None,
+        *,
+        tmux: FakeTmuxClient | None = None,
+        async_tmux=None,
+        warm: bool = False,
+        working_directory: str | None = None,
     ) -> StubProvider:
-        provider = StubProvider(terminal_id, session_name, window_name, self.tmux)
+        provider = StubProvider(terminal_id, session_name, window_name, tmux or self.tmux)
+        provider.warm = warm
+        self.starting[terminal_id] = provider
+        return provider
+
+    def is_headless(self, provider_key: str) -> bool:
+        return False
+
+    def claim_warm(self, provider_key, agent_profile, session_name, window_name, *args, **kwargs):
+        return None
+
+    def prime_warm(self, provider_key: str, working_directory: Optional[str] = None) -> None:
+        pass
+
+    def initialize_provider(self, terminal_id: str) -> StubProvider:
+        provider = self.starting.pop(terminal_id)
+        if self.init_error:
+            error, self.init_error = self.init_error, None
+            raise ProviderInitializationError(error)
         provider.initialize()
         self.providers[terminal_id] = provider
         return provider
@@ -156,20 +241,32 @@ class StubProviderManager:
         session_name: str,
         window_name: str,
         agent_profile: str | None,
+        pane_id: str | None = None,
+        *,
+        tmux: FakeTmuxClient | None = None,
+        async_tmux=None,
+        working_directory: str | None = None,
     ) -> StubProvider:
         provider = self.providers.get(terminal_id)
         if provider:
             return provider
-        provider = StubProvider(terminal_id, session_name, window_name, self.tmux)
+        provider = StubProvider(terminal_id, session_name, window_name, tmux or self.tmux)
         provider.initialize()
         self.providers[terminal_id] = provider
         return provider
 
     def cleanup_provider(self, terminal_id: str) -> None:
+        self.starting.pop(terminal_id, None)
         provider = self.providers.pop(terminal_id, None)
         if provider:
             provider.cleanup()
 
+    def discard_provider(self, terminal_id: str) -> None:
+        self.providers.pop(terminal_id, None)
+
+    def resize_screen(self, terminal_id: str) -> None:
+        pass
+
 
 @pytest.fixture(autouse=True)
 def temp_runtime_dirs(tmp_path, monkeypatch):
@@ -1,5 +1,7 @@
+import threading
+
 from agent_conductor.clients.database import ApprovalRequest as ApprovalORM, session_scope
-from agent_conductor.models.enums import ApprovalStatus
+from agent_conductor.models.enums import ApprovalStatus, InboxStatus, TerminalStatus
 
 
 def test_dashboard_route(api_client):
@@ -19,6 +21,7 @@ def test_api_session_and_approval_flow(api_client, provider_manager):
     )
     assert response.status_code == 201
     conductor = response.json()
+    assert conductor["status"] == TerminalStatus.STARTING
     session_name = conductor["session_name"]
     supervisor_id = conductor["id"]
 
@@ -33,6 +36,11 @@ def test_api_session_and_approval_flow(api_client, provider_manager):
     assert worker_resp.status_code == 201
     worker = worker_resp.json()
     worker_id = worker["id"]
+    assert worker["status"] == TerminalStatus.STARTING
+
+    # Startup runs in the background; wait for it before typing into the worker.
+    waited = api_client.get(f"/terminals/{worker_id}/wait", params={"timeout": 5}).json()
+    assert waited["status"] != TerminalStatus.STARTING
 
     send_resp = api_client.post(
         f"/terminals/{worker_id}/input",
@@ -79,3 +87,81 @@ def test_api_session_and_approval_flow(api_client, provider_manager):
 
     delete_conductor = api_client.delete(f"/terminals/{supervisor_id}")
     assert delete_conductor.status_code == 204
+
+
+def test_failed_worker_start_rolls_back_the_session(api_client, provider_manager, fake_tmux):
+    provider_manager.init_error = "CLI did not come up"
+    response = api_client.post(
+        "/sessions",
+        json={
+            "provider": "claude_code",
+            "role": "supervisor",
+            "agent_profile": "conductor",
+            "workers": [
+                {"provider": "claude_code", "role": "worker", "agent_profile": "developer"},
+                {"provider": "claude_code", "role": "worker", "agent_profile": "tester"},
+            ],
+        },
+    )
+    assert response.status_code == 201
+    session_name = response.json()["session_name"]
+
+    session = api_client.get(f"/sessions/{session_name}/wait", params={"timeout": 5}).json()
+    # Only the terminal that failed is left, as ERROR, with its window for inspection.
+    assert [t["status"] for t in session["terminals"]] == [TerminalStatus.ERROR]
+    assert list(fake_tmux.sessions[session_name]) == [session["terminals"][0]["window_name"]]
+    assert provider_manager.providers == {}
+
+
+def test_tmux_pane_exit_event_marks_terminal_exited(api_client, terminal_service, provider_manager):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+    api_client.post(
+        "/inbox", json={"sender_id": supervisor.id, "receiver_id": worker.id, "message": "hi"}
+    )
+
+    response = api_client.post(
+        "/tmux/events", json={"event": "pane-exited", "pane_id": worker.tmux_pane_id}
+    )
+    assert response.status_code == 202
+    assert response.json() == {"exited": [worker.id]}
+
+    assert terminal_service.get_terminal(worker.id).status == TerminalStatus.EXITED
+    assert terminal_service.get_terminal(supervisor.id).status != TerminalStatus.EXITED
+    registry = api_client.get("/terminals/registry").json()
+    assert registry["terminals"] == 2 and registry["hit_rate"] > 0
+    assert worker.id not in provider_manager.providers
+    inbox = api_client.get(f"/inbox/{worker.id}").json()
+    assert [message["status"] for message in inbox] == [InboxStatus.FAILED]
+
+    closed = api_client.post(
+        "/tmux/events", json={"event": "session-closed", "session_name": supervisor.session_name}
+    )
+    assert closed.json() == {"exited": [supervisor.id]}
+
+
+def test_tmux_heavy_routes_run_off_the_event_loop(api_client, fake_tmux, monkeypatch):
+    threads = []
+    for name in ("create_session", "create_window", "kill_window"):
+        original = getattr(fake_tmux, name)
+
+        def record(*args, _original=original, _name=name, **kwargs):
+            threads.append((_name, threading.current_thread().name))
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(fake_tmux, name, record)
+
+    supervisor = api_client.post(
+        "/sessions", json={"provider": "claude_code", "role": "supervisor"}
+    ).json()
+    worker = api_client.post(
+        f"/sessions/{supervisor['session_name']}/terminals",
+        json={"provider": "claude_code", "role": "worker"},
+    ).json()
+    assert api_client.delete(f"/terminals/{worker['id']}").status_code == 204
+
+    assert {name for name, _ in threads} == {"create_session", "create_window", "kill_window"}
+    # asyncio.to_thread's default executor, not the thread running the loop.
+    assert all(thread.startswith("asyncio_") for _, thread in threads)
@@ -72,3 +72,32 @@ def test_launch_with_workers(monkeypatch):
     assert worker["agent_profile"] == "developer"
     assert "working_directory" in worker
     assert "worker-developer" in result.output
+
+
+def test_session_command_reads_one_session(monkeypatch):
+    calls = []
+
+    def fake_request(method, path, payload=None, missing_ok=False):
+        calls.append((method, path))
+        if path == "/sessions/missing":
+            return None
+        return {
+            "name": "conductor-1234",
+            "terminals": [
+                {"id": "supervisor-id", "status": "READY"},
+                {"id": "worker-id", "agent_profile": "developer", "status": "RUNNING"},
+            ],
+        }
+
+    monkeypatch.setattr("agent_conductor.cli.main._request", fake_request)
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["session", "conductor-1234"])
+    assert result.exit_code == 0
+    assert "Supervisor: supervis (READY)" in result.output
+    assert "worker-i (developer, RUNNING)" in result.output
+
+    result = runner.invoke(cli, ["session", "missing"])
+    assert result.exit_code != 0
+    assert "Session 'missing' not found" in result.output
+    assert calls == [("GET", "/sessions/conductor-1234"), ("GET", "/sessions/missing")]
@@ -0,0 +1,279 @@
+import json
+import re
+
+from agent_conductor.clients.terminal_log import LogScreen, LogTail
+from agent_conductor.clients.tmux import PaneDelta
+from agent_conductor.models.agent_profile import AgentProfile
+from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.providers import claude_code, codex
+from agent_conductor.providers.claude_code import ClaudeCodeProvider
+from agent_conductor.providers.claude_transcript import ClaudeTranscript
+from agent_conductor.providers.codex import CodexProvider
+from agent_conductor.providers.headless import ClaudeCodeHeadlessProvider
+from agent_conductor.providers.status_engine import Latch, StatusEngine, StatusRule
+from agent_conductor.services.status_tracker import StatusTracker, TrackedStatus
+from benchmarks import detectors
+
+
+class ScriptedDeltaTmux:
+    """Returns pre-recorded capture deltas in order."""
+
+    def __init__(self, *deltas: PaneDelta) -> None:
+        self.deltas = list(deltas)
+
+    def capture_pane_delta(self, session_name, window_name, cursor, pane_id=None, max_lines=1000):
+        return self.deltas.pop(0)
+
+
+def test_claude_status_uses_screen_and_remembers_scrolled_response():
+    tmux = ScriptedDeltaTmux(
+        PaneDelta(lines=[], screen="✻ Pondering… (esc to interrupt)", reset=True),
+        PaneDelta(lines=["⏺ Done with the task"], screen="> \n? for shortcuts"),
+        PaneDelta(lines=[], screen="> \n? for shortcuts"),
+    )
+    provider = ClaudeCodeProvider("t1", "s", "w", None, tmux, pane_id="%1")
+
+    assert provider.get_status() == TerminalStatus.RUNNING
+    assert provider.get_status() == TerminalStatus.COMPLETED
+    assert provider.get_status() == TerminalStatus.COMPLETED
+
+
+def test_codex_status_errors_are_sticky_across_deltas():
+    tmux = ScriptedDeltaTmux(
+        PaneDelta(lines=[], screen="› ", reset=True),
+        PaneDelta(lines=["fatal error: agent loop died"], screen="› "),
+        PaneDelta(lines=[], screen="› "),
+    )
+    provider = CodexProvider("t1", "s", "w", None, tmux, pane_id="%1")
+
+    assert provider.get_status() == TerminalStatus.READY
+    assert provider.get_status() == TerminalStatus.ERROR
+    assert provider.get_status() == TerminalStatus.ERROR
+
+
+def test_codex_answers_mentioning_panics_do_not_latch_an_error():
+    answer = [
+        "The Go program crashes with:",
+        "    panic: runtime error: index out of range [3] with length 3",
+        "    goroutine 1 [running]:",
+        "A fatal error like this means the slice index needs a bounds check.",
+    ]
+    tmux = ScriptedDeltaTmux(
+        PaneDelta(lines=[], screen="› ", reset=True),
+        PaneDelta(lines=answer, screen="› "),
+        PaneDelta(lines=["■ Fatal error: stream disconnected"], screen="› "),
+    )
+    provider = CodexProvider("t1", "s", "w", None, tmux, pane_id="%1")
+
+    assert provider.get_status() == TerminalStatus.READY
+    assert provider.get_status() == TerminalStatus.READY
+    # Codex's own error banner still latches.
+    assert provider.get_status() == TerminalStatus.ERROR
+
+
+def test_status_engine_scans_screen_tail_in_rule_order():
+    engine = StatusEngine(
+        rules=[
+            StatusRule(TerminalStatus.ERROR, latch="crash"),
+            StatusRule(TerminalStatus.RUNNING, re.compile("busy")),
+            StatusRule(TerminalStatus.READY, re.compile(r"^\$ ", re.MULTILINE)),
+        ],
+        latches=[Latch("crash", re.compile("segfault"))],
+        tail_lines=2,
+    )
+    latched = set()
+
+    # tmux pads the screen with blank rows; the prompt's trailing space survives.
+    assert engine.evaluate(PaneDelta([], "busy\nout\n$ \n\n\n", reset=True), latched) == (
+        TerminalStatus.READY
+    )
+    assert engine.evaluate(PaneDelta([], "out\nbusy\n$ "), latched) == TerminalStatus.RUNNING
+    assert engine.evaluate(PaneDelta(["segfault"], "$ "), latched) == TerminalStatus.ERROR
+    assert engine.evaluate(PaneDelta([], "$ "), latched) == TerminalStatus.ERROR
+    assert engine.evaluate(PaneDelta([], "$ ", reset=True), latched) == TerminalStatus.READY
+    assert engine.evaluate(PaneDelta([], "\n\n"), latched) == TerminalStatus.RUNNING
+
+
+def test_detectors_keep_their_results_on_recorded_captures():
+    cases = detectors.load_cases()
+    assert {case.expected["status"] for case in cases} >= {"READY", "RUNNING", "COMPLETED", "ERROR"}
+    assert detectors.check(cases) == []
+
+
+def test_log_screen_replays_cursor_moves_and_split_escapes():
+    screen = LogScreen(height=5)
+
+    printed = screen.feed("one\ntwo\x1b[31mX\x1b[0m\r\x1b[2Kthree\x1b")
+    assert printed == "one\ntwoXthree"
+    assert screen.feed("[1A\r\x1b[2Kfour") == "four"
+    assert screen.render() == "four\nthree"
+
+
+def test_log_screen_places_redraws_on_the_pane_sized_screen():
+    screen = LogScreen(height=24)
+    screen.feed("".join(f"old line {index}\n" for index in range(60)))
+    screen.feed("\x1b[24;1H\u203a ")
+    assert screen.render().splitlines()[-1] == "\u203a "
+
+    # A scroll region above a status line scrolls without touching it...
+    screen = LogScreen(height=5)
+    screen.feed("a\nb\nc\nd\nstatus\x1b[1;4r\x1b[4;1H\ne\nf")
+    assert screen.render().splitlines() == ["c", "d", "e", "f", "status"]
+    # ...and a reverse index at its top scrolls it back down.
+    screen.feed("\x1b[1;1H\x1bMtop")
+    assert screen.render().splitlines() == ["top", "c", "d", "e", "status"]
+
+    screen.resize(3)
+    screen.feed("\x1b[1;1Hfirst")
+    assert screen.render().splitlines() == ["top", "c", "first", "e", "status"]
+
+
+def test_log_tail_reads_appends_and_restarts_after_truncation(tmp_path):
+    log = tmp_path / "t1.log"
+    tail = LogTail(log, backlog=4)
+    assert tail.read() == ("", False)
+
+    log.write_bytes("abcdef".encode())
+    assert tail.read() == ("cdef", True)
+    with log.open("ab") as handle:
+        handle.write("g\u2026".encode()[:2])
+    assert tail.read() == ("g", False)
+    with log.open("ab") as handle:
+        handle.write("g\u2026".encode()[2:])
+    assert tail.read() == ("\u2026", False)
+
+    log.write_bytes(b"new")
+    assert tail.read() == ("new", True)
+
+
+def test_status_tracker_follows_log_and_publishes_changes(tmp_path):
+    tracker = StatusTracker(log_dir=tmp_path)
+    published = []
+    tracker.subscribe(lambda terminal_id, state: published.append((terminal_id, state)))
+    log = tmp_path / "t1.log"
+
+    tracker.track("t1", claude_code.STATUS_ENGINE)
+    assert tracker.refresh("t1") is None
+
+    log.write_text("\x1b[2J\x1b[H\u273b Pondering\u2026 (esc to interrupt)\n")
+    assert tracker.poll() == {"t1": TrackedStatus(TerminalStatus.RUNNING)}
+    assert tracker.poll() == {}
+
+    with log.open("a") as handle:
+        handle.write("\x1b[1A\x1b[2K\u23fa Done with the task\n" + "filler\n" * 60 + "> \n")
+    assert tracker.refresh("t1") == TrackedStatus(TerminalStatus.COMPLETED)
+
+    with log.open("a") as handle:
+        handle.write("Do you want to proceed?\n\u276f 1. Yes\n  2. No\n")
+    waiting = tracker.refresh("t1")
+    assert waiting == TrackedStatus(TerminalStatus.RUNNING, prompt_pending=True)
+    assert tracker.status("t1") == waiting
+    assert [state.status for _, state in published] == [
+        TerminalStatus.RUNNING,
+        TerminalStatus.COMPLETED,
+        TerminalStatus.RUNNING,
+    ]
+
+    tracker.untrack("t1")
+    assert tracker.refresh("t1") is None
+
+
+def test_provider_status_comes_from_tracker_without_tmux(tmp_path):
+    tracker = StatusTracker(log_dir=tmp_path)
+    (tmp_path / "t1.log").write_text("\u23fa Done\n> \n")
+    provider = ClaudeCodeProvider("t1", "s", "w", None, ScriptedDeltaTmux(), pane_id="%1")
+    provider.status_tracker = tracker
+    tracker.track("t1", provider.status_engine)
+
+    assert provider.get_status() == TerminalStatus.COMPLETED
+
+
+def test_only_profiles_without_launch_options_can_use_a_prestarted_cli(monkeypatch):
+    profiles = {
+        "plain": AgentProfile(name="plain", description="", variables={"TEAM": "core"}),
+        "pinned": AgentProfile(name="pinned", description="", model="o3"),
+        "mcp": AgentProfile(
+            name="mcp",
+            description="",
+            mcpServers={"docs": {"type": "stdio", "command": "docs-server"}},
+        ),
+    }
+    for module in (claude_code, codex):
+        monkeypatch.setattr(module, "load_agent_profile", profiles.__getitem__)
+
+    assert ClaudeCodeProvider.supports_warm_start("plain")
+    assert ClaudeCodeProvider.supports_warm_start("pinned")
+    assert not ClaudeCodeProvider.supports_warm_start("mcp")
+    assert CodexProvider.supports_warm_start("plain")
+    assert not CodexProvider.supports_warm_start("pinned")
+    assert CodexProvider.supports_warm_start(None)
+
+
+def test_headless_claude_resumes_its_conversation_and_briefs_once():
+    provider = ClaudeCodeHeadlessProvider("t1", "s", "worker-dev", None, tmux=None)
+    provider.send_briefing("Report to abc123.")
+
+    first = provider.build_turn_command()
+    assert first[:4] == ["claude", "-p", "--output-format", "text"]
+    assert first[4:] == ["--session-id", provider.conversation_id]
+    assert provider._compose_prompt("Fix the bug") == "Report to abc123.\n\nFix the bug"
+
+    provider.turns = 1
+    assert provider.build_turn_command()[4:] == ["--resume", provider.conversation_id]
+    assert provider._compose_prompt("Add a test") == "Add a test"
+
+    # After a server restart the same conversation resumes once a turn has run.
+    restarted = ClaudeCodeHeadlessProvider("t1", "s", "worker-dev", None, tmux=None)
+    assert restarted.conversation_id == provider.conversation_id
+    restarted.reattach()
+    assert restarted.build_turn_command()[4:] == ["--session-id", provider.conversation_id]
+    restarted.log_path.parent.mkdir(parents=True, exist_ok=True)
+    restarted.log_path.write_text("> Fix the bug\n", encoding="utf-8")
+    restarted.reattach()
+    assert restarted.build_turn_command()[4:] == ["--resume", provider.conversation_id]
+
+
+def _record(kind, content, message_id=None, **extra):
+    message = {"role": kind, "content": content}
+    if message_id:
+        message["id"] = message_id
+    return (json.dumps({"type": kind, "message": message, **extra}) + "\n").encode()
+
+
+def test_claude_transcript_parses_appended_turns(tmp_path):
+    transcript = ClaudeTranscript("sid-1", projects_dir=tmp_path)
+    assert transcript.refresh() is None
+    path = tmp_path / "-work-repo" / "sid-1.jsonl"
+    path.parent.mkdir()
+
+    answer = _record("assistant", [{"type": "text", "text": "Looking."}], "m1")
+    path.write_bytes(_record("user", "Fix the bug") + answer[:20])
+    assert transcript.refresh() is None
+    with open(path, "ab") as handle:
+        handle.write(answer[20:])
+        handle.write(_record("assistant", [{"type": "tool_use", "name": "Edit"}], "m1"))
+        handle.write(_record("user", [{"type": "tool_result", "content": "ok"}]))
+        handle.write(_record("assistant", [{"type": "text", "text": "Fixed it."}], "m2"))
+        handle.write(_record("assistant", [{"type": "text", "text": "Tests pass."}], "m2"))
+        aside = [{"type": "text", "text": "aside"}]
+        handle.write(_record("assistant", aside, "m3", isSidechain=True))
+    assert transcript.refresh() == "Fixed it.\nTests pass."
+    assert [(turn.prompt, turn.reply) for turn in transcript.turns] == [
+        ("Fix the bug", "Fixed it.\nTests pass.")
+    ]
+
+
+def test_claude_structured_output_reads_the_session_transcript(tmp_path, monkeypatch):
+    monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(tmp_path))
+    provider = ClaudeCodeProvider("t1", "s", "w", None, tmux=None, pane_id="%1")
+    assert provider.last_response() is None
+    assert "--session-id" not in provider._build_claude_command()
+
+    provider.structured_output = True
+    assert provider._build_claude_command() == ["claude", "--session-id", provider.conversation_id]
+    path = tmp_path / "projects" / "-repo" / f"{provider.conversation_id}.jsonl"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(
+        _record("user", "hi") + _record("assistant", [{"type": "text", "text": "Hello!"}], "m1")
+    )
+    assert provider.last_response() == "Hello!"
@@ -1,22 +1,41 @@
+import asyncio
 import json
+import sys
+import threading
+import time
+
+import pytest
+from sqlalchemy import event, inspect, text
 
 from agent_conductor import constants
+from agent_conductor.clients import database, migrations
 from agent_conductor.clients.database import (
     ApprovalRequest as ApprovalORM,
     InboxMessage as InboxORM,
     Terminal as TerminalORM,
     session_scope,
 )
+from agent_conductor.clients.tmux import TmuxError, TmuxPane
+from agent_conductor.clients.tmux_shards import TmuxShards
 from agent_conductor.models.enums import ApprovalStatus, InboxStatus, TerminalStatus
+from agent_conductor.providers.base import BaseProvider, ProviderInitializationError
+from agent_conductor.providers.headless import HeadlessProvider
+from agent_conductor.providers.manager import ProviderManager, UnknownProviderError
+from agent_conductor.providers.pool import WarmProvider
 from agent_conductor.services.inbox_service import InboxService
 from agent_conductor.services.prompt_service import PromptWatcher
 from agent_conductor.services.session_service import SessionService
+from agent_conductor.services.status_tracker import StatusTracker
+from agent_conductor.services.terminal_service import TerminalService
+from agent_conductor.models.tmux_event import TmuxEvent
+from tests.conftest import FakeTmuxClient
 
 
 def test_create_terminal_records_metadata(terminal_service, fake_tmux, provider_manager):
     terminal = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
 
     assert terminal.provider == "claude_code"
+    assert terminal.role == "supervisor"
     assert terminal.status == TerminalStatus.READY
     assert terminal.session_name in fake_tmux.sessions
     assert terminal.id in provider_manager.providers
@@ -28,6 +47,353 @@ def test_create_terminal_records_metadata(terminal_service, fake_tmux, provider_
         assert stored.status == TerminalStatus.READY
 
 
+def test_create_terminal_records_tmux_ids(terminal_service, fake_tmux):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    first = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+    second = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+
+    assert first.window_name == second.window_name
+    assert first.tmux_pane_id != second.tmux_pane_id
+
+    with session_scope() as db:
+        stored = db.get(TerminalORM, second.id)
+        assert stored.tmux_pane_id == second.tmux_pane_id
+        assert stored.tmux_window_id == second.tmux_window_id
+
+    fake_tmux.panes[first.tmux_pane_id]["history"] = "first-only\n"
+    assert terminal_service.capture_output(first.id) == "first-only\n"
+    assert "first-only" not in terminal_service.capture_output(second.id)
+
+
+class StubWindowPool:
+    def __init__(self, panes):
+        self.panes = list(panes)
+        self.claims = []
+        self.primed = []
+
+    def claim(self, session_name, window_name, working_directory=None, environment=None, **_):
+        self.claims.append((session_name, window_name, working_directory, environment))
+        if not self.panes:
+            return None
+        window_id, pane_id = self.panes.pop(0)
+        return TmuxPane(session_name, window_name, window_id, pane_id)
+
+    def prime(self, working_directory=None):
+        self.primed.append(working_directory)
+
+
+def test_create_terminal_claims_warm_window_for_workers(fake_tmux, provider_manager):
+    pool = StubWindowPool([("@90", "%90")])
+    service = TerminalService(tmux=fake_tmux, providers=provider_manager, window_pool=pool)
+
+    supervisor = service.create_terminal(
+        "claude_code", "supervisor", "conductor", working_directory="/w"
+    )
+    warm, cold = (
+        service.create_terminal(
+            "claude_code", "worker", profile, session_name=supervisor.session_name,
+            working_directory="/w",
+        )
+        for profile in ("developer", "tester")
+    )
+
+    assert pool.primed == ["/w"]
+    assert [claim[2] for claim in pool.claims] == ["/w", "/w"]
+    assert pool.claims[0][3] == {constants.TERMINAL_ENV_VAR: warm.id}
+    assert (warm.tmux_window_id, warm.tmux_pane_id) == ("@90", "%90")
+    assert cold.tmux_pane_id in fake_tmux.panes
+
+
+def test_workers_adopt_a_prestarted_provider_cli(terminal_service, fake_tmux, provider_manager):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    pane = fake_tmux.create_window("_conductor-providers", "idle-cli")
+    claims = []
+
+    def claim_warm(provider_key, agent_profile, session_name, window_name, *args, **kwargs):
+        claims.append((provider_key, agent_profile, session_name, window_name))
+        return WarmProvider("feedbeef", pane)
+
+    provider_manager.claim_warm = claim_warm
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+
+    assert claims == [("claude_code", "developer", supervisor.session_name, worker.window_name)]
+    assert worker.id == "feedbeef"
+    assert (worker.tmux_window_id, worker.tmux_pane_id) == (pane.window_id, pane.pane_id)
+    assert provider_manager.providers["feedbeef"].warm
+
+
+ECHO_TURN = """
+import os, sys
+prompt = sys.stdin.read()
+print(os.getcwd(), os.environ["CONDUCTOR_TERMINAL_ID"], file=sys.stderr)
+print("echo:", prompt.split("\\n\\n")[-1])
+sys.exit(1 if prompt.endswith("fail") else 0)
+"""
+
+
+class ShellProvider(BaseProvider):
+    def build_startup_command(self):
+        return None
+
+
+class EchoHeadlessProvider(HeadlessProvider):
+    binary = "python3"
+
+    def build_turn_command(self):
+        return [sys.executable, "-c", ECHO_TURN]
+
+
+def test_failed_provider_start_is_not_left_prepared(fake_tmux, monkeypatch):
+    class BrokenProvider(ShellProvider):
+        def initialize(self):
+            raise TmuxError("pane vanished")
+
+    monkeypatch.setitem(ProviderManager._registry, "broken", BrokenProvider)
+    manager = ProviderManager(fake_tmux)
+    manager.prepare_provider("broken", "t1", "s", "worker-broken", None)
+
+    with pytest.raises(TmuxError):
+        manager.initialize_provider("t1")
+    with pytest.raises(UnknownProviderError, match="not prepared"):
+        manager.initialize_provider("t1")
+
+
+def test_headless_workers_run_turns_as_subprocesses(fake_tmux, tmp_path, monkeypatch):
+    monkeypatch.setitem(ProviderManager._registry, "shell", ShellProvider)
+    monkeypatch.setitem(ProviderManager._registry, "echo_headless", EchoHeadlessProvider)
+    tracker = StatusTracker()
+    service = TerminalService(
+        tmux=fake_tmux, providers=ProviderManager(fake_tmux, status_tracker=tracker)
+    )
+    tracker.subscribe(service.record_status)
+
+    with pytest.raises(UnknownProviderError, match="only runs workers"):
+        service.create_terminal("echo_headless", "supervisor", None)
+    supervisor = service.create_terminal("shell", "supervisor", None)
+    worker = service.create_terminal(
+        "echo_headless", "worker", None, session_name=supervisor.session_name,
+        working_directory=str(tmp_path),
+    )
+    assert (worker.tmux_window_id, worker.tmux_pane_id) == (None, None)
+    assert list(fake_tmux.sessions[supervisor.session_name]) == [supervisor.window_name]
+
+    def finished_turns(count):
+        provider = service.providers.get_provider(worker.id)
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            status = service.get_terminal(worker.id).status
+            if provider.turns == count and status != TerminalStatus.RUNNING:
+                return status
+            time.sleep(0.05)
+        raise AssertionError(f"turn {count} did not finish")
+
+    service.send_input(worker.id, "first")
+    assert finished_turns(1) == TerminalStatus.COMPLETED
+    assert service.capture_output(worker.id, last_only=True) == "echo: first"
+
+    # A message sent during a turn runs after it; a failing turn reports ERROR.
+    service.send_input(worker.id, "fail")
+    service.send_input(worker.id, "again")
+    assert finished_turns(3) == TerminalStatus.COMPLETED
+    assert service.capture_output(worker.id, last_only=True) == "echo: again"
+    log = service.capture_output(worker.id)
+    assert f"{tmp_path} {worker.id}" in log
+    assert "> fail\n" in log and "[exit status 1]" in log
+
+    # After an API restart the re-attached worker keeps its directory and turns.
+    service = TerminalService(tmux=fake_tmux, providers=ProviderManager(fake_tmux))
+    service.send_input(worker.id, "later")
+    provider = service.providers.get_provider(worker.id)
+    assert provider.resumed
+    deadline = time.time() + 10
+    while provider.turns < 1 or provider.status == TerminalStatus.RUNNING:
+        assert time.time() < deadline, "turn after restart did not finish"
+        time.sleep(0.05)
+    assert service.capture_output(worker.id, last_only=True) == "echo: later"
+    assert service.capture_output(worker.id).count(f"{tmp_path} {worker.id}") == 4
+
+    service.delete_terminal(worker.id)
+    assert fake_tmux.killed_windows == []
+
+
+def test_sessions_are_spread_across_tmux_shards(provider_manager):
+    clients = {name: FakeTmuxClient(name) for name in ("conductor-0", "conductor-1")}
+    service = TerminalService(providers=provider_manager, shards=TmuxShards(clients=clients))
+
+    first, second = (
+        service.create_terminal("claude_code", "supervisor", "conductor") for _ in range(2)
+    )
+    worker = service.create_terminal(
+        "claude_code", "worker", "developer", session_name=second.session_name
+    )
+
+    assert (first.tmux_socket, second.tmux_socket) == ("conductor-0", "conductor-1")
+    assert worker.tmux_socket == "conductor-1"
+    assert set(clients["conductor-1"].sessions[second.session_name]) == {
+        second.window_name,
+        worker.window_name,
+    }
+
+    service.send_input(worker.id, "hello")
+    assert "hello" in service.capture_output(worker.id)
+    screens = service.capture_screens([first, worker])
+    assert screens[first.id] == "" and screens[worker.id].endswith("hello\n")
+    assert [len(client.capture_many_calls) for client in clients.values()] == [1, 1]
+
+    # Pane IDs repeat across servers, so events only match their own socket.
+    assert first.tmux_pane_id == second.tmux_pane_id
+    event = TmuxEvent(event="pane-exited", pane_id=first.tmux_pane_id, socket_name="conductor-0")
+    assert service.handle_tmux_event(event) == [first.id]
+
+    service.delete_terminal(worker.id)
+    service.delete_terminal(second.id)
+    assert clients["conductor-1"].killed_sessions == [second.session_name]
+    assert clients["conductor-0"].killed_sessions == []
+
+
+def test_init_db_adds_columns_to_existing_terminals_table():
+    with database.ENGINE.begin() as connection:
+        connection.execute(text("DROP TABLE approval_requests"))
+        connection.execute(text("DROP TABLE inbox_messages"))
+        connection.execute(text("DROP TABLE terminals"))
+        connection.execute(
+            text(
+                "CREATE TABLE terminals (id VARCHAR PRIMARY KEY, session_name VARCHAR NOT NULL, "
+                "window_name VARCHAR NOT NULL, provider VARCHAR NOT NULL, agent_profile VARCHAR, "
+                "status VARCHAR NOT NULL, created_at DATETIME)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO terminals VALUES "
+                "('sup1', 's', 'supervisor-conductor-claude_code', 'claude_code', NULL, 'READY', "
+                "NULL), "
+                "('wrk1', 's', 'worker-developer-claude_code', 'claude_code', NULL, 'READY', NULL)"
+            )
+        )
+        # A database from before versioned migrations.
+        connection.execute(text("PRAGMA user_version = 0"))
+
+    database.init_db()
+
+    inspector = inspect(database.ENGINE)
+    columns = {column["name"] for column in inspector.get_columns("terminals")}
+    assert {"tmux_window_id", "tmux_pane_id", "tmux_socket", "role"} <= columns
+    assert {index["name"] for index in inspector.get_indexes("terminals")} == {
+        "ix_terminals_session_created",
+        "ix_terminals_session_role",
+    }
+    assert [index["name"] for index in inspector.get_indexes("inbox_messages")] == [
+        "ix_inbox_receiver_status_created"
+    ]
+    with session_scope() as db:
+        assert db.get(TerminalORM, "sup1").role == "supervisor"
+        assert db.get(TerminalORM, "wrk1").role == "worker"
+    with database.ENGINE.connect() as connection:
+        assert migrations.schema_version(connection) == database.MIGRATIONS[-1].version
+
+    # Up to date: a restart applies nothing.
+    assert migrations.run_migrations(database.ENGINE, database.MIGRATIONS) == []
+
+
+def test_failed_migration_step_leaves_no_partial_schema():
+    def half_done(connection):
+        connection.execute(text("ALTER TABLE terminals ADD COLUMN scratch VARCHAR"))
+        raise RuntimeError("step failed")
+
+    failing = migrations.Migration(database.MIGRATIONS[-1].version + 1, "fails", half_done)
+    with pytest.raises(RuntimeError):
+        migrations.run_migrations(database.ENGINE, [*database.MIGRATIONS, failing])
+
+    columns = {column["name"] for column in inspect(database.ENGINE).get_columns("terminals")}
+    assert "scratch" not in columns
+    with database.ENGINE.connect() as connection:
+        assert migrations.schema_version(connection) == database.MIGRATIONS[-1].version
+
+
+def test_database_connections_use_wal_and_survive_concurrent_writers(terminal_service):
+    with database.ENGINE.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == database.BUSY_TIMEOUT_MS
+
+    receiver = terminal_service.create_terminal("claude_code", "worker", "developer")
+    inbox = InboxService(terminal_service)
+    errors = []
+
+    def write(writer: int) -> None:
+        try:
+            for index in range(25):
+                inbox.queue_message(f"writer-{writer}", receiver.id, f"message {index}")
+        except Exception as exc:  # pragma: no cover - reported by the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=write, args=(writer,)) for writer in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(inbox.list_messages(receiver.id)) == 150
+
+
+def test_async_reads_match_the_sync_api(
+    terminal_service, session_service, inbox_service, approval_service
+):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+    approval_service.request_approval(worker.id, supervisor.id, "rm -rf build")
+    threads_before = set(threading.enumerate())
+
+    async def read():
+        async with database.ASYNC_ENGINE.connect() as connection:
+            journal_mode = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+        queued = await inbox_service.queue_message_async(worker.id, supervisor.id, "done")
+        reads = await asyncio.gather(
+            terminal_service.get_terminal_async(worker.id),
+            terminal_service.get_terminal_async("missing"),
+            session_service.list_sessions_async(),
+            session_service.get_session_async(supervisor.session_name),
+            session_service.get_session_async("missing"),
+            inbox_service.list_messages_async(supervisor.id),
+            approval_service.list_requests_async(ApprovalStatus.PENDING),
+        )
+        return journal_mode, queued, reads
+
+    journal_mode, queued, reads = asyncio.run(read())
+    opened = [
+        thread
+        for thread in set(threading.enumerate()) - threads_before
+        if "_connection_worker_thread" in thread.name
+    ]
+    terminal, missing, sessions, session, no_session, messages, approvals = reads
+
+    assert journal_mode == "wal"
+    assert terminal == terminal_service.get_terminal(worker.id)
+    assert missing is None and no_session is None
+    assert sessions == session_service.list_sessions()
+    assert session == session_service.get_session(supervisor.session_name)
+    assert messages == inbox_service.list_messages(supervisor.id)
+    assert messages[-1].id == queued.id
+    assert approvals == approval_service.list_requests(ApprovalStatus.PENDING)
+
+    # Re-initialising closes the pooled aiosqlite connections and their threads.
+    assert opened
+    database.init_db()
+    for thread in opened:
+        thread.join(timeout=5)
+    assert not [thread for thread in opened if thread.is_alive()]
+
+
 def test_send_input_updates_status_and_history(terminal_service, fake_tmux, provider_manager):
     terminal = terminal_service.create_terminal("claude_code", "worker", "developer")
 
@@ -55,7 +421,7 @@ def test_send_input_reattaches_provider_when_missing(terminal_service, provider_
     assert provider.sent_messages[-1] == "echo reattached"
 
 
-def test_capture_output_last_only(terminal_service, fake_tmux):
+def test_capture_output_last_only(terminal_service, fake_tmux, provider_manager):
     terminal = terminal_service.create_terminal("claude_code", "worker", "developer")
     fake_tmux.append_history(terminal.session_name, terminal.window_name, "line-one")
     fake_tmux.append_history(terminal.session_name, terminal.window_name, "line-two")
@@ -66,6 +432,10 @@ def test_capture_output_last_only(terminal_service, fake_tmux):
     assert "line-one" in full_output and "line-two" in full_output
     assert last_output == "line-two"
 
+    # Structured output answers without scraping the pane.
+    provider_manager.providers[terminal.id].structured_answer = "parsed answer"
+    assert terminal_service.capture_output(terminal.id, last_only=True) == "parsed answer"
+
 
 def test_delete_terminal_cleans_resources(terminal_service, fake_tmux, provider_manager):
     supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
@@ -91,6 +461,72 @@ def test_delete_terminal_cleans_resources(terminal_service, fake_tmux, provider_
         assert db.get(TerminalORM, supervisor.id) is None
 
 
+def test_terminal_registry_serves_lookups_and_follows_writes(terminal_service):
+    terminal = terminal_service.create_terminal("claude_code", "worker", "developer")
+    assert terminal.created_at is not None
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(database.ENGINE, "before_cursor_execute", listener)
+    try:
+        for _ in range(3):
+            assert terminal_service.get_terminal(terminal.id) == terminal
+        terminal_service.capture_output(terminal.id)
+    finally:
+        event.remove(database.ENGINE, "before_cursor_execute", listener)
+    assert statements == []
+
+    terminal_service._update_status(terminal.id, TerminalStatus.RUNNING)
+    assert terminal_service.get_terminal(terminal.id).status == TerminalStatus.RUNNING
+
+    # A fresh service reads through on a miss; a loaded one starts warm.
+    cold = TerminalService(tmux=terminal_service.tmux, providers=terminal_service.providers)
+    assert cold.get_terminal(terminal.id) == terminal_service.get_terminal(terminal.id)
+    assert cold.get_terminal("missing") is None
+    assert cold.registry.stats() == {"terminals": 1, "hits": 0, "misses": 2, "hit_rate": 0.0}
+    warm = TerminalService(tmux=terminal_service.tmux, providers=terminal_service.providers)
+    assert warm.load_registry() == 1
+    assert asyncio.run(warm.get_terminal_async(terminal.id)).status == TerminalStatus.RUNNING
+    assert warm.registry.stats()["hit_rate"] == 1.0
+
+    terminal_service.delete_terminal(terminal.id)
+    assert terminal_service.get_terminal(terminal.id) is None
+    assert len(terminal_service.registry) == 0
+
+
+def test_registry_keeps_no_stale_rows_from_racing_reads_and_writes(terminal_service):
+    terminal = terminal_service.create_terminal("claude_code", "worker", "developer")
+    registry = terminal_service.registry
+
+    # Of two racing status writes, the one that lost the race is not cached.
+    first, second = registry.stamp(terminal.id), registry.stamp(terminal.id)
+    running = terminal.model_copy(update={"status": TerminalStatus.RUNNING})
+    registry.update(running, second)
+    registry.update(terminal.model_copy(update={"status": TerminalStatus.READY}), first)
+    assert len(registry) == 0
+    registry.clear()
+
+    deleting = []
+
+    def delete_during_read(conn, cursor, statement, *args):
+        # The read has loaded the row; delete the terminal before it is cached.
+        if statement.startswith("SELECT") and not deleting:
+            deleting.append(
+                threading.Thread(target=terminal_service.delete_terminal, args=(terminal.id,))
+            )
+            deleting[0].start()
+            deleting[0].join()
+
+    event.listen(database.ENGINE, "after_cursor_execute", delete_during_read)
+    try:
+        assert terminal_service.get_terminal(terminal.id) == terminal
+    finally:
+        event.remove(database.ENGINE, "after_cursor_execute", delete_during_read)
+
+    assert deleting and len(terminal_service.registry) == 0
+    assert terminal_service.get_terminal(terminal.id) is None
+
+
 def test_session_service_lists_and_deletes(terminal_service):
     supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
     worker = terminal_service.create_terminal(
@@ -100,21 +536,124 @@ def test_session_service_lists_and_deletes(terminal_service):
         session_name=supervisor.session_name,
     )
 
-    session_service = SessionService(terminal_service)
-    sessions = session_service.list_sessions()
+    other = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
 
-    assert len(sessions) == 1
-    listed = sessions[0]
-    assert listed.name == supervisor.session_name
-    assert {t.id for t in listed.terminals} == {supervisor.id, worker.id}
+    session_service = SessionService(terminal_service)
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(database.ENGINE, "before_cursor_execute", listener)
+    try:
+        sessions = session_service.list_sessions()
+    finally:
+        event.remove(database.ENGINE, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert [s.name for s in sessions] == sorted([supervisor.session_name, other.session_name])
+    listed = next(s for s in sessions if s.name == supervisor.session_name)
+    assert [t.id for t in listed.terminals] == [supervisor.id, worker.id]
+
+    assert session_service.get_session(supervisor.session_name) == listed
+    assert session_service.get_session("missing") is None
 
     session_service.delete_session(supervisor.session_name)
+    assert [s.name for s in session_service.list_sessions()] == [other.session_name]
+    session_service.delete_session(other.session_name)
 
     with session_scope() as db:
         remaining = db.query(TerminalORM).count()
         assert remaining == 0
 
 
+def test_terminals_start_in_background_and_can_be_awaited(
+    terminal_service, inbox_service, fake_tmux, provider_manager
+):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name, initialize=False
+    )
+    assert worker.status == TerminalStatus.STARTING
+    assert worker.id not in provider_manager.providers
+    try:
+        terminal_service.ensure_provider_loaded(worker.id)
+    except UnknownProviderError as exc:
+        assert "still starting" in str(exc)
+    else:  # pragma: no cover - defensive
+        raise AssertionError("STARTING terminals must not get a provider attached")
+
+    # Messages wait in the inbox until the receiver has started.
+    inbox_service.queue_message(supervisor.id, worker.id, "hello")
+    inbox_service.deliver_all_pending()
+    assert inbox_service.list_messages(worker.id)[0].status == InboxStatus.PENDING
+
+    failing = terminal_service.create_terminal(
+        "claude_code", "worker", "tester", session_name=supervisor.session_name, initialize=False
+    )
+
+    async def start(terminal_id):
+        terminal_service.start_in_background(terminal_id)
+        return await terminal_service.wait_until_started(terminal_id, timeout=5)
+
+    started = asyncio.run(start(worker.id))
+    provider_manager.init_error = "CLI did not come up"
+    failed = asyncio.run(start(failing.id))
+    assert started.status != TerminalStatus.STARTING
+    assert provider_manager.providers[worker.id].sent_messages  # worker bootstrap
+    # A failed start keeps its window for inspection.
+    assert failed.status == TerminalStatus.ERROR
+    assert failed.window_name in fake_tmux.sessions[supervisor.session_name]
+
+    inbox_service.deliver_all_pending()
+    assert inbox_service.list_messages(worker.id)[0].status == InboxStatus.DELIVERED
+
+
+def test_session_start_boots_terminals_in_parallel_up_to_the_limit(
+    fake_tmux, provider_manager, monkeypatch
+):
+    service = TerminalService(tmux=fake_tmux, providers=provider_manager, startup_concurrency=2)
+    supervisor = service.create_terminal("claude_code", "supervisor", "conductor", initialize=False)
+    workers = [
+        service.create_terminal(
+            "claude_code", "worker", profile, session_name=supervisor.session_name, initialize=False
+        )
+        for profile in ("developer", "tester", "reviewer")
+    ]
+    active = peak = 0
+    lock = threading.Lock()
+    initialize = provider_manager.initialize_provider
+
+    def slow_initialize(terminal_id):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return initialize(terminal_id)
+
+    monkeypatch.setattr(provider_manager, "initialize_provider", slow_initialize)
+
+    async def start():
+        await service.start_session_in_background([supervisor.id, *(w.id for w in workers)])
+
+    asyncio.run(start())
+    assert peak == 2
+    terminals = service.list_terminals(supervisor.session_name)
+    assert all(t.status != TerminalStatus.STARTING for t in terminals)
+
+
+def test_blocking_create_terminal_rolls_back_failed_start(terminal_service, provider_manager):
+    provider_manager.init_error = "CLI did not come up"
+    try:
+        terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    except ProviderInitializationError:
+        pass
+    else:  # pragma: no cover - defensive
+        raise AssertionError("initialization failure should propagate")
+    with session_scope() as db:
+        assert db.query(TerminalORM).count() == 0
+
+
 def test_inbox_service_delivers_pending(terminal_service, provider_manager):
     inbox_service = InboxService(terminal_service)
     receiver = terminal_service.create_terminal("claude_code", "worker", "tester")
@@ -135,6 +674,61 @@ def test_inbox_service_delivers_pending(terminal_service, provider_manager):
         assert stored.status == InboxStatus.DELIVERED
 
 
+def test_async_inbox_and_prompt_paths(
+    terminal_service, session_service, inbox_service, provider_manager
+):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+    message = inbox_service.queue_message(supervisor.id, worker.id, "Start task")
+    provider_manager.providers[worker.id].pending_prompt = "Proceed?\n❯ 1. Yes"
+
+    asyncio.run(inbox_service.deliver_all_pending_async())
+    asyncio.run(PromptWatcher(session_service, terminal_service, inbox_service).scan_async())
+
+    assert provider_manager.providers[worker.id].sent_messages[-1] == (
+        f"[INBOX:{supervisor.id}] Start task"
+    )
+    with session_scope() as db:
+        assert db.get(InboxORM, message.id).status == InboxStatus.DELIVERED
+    prompts = [m for m in inbox_service.list_messages(supervisor.id) if "[PROMPT]" in m.message]
+    assert len(prompts) == 1
+
+
+def test_concurrent_inbox_deliveries_send_each_message_once(
+    terminal_service, inbox_service, provider_manager
+):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+    for text_ in ("one", "two"):
+        inbox_service.queue_message(supervisor.id, worker.id, text_)
+    provider = provider_manager.providers[worker.id]
+
+    async def slow_send(message):
+        await asyncio.sleep(0.01)  # a real send yields to the loop
+        provider.send_input(message)
+
+    provider.send_input_async = slow_send
+
+    async def deliver_twice():
+        # The inbox loop and POST /inbox/{id}/deliver at the same time.
+        await asyncio.gather(
+            inbox_service.deliver_all_pending_async(),
+            inbox_service.deliver_pending_async(worker.id),
+        )
+
+    asyncio.run(deliver_twice())
+
+    assert [m for m in provider.sent_messages if m.startswith("[INBOX:")] == [
+        f"[INBOX:{supervisor.id}] one",
+        f"[INBOX:{supervisor.id}] two",
+    ]
+    assert {m.status for m in inbox_service.list_messages(worker.id)} == {InboxStatus.DELIVERED}
+
+
 def test_prompt_watcher_queues_prompts(
     terminal_service,
     session_service,
@@ -172,6 +766,57 @@ def test_prompt_watcher_queues_prompts(
     assert len(messages_final) == 2
 
 
+def test_prompt_watcher_skips_workers_of_unregistered_providers(
+    terminal_service, session_service, inbox_service, provider_manager, monkeypatch
+):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    worker = terminal_service.create_terminal(
+        "claude_code", "worker", "developer", session_name=supervisor.session_name
+    )
+    with session_scope() as db:
+        db.add(
+            TerminalORM(
+                id="removed1",
+                session_name=supervisor.session_name,
+                window_name="worker-developer-removed",
+                provider="removed",
+                status=TerminalStatus.READY,
+            )
+        )
+
+    def is_headless(provider_key):
+        if provider_key == "removed":
+            raise UnknownProviderError(f"Provider '{provider_key}' is not registered.")
+        return False
+
+    monkeypatch.setattr(provider_manager, "is_headless", is_headless)
+    provider = provider_manager.providers[worker.id]
+    provider.pending_prompt = "Do you want to proceed?\n❯ 1. Yes"
+    provider._prompt_consumed = False
+
+    PromptWatcher(session_service, terminal_service, inbox_service).scan()
+
+    assert any("[PROMPT]" in msg.message for msg in inbox_service.list_messages(supervisor.id))
+
+
+def test_prompt_watcher_captures_all_workers_in_one_call(
+    terminal_service, session_service, inbox_service, fake_tmux
+):
+    supervisor = terminal_service.create_terminal("claude_code", "supervisor", "conductor")
+    workers = [
+        terminal_service.create_terminal(
+            "claude_code", "worker", f"dev{index}", session_name=supervisor.session_name
+        )
+        for index in range(5)
+    ]
+
+    PromptWatcher(session_service, terminal_service, inbox_service).scan()
+
+    assert fake_tmux.capture_many_calls == [
+        {worker.id: worker.tmux_pane_id for worker in workers}
+    ]
+
+
 def _read_last_audit_entry():
     log_path = constants.APPROVALS_DIR / "audit.log"
     assert log_path.exists()
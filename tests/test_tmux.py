@@ -0,0 +1,529 @@
+import asyncio
+import json
+import shutil
+import subprocess
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from agent_conductor import constants
+from agent_conductor.clients.tmux import (
+    BACKEND_CONTROL,
+    BACKEND_LIBTMUX,
+    PaneCursor,
+    TmuxClient,
+    TmuxError,
+)
+from agent_conductor.clients.tmux_async import AsyncTmuxClient
+from agent_conductor.clients.tmux_control import format_command
+from agent_conductor.clients.tmux_hooks import install_hooks, remove_hooks
+from agent_conductor.clients.tmux_pool import WindowPool
+from agent_conductor.clients.tmux_shards import TmuxShards
+from agent_conductor.models.enums import TerminalStatus
+from agent_conductor.providers.base import BaseProvider
+from agent_conductor.providers.manager import ProviderManager
+from agent_conductor.services.status_tracker import StatusTracker
+from agent_conductor.services.terminal_service import TerminalService
+from tests.conftest import StubProviderManager
+
+pytestmark = pytest.mark.skipif(shutil.which("tmux") is None, reason="tmux not installed")
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _boot_server() -> str:
+    socket_name = f"acd-test-{uuid.uuid4().hex[:8]}"
+    # Boot the isolated server with a plain /bin/sh so panes start instantly.
+    subprocess.run(
+        ["tmux", "-L", socket_name, "-f", "/dev/null", "new-session", "-d", "-s", "_boot",
+         ";", "set-option", "-g", "default-shell", "/bin/sh"],
+        check=True,
+    )
+    return socket_name
+
+
+def _kill_server(socket_name: str) -> None:
+    subprocess.run(["tmux", "-L", socket_name, "kill-server"], capture_output=True)
+
+
+@pytest.fixture
+def tmux_socket():
+    socket_name = _boot_server()
+    yield socket_name
+    _kill_server(socket_name)
+
+
+@pytest.fixture(params=[BACKEND_CONTROL, BACKEND_LIBTMUX])
+def real_tmux(request, tmux_socket):
+    client = TmuxClient(socket_name=tmux_socket, backend=request.param)
+    yield client
+    client.close()
+
+
+def test_format_command_quotes_tmux_syntax():
+    rendered = format_command(["send-keys", "-t", "%1", 'echo "$HOME"; ls\n'])
+    assert rendered == '"send-keys" "-t" "%1" "echo \\"\\$HOME\\"; ls\\n"'
+
+
+def test_control_mode_connection_is_used(tmux_socket):
+    client = TmuxClient(socket_name=tmux_socket, backend=BACKEND_CONTROL)
+    try:
+        assert client._control is not None and client._control.alive
+    finally:
+        client.close()
+
+
+def test_window_lifecycle_round_trip(real_tmux):
+    real_tmux.create_session("acd-s1", "supervisor-shell-test")
+    real_tmux.create_window("acd-s1", "worker-shell-test")
+    assert real_tmux.session_exists("acd-s1")
+
+    real_tmux.send_keys("acd-s1", "worker-shell-test", "echo marker-$((40+2))")
+    assert _wait_for(
+        lambda: "marker-42" in real_tmux.capture_pane("acd-s1", "worker-shell-test")
+    )
+
+    real_tmux.kill_window("acd-s1", "worker-shell-test")
+    with pytest.raises(TmuxError):
+        real_tmux.capture_pane("acd-s1", "worker-shell-test")
+
+    real_tmux.kill_session("acd-s1")
+    assert not real_tmux.session_exists("acd-s1")
+
+
+def test_control_mode_reconnects_after_connection_loss(tmux_socket):
+    client = TmuxClient(socket_name=tmux_socket, backend=BACKEND_CONTROL)
+    try:
+        client.create_session("acd-s2", "supervisor-shell-test")
+        client._control.close()
+
+        assert client.session_exists("acd-s2")
+        assert client._control is not None and client._control.alive
+    finally:
+        client.close()
+
+
+def test_panes_with_duplicate_window_names_are_addressed_by_id(real_tmux):
+    real_tmux.create_session("acd-s3", "supervisor-shell-test")
+    first = real_tmux.create_window("acd-s3", "worker-developer-test")
+    second = real_tmux.create_window("acd-s3", "worker-developer-test")
+    assert first.pane_id.startswith("%") and first.window_id.startswith("@")
+    assert first.pane_id != second.pane_id
+
+    real_tmux.send_keys("acd-s3", "worker-developer-test", "echo only-first", pane_id=first.pane_id)
+    assert _wait_for(
+        lambda: "only-first"
+        in real_tmux.capture_pane("acd-s3", "worker-developer-test", pane_id=first.pane_id)
+    )
+    second_history = real_tmux.capture_pane(
+        "acd-s3", "worker-developer-test", pane_id=second.pane_id
+    )
+    assert "only-first" not in second_history
+
+    real_tmux.kill_window("acd-s3", "worker-developer-test", window_id=first.window_id)
+    real_tmux.capture_pane("acd-s3", "worker-developer-test", pane_id=second.pane_id)
+
+
+def test_capture_pane_delta_returns_only_new_history(real_tmux, monkeypatch):
+    pane = real_tmux.create_session("acd-s4", "worker-shell-test")
+    cursor = PaneCursor()
+
+    real_tmux.send_keys("acd-s4", "worker-shell-test", "seq 1001 1060", pane_id=pane.pane_id)
+    assert _wait_for(
+        lambda: "1060" in real_tmux.capture_pane("acd-s4", "worker-shell-test").splitlines()
+    )
+    first = real_tmux.capture_pane_delta(
+        "acd-s4", "worker-shell-test", cursor, pane_id=pane.pane_id
+    )
+    assert first.reset
+    assert "1001" in first.text
+    assert cursor.history_size and cursor.history_size > 0
+
+    real_tmux.send_keys("acd-s4", "worker-shell-test", "seq 2001 2060", pane_id=pane.pane_id)
+    assert _wait_for(
+        lambda: "2060" in real_tmux.capture_pane("acd-s4", "worker-shell-test").splitlines()
+    )
+    second = real_tmux.capture_pane_delta(
+        "acd-s4", "worker-shell-test", cursor, pane_id=pane.pane_id
+    )
+    assert not second.reset
+    assert "2001" in second.lines
+    # Lines already in history at the first read are not returned again.
+    assert "1001" not in second.lines
+    assert "2060" in second.screen
+
+    # The cursor query and the capture are one snapshot, taken in one round trip.
+    batches = []
+    run_batch = real_tmux.run_batch
+    monkeypatch.setattr(
+        real_tmux, "run_batch", lambda commands: batches.append(commands) or run_batch(commands)
+    )
+    idle = real_tmux.capture_pane_delta(
+        "acd-s4", "worker-shell-test", cursor, pane_id=pane.pane_id
+    )
+    assert idle.lines == []
+    assert [[command[0] for command in batch] for batch in batches] == [
+        ["display-message", "capture-pane"]
+    ]
+
+
+def test_capture_pane_delta_tracks_new_lines_past_history_limit(real_tmux, tmux_socket):
+    # New panes take the global limit; tmux then trims history in chunks.
+    subprocess.run(
+        ["tmux", "-L", tmux_socket, "set-option", "-g", "history-limit", "200"], check=True
+    )
+    pane = real_tmux.create_session("acd-s9", "worker-shell-test")
+    cursor = PaneCursor()
+
+    def emit(first: int, last: int) -> None:
+        real_tmux.send_keys(
+            "acd-s9", "worker-shell-test", f"seq {first} {last}", pane_id=pane.pane_id
+        )
+        assert _wait_for(
+            lambda: str(last) in real_tmux.capture_pane("acd-s9", "worker-shell-test").splitlines()
+        )
+
+    emit(10001, 10400)
+    seen = set(
+        real_tmux.capture_pane_delta(
+            "acd-s9", "worker-shell-test", cursor, pane_id=pane.pane_id
+        ).lines
+    )
+    for start in (20001, 30001):
+        emit(start, start + 151)
+        delta = real_tmux.capture_pane_delta(
+            "acd-s9", "worker-shell-test", cursor, pane_id=pane.pane_id
+        )
+        assert not delta.reset
+        numbers = [line for line in delta.lines if line.isdigit()]
+        assert not seen.intersection(numbers)
+        captured = set(numbers) | set(delta.screen.splitlines())
+        assert all(str(value) in captured for value in range(start, start + 152))
+        seen.update(numbers)
+
+
+def test_create_window_batches_environment_and_pipe(real_tmux, tmp_path):
+    log_path = tmp_path / "pane.log"
+    real_tmux.create_session("acd-s5", "supervisor-shell-test")
+    pane = real_tmux.create_window(
+        "acd-s5",
+        "worker-shell-test",
+        environment={"CONDUCTOR_TERMINAL_ID": "abc123"},
+        pipe_command=f"cat >> {log_path}",
+    )
+
+    names = real_tmux._run("list-windows", "-t", "=acd-s5", "-F", "#{window_name}")
+    assert names == ["supervisor-shell-test", "worker-shell-test"]
+
+    real_tmux.send_keys("acd-s5", "", "echo id=$CONDUCTOR_TERMINAL_ID", pane_id=pane.pane_id)
+    assert _wait_for(lambda: log_path.exists() and "id=abc123" in log_path.read_text())
+
+
+def test_capture_many_returns_screens_keyed_by_caller(real_tmux):
+    real_tmux.create_session("acd-s7", "supervisor-shell-test")
+    panes = [real_tmux.create_window("acd-s7", f"worker-{index}") for index in range(3)]
+    for index, pane in enumerate(panes):
+        real_tmux.send_keys("", "", f"echo screen-$((100+{index}))", pane_id=pane.pane_id)
+    assert _wait_for(
+        lambda: all(
+            f"screen-10{index}" in real_tmux.capture_pane("", "", pane_id=pane.pane_id)
+            for index, pane in enumerate(panes)
+        )
+    )
+
+    targets = {f"t{index}": pane.pane_id for index, pane in enumerate(panes)}
+    screens = real_tmux.capture_many(targets)
+
+    assert set(screens) == {"t0", "t1", "t2"}
+    for index in range(3):
+        assert f"screen-10{index}" in screens[f"t{index}"]
+        assert all(
+            f"screen-10{other}" not in screens[f"t{index}"] for other in range(3) if other != index
+        )
+    # A pane that disappeared is dropped rather than failing the whole batch.
+    assert set(real_tmux.capture_many({**targets, "gone": "%999"})) == {"t0", "t1", "t2"}
+
+
+@pytest.mark.parametrize("backend", [BACKEND_CONTROL, BACKEND_LIBTMUX])
+def test_async_client_round_trip(tmux_socket, backend):
+    async def scenario():
+        client = AsyncTmuxClient(socket_name=tmux_socket, backend=backend)
+        try:
+            pane = await client.create_session("acd-s6", "worker-shell-test")
+            await client.send_keys("", "", "echo async-$((40+2))", pane_id=pane.pane_id)
+            for _ in range(100):
+                history = await client.capture_pane("", "", pane_id=pane.pane_id)
+                if "async-42" in history:
+                    break
+                await asyncio.sleep(0.05)
+            else:
+                pytest.fail("command output never appeared")
+
+            # Concurrent captures share the connection without mixing up replies.
+            cursors = [PaneCursor() for _ in range(10)]
+            deltas = await asyncio.gather(
+                *(client.capture_pane_delta("", "", c, pane_id=pane.pane_id) for c in cursors)
+            )
+            assert all("async-42" in delta.text for delta in deltas)
+
+            await client.kill_session("acd-s6")
+            assert not await client.session_exists("acd-s6")
+        finally:
+            await client.close()
+
+    asyncio.run(scenario())
+
+
+def test_lifecycle_hooks_post_events(real_tmux):
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            received.append(json.loads(self.rfile.read(length)))
+            self.send_response(202)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        install_hooks(real_tmux, f"http://127.0.0.1:{server.server_port}/tmux/events")
+        supervisor = real_tmux.create_session("acd-s8", "supervisor-shell-test")
+        worker = real_tmux.create_window("acd-s8", "worker-shell-test")
+
+        real_tmux.send_keys("", "", "exit", pane_id=worker.pane_id)
+        socket = real_tmux.socket_name
+        expected = [
+            {"event": "pane-exited", "pane_id": worker.pane_id, "window_id": None,
+             "session_name": None, "socket_name": socket},
+            {"event": "window-unlinked", "pane_id": None, "window_id": worker.window_id,
+             "session_name": "acd-s8", "socket_name": socket},
+        ]
+        # Each hook posts from its own background process, so order is not fixed.
+        assert _wait_for(lambda: all(event in received for event in expected), timeout=20.0)
+
+        real_tmux._run("resize-window", "-t", supervisor.window_id, "-y", "30")
+        assert _wait_for(
+            lambda: any(
+                event["event"] == "window-resized" and event["window_id"] == supervisor.window_id
+                for event in received
+            ),
+            timeout=20.0,
+        )
+
+        real_tmux.kill_session("acd-s8")
+        assert _wait_for(
+            lambda: any(event["event"] == "session-closed" for event in received), timeout=20.0
+        )
+
+        remove_hooks(real_tmux)
+        assert not any("[42]" in line for line in real_tmux._run("show-hooks", "-g"))
+    finally:
+        server.shutdown()
+
+
+def test_window_pool_claims_warm_window_and_refills(real_tmux, tmp_path):
+    pool = WindowPool(real_tmux, size=2, session_name="acd-pool-test")
+    try:
+        pool.prime(str(tmp_path))
+        assert _wait_for(lambda: pool.available(str(tmp_path)) == 2)
+        assert pool.claim("acd-s9", "worker-x", working_directory="/elsewhere") is None
+
+        real_tmux.create_session("acd-s9", "supervisor-shell-test")
+        log_path = tmp_path / "worker.log"
+        pane = pool.claim(
+            "acd-s9",
+            "worker-shell-test",
+            working_directory=str(tmp_path),
+            environment={"CONDUCTOR_TERMINAL_ID": "warm123"},
+            pipe_command=f"cat >> {log_path}",
+        )
+        assert pane is not None and pool.hits == 1 and pool.misses == 1
+
+        names = real_tmux._run("list-windows", "-t", "=acd-s9", "-F", "#{window_name}")
+        assert names == ["supervisor-shell-test", "worker-shell-test"]
+        real_tmux.send_keys(
+            "", "", "echo id=$CONDUCTOR_TERMINAL_ID dir=$(pwd)", pane_id=pane.pane_id
+        )
+        assert _wait_for(
+            lambda: log_path.exists() and f"id=warm123 dir={tmp_path}" in log_path.read_text()
+        )
+        assert _wait_for(lambda: pool.available(str(tmp_path)) == 2)
+    finally:
+        pool.close()
+    assert not real_tmux.session_exists("acd-pool-test")
+
+
+class IdleShellProvider(BaseProvider):
+    """Pretends the pane's shell is a CLI; profiles named ``flagged`` need a fresh one."""
+
+    def build_startup_command(self):
+        return None
+
+    @classmethod
+    def supports_warm_start(cls, agent_profile):
+        return agent_profile != "flagged"
+
+    def start_idle(self):
+        self.tmux.send_keys("", "", "echo booted-$((40+2))", pane_id=self.pane_id)
+        assert _wait_for(
+            lambda: "booted-42" in self.tmux.capture_pane("", "", pane_id=self.pane_id)
+        )
+
+    def apply_persona(self):
+        self.tmux.send_keys("", "", f"echo persona={self.agent_profile}", pane_id=self.pane_id)
+
+
+def test_provider_pool_hands_out_started_clis(real_tmux, tmp_path, monkeypatch):
+    monkeypatch.setitem(ProviderManager._registry, "idle", IdleShellProvider)
+    manager = ProviderManager(real_tmux, pool_size=1)
+    try:
+        manager.prime_warm("idle", str(tmp_path))
+        assert _wait_for(lambda: manager.pool.available("idle", str(tmp_path)) == 1)
+        real_tmux.create_session("acd-s7", "supervisor-shell-test")
+
+        assert manager.claim_warm("idle", "flagged", "acd-s7", "w", str(tmp_path)) is None
+        assert manager.claim_warm("idle", "dev", "acd-s7", "w", "/elsewhere") is None
+        warm = manager.claim_warm(
+            "idle",
+            "dev",
+            "acd-s7",
+            "worker-shell-test",
+            str(tmp_path),
+            pipe_command=lambda terminal_id: f"cat >> {tmp_path / terminal_id}.log",
+        )
+        assert warm is not None
+        names = real_tmux._run("list-windows", "-t", "=acd-s7", "-F", "#{window_name}")
+        assert names == ["supervisor-shell-test", "worker-shell-test"]
+
+        manager.prepare_provider(
+            "idle", warm.terminal_id, "acd-s7", "worker-shell-test", "dev",
+            warm.pane.pane_id, warm=True,
+        )
+        manager.initialize_provider(warm.terminal_id)
+        real_tmux.send_keys("", "", "echo id=$CONDUCTOR_TERMINAL_ID", pane_id=warm.pane.pane_id)
+        log_path = tmp_path / f"{warm.terminal_id}.log"
+        assert _wait_for(
+            lambda: log_path.exists()
+            and f"id={warm.terminal_id}" in log_path.read_text()
+            and "persona=dev" in log_path.read_text()
+        )
+        stats = manager.pool.stats()["idle"]
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+        # The claim triggers a refill in the background.
+        assert _wait_for(lambda: manager.pool.available("idle", str(tmp_path)) == 1)
+    finally:
+        manager.close()
+    assert not real_tmux.session_exists("_conductor-providers")
+
+
+def test_tracked_screens_follow_the_pane_height(real_tmux):
+    pane = real_tmux.create_session("acd-s10", "worker-shell-test")
+    real_tmux._run("resize-window", "-t", pane.window_id, "-y", "30")
+    tracker = StatusTracker()
+    manager = ProviderManager(real_tmux, status_tracker=tracker)
+    manager.prepare_provider("codex", "t10", "acd-s10", "worker-shell-test", None, pane.pane_id)
+    assert tracker._terminals["t10"].screen.height == 30
+
+    real_tmux._run("resize-window", "-t", pane.window_id, "-y", "40")
+    manager.resize_screen("t10")
+    assert tracker._terminals["t10"].screen.height == 40
+
+
+def test_synthetic_provider_drives_the_claude_code_paths(real_tmux):
+    constants.AGENT_CONTEXT_DIR.mkdir(parents=True, exist_ok=True)
+    (constants.AGENT_CONTEXT_DIR / "load.md").write_text(
+        "---\nname: load\ndescription: Load test\nvariables:\n"
+        "  synthetic_args: --latency 0.1 --prompt-every 2\n---\nYou answer quickly.\n"
+    )
+    pane = real_tmux.create_session("acd-synth", "worker-load")
+    manager = ProviderManager(real_tmux)
+    provider = manager.create_provider(
+        "synthetic", "synth001", "acd-synth", "worker-load", "load", pane.pane_id
+    )
+    assert provider.get_status() == TerminalStatus.READY
+
+    provider.send_input("first task")
+    assert _wait_for(lambda: provider.get_status() == TerminalStatus.COMPLETED)
+    history = real_tmux.capture_pane("", "", pane_id=pane.pane_id)
+    assert provider.extract_last_message_from_history(history).startswith("Done: first task")
+
+    provider.send_input("second task")
+    assert _wait_for(lambda: provider.detect_interactive_prompt() is not None)
+    real_tmux.send_keys("", "", "1", pane_id=pane.pane_id)
+    assert _wait_for(lambda: provider.get_status() == TerminalStatus.COMPLETED)
+    history = real_tmux.capture_pane("", "", pane_id=pane.pane_id)
+    last = provider.extract_last_message_from_history(history)
+    assert last.startswith("Done: second task (choice 1)")
+    assert "❯ 1. Yes" not in real_tmux.capture_pane("", "", start=0, pane_id=pane.pane_id)
+
+    manager.cleanup_provider("synth001")
+    assert _wait_for(
+        lambda: real_tmux.capture_pane("", "", pane_id=pane.pane_id).rstrip().endswith(("$", "#"))
+    )
+
+
+def test_large_payloads_are_pasted_in_chunks(tmux_socket, tmp_path):
+    client = TmuxClient(socket_name=tmux_socket, paste_threshold=256, paste_chunk_size=4096)
+    try:
+        pane = client.create_session("acd-s10", "worker-shell-test")
+        out_path = tmp_path / "pasted.txt"
+        client.send_keys("", "", f"cat > {out_path}", pane_id=pane.pane_id)
+
+        payload = "\n".join(f"line {index:04d} " + "x" * 80 for index in range(200))
+        batches = []
+        original = client.run_batch
+        client.run_batch = lambda commands: batches.append(commands) or original(commands)
+        client.send_keys("", "", payload, pane_id=pane.pane_id)
+        client.run_batch = original
+        client.send_keys("", "", "C-d", pane_id=pane.pane_id, enter=False)
+
+        assert _wait_for(
+            lambda: out_path.exists() and out_path.read_text() == payload + "\n", timeout=10.0
+        )
+        pastes = [batch for batch in batches if batch[0][0] == "load-buffer"]
+        assert len(pastes) == -(-len(payload) // 4096)
+        assert all("-p" in batch[1] for batch in pastes)
+    finally:
+        client.close()
+
+
+def test_sharded_sessions_live_on_their_own_server(tmux_socket):
+    sockets = [tmux_socket, _boot_server()]
+    shards = TmuxShards(clients={name: TmuxClient(socket_name=name) for name in sockets})
+    providers = StubProviderManager(shards.client(tmux_socket))
+    service = TerminalService(providers=providers, shards=shards)
+    try:
+        first, second = (
+            service.create_terminal("claude_code", "supervisor", "conductor") for _ in range(2)
+        )
+        assert [first.tmux_socket, second.tmux_socket] == sockets
+        for terminal, other in ((first, second), (second, first)):
+            tmux = shards.client(terminal.tmux_socket)
+            assert tmux.session_exists(terminal.session_name)
+            assert not tmux.session_exists(other.session_name)
+
+        shards.client(second.tmux_socket).send_keys(
+            "", "", "echo shard-$((20+1))", pane_id=second.tmux_pane_id
+        )
+        assert _wait_for(lambda: "shard-21" in service.capture_output(second.id))
+
+        service.delete_terminal(second.id)
+        assert not shards.client(sockets[1]).session_exists(second.session_name)
+        assert shards.client(sockets[0]).session_exists(first.session_name)
+    finally:
+        shards.close()
+        _kill_server(sockets[1])